@@ -5,7 +5,7 @@ JWT token generation/validation and password hashing utilities.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import logging
@@ -53,6 +53,20 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def user_claims(user_dict: Dict) -> dict:
+    """
+    Build token claims from a user row
+
+    Only identifiers are embedded. Profile fields and active status are read
+    from the DB on each authentication, so they are never stale and no
+    personal data is exposed in the (readable) token payload.
+    """
+    return {
+        "sub": user_dict["username"],
+        "uid": user_dict["id"],
+    }
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and validate JWT token
@@ -71,22 +85,21 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
-def validate_token(token: str) -> Optional[str]:
+def validate_token(token: str) -> Optional[dict]:
     """
-    Validate token and return username if valid
+    Validate token and return its claims if valid
 
     Args:
         token: JWT token string
 
     Returns:
-        Username from token or None if invalid
+        Decoded claims (always containing "sub") or None if invalid
     """
     payload = decode_access_token(token)
     if payload is None:
         return None
 
-    username: str = payload.get("sub")
-    if username is None:
+    if payload.get("sub") is None:
         return None
 
-    return username
+    return payload
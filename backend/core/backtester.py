@@ -581,9 +581,7 @@ class Backtester:
             return results
 
         except Exception as e:
-            logger.error(f"❌ Backtesting failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Backtesting failed: {e}")
             self.status = "failed"
             return None
 
@@ -619,10 +617,13 @@ class Backtester:
         self.bot._retrain_model()
 
     def get_status(self) -> Dict:
-        """백테스팅 상태 조회"""
+        """백테스팅 상태 조회 (실행 중에는 중간 집계 포함)"""
         return {
             'is_running': self.is_running,
             'status': self.status,
             'progress': self.progress,
+            'current_ticker': self.current_ticker,
+            'trades_done': len(self.trades),
+            'current_return': self.capital / self.initial_capital - 1,
             'results': self.results
         }
@@ -15,7 +15,10 @@ import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from .data_manager import FeatureEngineer, ModelLearner, TradeMemory, sanitize_dict_for_json
@@ -48,6 +51,14 @@ class CoinSelector:
         # 🔄 순차 검사를 위한 인덱스 (Pagination)
         self.scan_index = 0
         self.batch_size = 50  # 한 번에 검사할 코인 수
+
+        # ⚡ 배치 분석 병렬화 (HTTP 대기 중첩)
+        # 코인당 REST 2회(OHLCV + 현재가) → 요청마다 간격을 두어 전체 약 6.7 req/s 이하로 유지
+        # (업비트 시세 조회 제한 10 req/s 아래)
+        self.scan_workers = int(os.getenv("COIN_SCAN_WORKERS", 8))
+        self.request_interval = 0.15
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
         
         logger.info("✅ CoinSelector initialized")
         logger.info(f"📊 Total coins available: {len(self.candidate_coins)}")
@@ -115,8 +126,34 @@ class CoinSelector:
                 - score: 종합 점수
                 - recommendation: 매수 추천 여부
         """
+        collected = self._collect_features(ticker)
+        if collected is None:
+            return None
+        features, current_price = collected
+
+        try:
+            # 3. AI 예측
+            prediction, confidence = self.learner.predict_fast(FeatureEngineer.features_to_array(features))
+            return self._build_analysis(ticker, features, current_price, prediction, confidence)
+        except Exception as e:
+            logger.error(f"❌ Failed to analyze {ticker}: {e}")
+            return None
+
+    def _collect_features(self, ticker: str,
+                          throttle: bool = False) -> Optional[Tuple[Dict, Optional[float]]]:
+        """
+        분석 1~2단계 + 현재가 조회 (네트워크 I/O 구간, 스레드 풀에서 실행)
+
+        Args:
+            throttle: True면 REST 요청마다 _throttle() (배치 스캔용)
+
+        Returns:
+            (features, current_price) - 데이터 부족/저가 코인/오류 시 None
+        """
         try:
             # 1. OHLCV 데이터 수집 (최근 1시간, 1분봉)
+            if throttle:
+                self._throttle()
             df = self.exchange.get_ohlcv(ticker)
             
             if df is None or len(df) < 30:
@@ -128,17 +165,9 @@ class CoinSelector:
             if not features:
                 return None
             
-            # 3. AI 예측
-            features_df = FeatureEngineer.features_to_dataframe(features)
-            prediction, confidence = self.learner.predict(features_df)
-            
-            # 4. 종합 점수 계산
-            score = self._calculate_score(features, confidence, prediction, ticker)
-            
-            # 5. 매수 추천 여부
-            recommendation = self._should_recommend(features, confidence, prediction, score)
-            
-            # 6. 현재 가격
+            # 현재 가격
+            if throttle:
+                self._throttle()
             current_price = self.exchange.get_current_price(ticker)
             
             # 🛡️ 최소 가격 필터 (저가 코인 제외)
@@ -146,25 +175,49 @@ class CoinSelector:
             if current_price and current_price < MIN_PRICE:
                 logger.debug(f"⚠️ {ticker}: Price too low ({current_price} KRW < {MIN_PRICE}), skipping")
                 return None
-            
-            result = {
-                "ticker": ticker,
-                "confidence": confidence,
-                "prediction": prediction,
-                "features": features,
-                "score": score,
-                "recommendation": recommendation,
-                "current_price": current_price,
-                "timestamp": datetime.now()
-            }
-
-            # JSON 직렬화를 위해 nan/inf 값 정제
-            return sanitize_dict_for_json(result)
+
+            return features, current_price
 
         except Exception as e:
             logger.error(f"❌ Failed to analyze {ticker}: {e}")
             return None
+
+    def _build_analysis(self, ticker: str, features: Dict, current_price: Optional[float],
+                        prediction: int, confidence: float) -> Dict:
+        """분석 4~5단계: 예측 결과로 종합 점수/추천 여부 계산 후 결과 딕셔너리 생성"""
+        # 4. 종합 점수 계산
+        score = self._calculate_score(features, confidence, prediction, ticker)
+        
+        # 5. 매수 추천 여부
+        recommendation = self._should_recommend(features, confidence, prediction, score)
+
+        result = {
+            "ticker": ticker,
+            "confidence": confidence,
+            "prediction": prediction,
+            "features": features,
+            "score": score,
+            "recommendation": recommendation,
+            "current_price": current_price,
+            "timestamp": datetime.now()
+        }
+
+        # JSON 직렬화를 위해 nan/inf 값 정제
+        return sanitize_dict_for_json(result)
     
+    def _throttle(self):
+        """💤 API Rate Limit 방지: 스레드 전체에서 REST 요청 시작 간격을 request_interval 이상으로 유지"""
+        with self._throttle_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.request_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _collect_throttled(self, ticker: str) -> Optional[Tuple[Dict, Optional[float]]]:
+        """배치 스캔 작업 단위 (스레드 풀에서 실행, 요청마다 간격 유지)"""
+        return self._collect_features(ticker, throttle=True)
+
     def _calculate_score(self, features: Dict, confidence: float, 
                         prediction: int, ticker: str) -> float:
         """
@@ -322,34 +375,44 @@ class CoinSelector:
         analyzed_count = 0
         failed_count = 0
 
-        for idx, ticker in enumerate(target_tickers, 1):
-            try:
-                logger.debug(f"   [{idx}/{len(target_tickers)}] Analyzing {ticker}...")
-                analysis = self.analyze_coin(ticker)
-
-                if analysis:
-                    analyses.append(analysis)
-                    analyzed_count += 1
-                    logger.debug(
-                        f"   ✅ {ticker}: Score={analysis['score']:.1f}, "
-                        f"Conf={analysis['confidence']:.1%}, "
-                        f"RSI={analysis['features']['rsi']:.1f}"
-                    )
-                else:
-                    failed_count += 1
-                    logger.debug(f"   ⚠️ {ticker}: No valid data")
+        started_at = time.monotonic()
+        # 스레드 풀: OHLCV/현재가 조회 + 특징 추출
+        with ThreadPoolExecutor(max_workers=self.scan_workers, thread_name_prefix="coin-scan") as executor:
+            collected = list(executor.map(self._collect_throttled, target_tickers))
+
+        # 메인 스레드: 유효한 후보 전체를 (N, 16) 행렬로 쌓아 predict_proba 1회
+        valid = [(t, c) for t, c in zip(target_tickers, collected) if c is not None]
+        X = np.empty((len(valid), len(FeatureEngineer.FEATURE_ORDER)), dtype=np.float32)
+        for i, (_, (features, _)) in enumerate(valid):
+            X[i] = FeatureEngineer.features_to_array(features)[0]
+        predictions = self.learner.predict_batch(X) if valid else []
 
+        results = dict.fromkeys(target_tickers)
+        for (ticker, (features, current_price)), (prediction, confidence) in zip(valid, predictions):
+            try:
+                results[ticker] = self._build_analysis(ticker, features, current_price, prediction, confidence)
             except Exception as e:
-                failed_count += 1
                 logger.debug(f"   ❌ {ticker}: Error - {e}")
 
-            time.sleep(0.15) # 💤 API Rate Limit 방지 (0.15초 대기)
+        for ticker, analysis in results.items():
+            if analysis:
+                analyses.append(analysis)
+                analyzed_count += 1
+                logger.debug(
+                    f"   ✅ {ticker}: Score={analysis['score']:.1f}, "
+                    f"Conf={analysis['confidence']:.1%}, "
+                    f"RSI={analysis['features']['rsi']:.1f}"
+                )
+            else:
+                failed_count += 1
+                logger.debug(f"   ⚠️ {ticker}: No valid data")
 
         logger.info(
             f"📊 Batch Analysis Complete: "
             f"✅ Success={analyzed_count}, "
             f"⚠️ Failed={failed_count}, "
-            f"Total={len(target_tickers)}"
+            f"Total={len(target_tickers)} "
+            f"({time.monotonic() - started_at:.1f}s)"
         )
         
         # 🔄 다음 배치를 위해 인덱스 업데이트
@@ -11,14 +11,18 @@ Core Concepts:
 """
 
 import sqlite3
+import queue
 import pandas as pd
 import numpy as np
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 import joblib
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import logging
 import os
+import threading
 
 # Machine Learning
 import xgboost as xgb
@@ -30,11 +34,9 @@ from ta.trend import SMAIndicator, EMAIndicator, MACD
 from ta.momentum import RSIIndicator, StochasticOscillator
 from ta.volatility import BollingerBands, AverageTrueRange
 
-# Setup Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from .indicators import _features_njit
+
+# 로깅 핸들러 설정은 진입점(main.py, 실행 스크립트)에서 담당
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +51,12 @@ def get_project_root() -> Path:
 
 PROJECT_ROOT = get_project_root()
 
+# 조회 전용 연결 풀 크기 (API 요청/학습 데이터 조회가 공유)
+READ_POOL_SIZE = 4
+
+# 학습에 필요한 특징 중 누락된 개수 (trades.missing_mask 생성 컬럼 식)
+MISSING_MASK_EXPR = "(rsi_change IS NULL) + (volume_trend IS NULL) + (profit_class IS NULL)"
+
 
 class TradeMemory:
     """
@@ -66,11 +74,23 @@ class TradeMemory:
         # 디렉토리 생성
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
+
+        # 📝 백그라운드 DB Writer (매수 경로에서 SQLite 쓰기 대기 제거)
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # 🔌 조회 전용 연결 풀 (요청마다 connect/close 및 페이지 캐시 워밍업 반복 방지)
+        self._read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._read_pool_size = 0
+        self._read_pool_lock = threading.Lock()
         logger.info(f"✅ TradeMemory initialized at {db_path}")
     
     def _init_database(self):
         """데이터베이스 테이블 초기화"""
         with sqlite3.connect(self.db_path) as conn:
+            # WAL 모드: 백그라운드 쓰기 중에도 조회(API/학습)가 막히지 않음 (DB 파일에 영구 설정)
+            conn.execute("PRAGMA journal_mode=WAL")
+
             # 매매 기록 테이블
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS trades (
@@ -114,6 +134,11 @@ class TradeMemory:
                     status TEXT DEFAULT 'closed'  -- open, closed
                 )
             """)
+
+            # 거래 내역 페이지 조회용 (최신순 정렬 + 키셋 페이지네이션)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_ts_id ON trades(timestamp DESC, id DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_status_ts_id ON trades(status, timestamp DESC, id DESC)")
+            self._migrate_missing_mask(conn)
             
             # 모델 성능 추적 테이블
             conn.execute("""
@@ -128,7 +153,79 @@ class TradeMemory:
                 )
             """)
             conn.commit()
+
+            # 플래너 통계: 처음이면 ANALYZE, 이후에는 필요한 경우에만 갱신 (PRAGMA optimize)
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            conn.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+            conn.commit()
     
+    def _migrate_missing_mask(self, conn: sqlite3.Connection):
+        """
+        특징 누락 개수 생성 컬럼(missing_mask) + 부분 인덱스 추가 (1회성 마이그레이션)
+
+        clean_db.py 정리 대상(특징 누락 행)을 `missing_mask > 0` 인덱스 탐색으로 찾습니다.
+        누락 판정 특징이 늘어나면 MISSING_MASK_EXPR만 확장하면 됩니다.
+        (ALTER TABLE로는 STORED 생성 컬럼을 추가할 수 없으므로 VIRTUAL + 인덱스에 값 저장)
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(trades)")}
+        try:
+            if "missing_mask" not in columns:
+                conn.execute(
+                    f"ALTER TABLE trades ADD COLUMN missing_mask INTEGER "
+                    f"GENERATED ALWAYS AS ({MISSING_MASK_EXPR}) VIRTUAL"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_trades_missing ON trades(missing_mask) WHERE missing_mask > 0"
+            )
+            # 이전 버전의 OR 조건 부분 인덱스는 대체됨
+            conn.execute("DROP INDEX IF EXISTS idx_trades_nullfeat")
+        except sqlite3.OperationalError as e:
+            # 생성 컬럼 미지원 SQLite (< 3.31) → clean_db.py는 OR 조건으로 동작
+            logger.warning(f"⚠️ missing_mask migration skipped: {e}")
+
+    def _new_read_connection(self) -> sqlite3.Connection:
+        """풀용 조회 연결 생성 (PRAGMA는 생성 시 한 번만 설정)"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # 열 이름으로 접근 (값은 파이썬 기본 타입 그대로)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # 연결당 최대 64MB 페이지 캐시
+        return conn
+
+    @contextmanager
+    def read_connection(self):
+        """
+        조회 전용 연결 대여 (with 블록 종료 시 풀에 반납)
+
+        풀이 비어 있으면 READ_POOL_SIZE개까지 새로 만들고, 그 이상은 반납을 기다립니다.
+        한 연결은 동시에 한 스레드만 사용하므로 check_same_thread=False로 공유해도 안전합니다.
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._read_pool_lock:
+                can_create = self._read_pool_size < READ_POOL_SIZE
+                if can_create:
+                    self._read_pool_size += 1
+            if not can_create:
+                conn = self._read_pool.get()
+            else:
+                try:
+                    conn = self._new_read_connection()
+                except sqlite3.Error:
+                    with self._read_pool_lock:
+                        self._read_pool_size -= 1
+                    raise
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._read_pool.put(conn)
+
     def save_trade_entry(self, ticker: str, entry_price: float, 
                         features: Dict, model_confidence: float) -> int:
         """
@@ -179,13 +276,75 @@ class TradeMemory:
             trade_id = cursor.lastrowid
             logger.info(f"💾 Trade Entry Saved: ID={trade_id}, Price={entry_price:,.0f}")
             return trade_id
+
+    def save_trade_entry_async(self, ticker: str, entry_price: float,
+                               features: Dict, model_confidence: float) -> "Future[int]":
+        """
+        매수 진입 기록을 백그라운드 Writer에 맡기고 즉시 반환
+
+        ID는 미리 예약하지 않고 INSERT의 실제 lastrowid로 Future를 완료합니다.
+        (레거시 봇 등 다른 writer가 AUTOINCREMENT를 진행시켜도 ID가 어긋나지 않음)
+
+        Returns:
+            trade_id Future (쓰기 실패 시 예외로 완료)
+        """
+        future: "Future[int]" = Future()
+        self._enqueue_write(
+            self._save_trade_entry_into, future, ticker, entry_price, dict(features), model_confidence
+        )
+        return future
+
+    def _save_trade_entry_into(self, future: "Future[int]", *args):
+        """save_trade_entry 실행 후 결과(trade_id)나 예외로 Future 완료 (Writer 스레드)"""
+        try:
+            future.set_result(self.save_trade_entry(*args))
+        except Exception as e:
+            future.set_exception(e)
+            raise
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 백그라운드 쓰기가 끝날 때까지 대기
+
+        Returns:
+            timeout 내에 모두 기록되었으면 True
+        """
+        if timeout is None:
+            self._write_queue.join()
+            return True
+        # join()과 같은 조건 변수를 사용하여 폴링 없이 대기
+        q = self._write_queue
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: not q.unfinished_tasks, timeout=timeout)
+
+    def _enqueue_write(self, func, *args, **kwargs):
+        """쓰기 작업을 큐에 넣고 Writer 스레드가 없으면 시작"""
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="trade-memory-writer", daemon=True
+            )
+            self._writer_thread.start()
+        self._write_queue.put((func, args, kwargs))
+
+    def _writer_loop(self):
+        """백그라운드 Writer: 큐의 쓰기 작업을 순서대로 실행"""
+        while True:
+            func, args, kwargs = self._write_queue.get()
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"❌ Background DB write failed ({func.__name__}): {e}")
+            finally:
+                self._write_queue.task_done()
     
     def update_trade_exit(self, trade_id: int, exit_price: float):
         """
         매도 완료 시점 데이터 업데이트 및 결과 기록
         
         이 함수 호출 후 모델 재학습이 트리거될 수 있습니다.
+        (백그라운드로 대기 중인 진입 기록이 먼저 저장되도록 flush 후 실행)
         """
+        self.flush()
         try:
             with sqlite3.connect(self.db_path) as conn:
                 # 진입 가격 조회
@@ -314,8 +473,8 @@ class TradeMemory:
         return X, y, sample_weights
     
     def get_statistics(self) -> Dict:
-        """현재 매매 통계 반환"""
-        with sqlite3.connect(self.db_path) as conn:
+        """현재 매매 통계 반환 (대시보드 폴링 경로 → 풀의 조회 전용 연결 사용)"""
+        with self.read_connection() as conn:
             stats = conn.execute("""
                 SELECT
                     COUNT(*) as total_trades,
@@ -389,6 +548,7 @@ class ModelLearner:
         self.pca: Optional[object] = None     # 🆕 PCA 객체 저장
         self.use_pca = True                   # PCA 사용 여부
         self.pca_components = 0.95            # 95% 분산 보존
+        self._fast_params = None              # predict_fast용 (model, scaler, mean, scale) 캐시
         self.metrics = {
             "accuracy": 0.0,
             "last_trained": None,
@@ -418,6 +578,9 @@ class ModelLearner:
         # 0으로 대체하면 정보 왜곡 가능, 중앙값이 더 안정적
         X = X.fillna(X.median())
 
+        # 🔢 float32로 학습 (XGBoost 내부 정밀도와 동일, 예측 입력도 float32)
+        X = X.astype(np.float32)
+
         # 🔥 Outlier Detection (이상값 제거)
         original_samples = len(X)
         if original_samples >= 30:  # 충분한 데이터가 있을 때만 적용
@@ -606,12 +769,7 @@ class ModelLearner:
             return 0, 0.0
         
         # 🆕 16개 특징 확인 및 누락된 특징 채우기
-        expected_features = [
-            'rsi', 'macd', 'macd_signal', 'bb_position', 'volume_ratio',
-            'price_change_5m', 'price_change_15m', 'ema_9', 'ema_21', 'atr',
-            'hour_of_day', 'day_of_week', 'rsi_change', 'volume_trend',
-            'rsi_prev_5m', 'bb_position_prev_5m'
-        ]
+        expected_features = list(FeatureEngineer.FEATURE_ORDER)
         
         # 누락된 특징 기본값 채우기
         for feat in expected_features:
@@ -631,7 +789,7 @@ class ModelLearner:
         features = features[expected_features]
         
         # 🛡️ NaN 처리 (PCA 오류 방지)
-        features = features.fillna(0)
+        features = features.fillna(0).astype(np.float32)
         
         # 🔧 Feature Normalization 적용 (학습 시와 동일한 Scaler 사용)
         if self.scaler is not None:
@@ -655,6 +813,70 @@ class ModelLearner:
         confidence = probabilities[2] if len(probabilities) == 3 else probabilities[1]
         
         return int(prediction), float(confidence)
+
+    def predict_fast(self, arr: np.ndarray) -> Tuple[int, float]:
+        """
+        예측 수행 (DataFrame 없이 1행 배열 입력, 틱마다 호출되는 진입 체크용)
+
+        Args:
+            arr: FeatureEngineer.features_to_array() 결과 (1, 16) float32
+
+        Returns:
+            predict()와 동일한 (prediction, confidence)
+        """
+        if self.model is None:
+            logger.warning("⚠️ Model not trained yet!")
+            return 0, 0.0
+        return self.predict_batch(arr)[0]
+
+    def predict_batch(self, X: np.ndarray) -> List[Tuple[int, float]]:
+        """
+        여러 행을 predict_proba 1회로 예측 (코인 추천 배치 스캔용)
+
+        Args:
+            X: (N, 16) float32 특징 행렬 (FEATURE_ORDER 순서)
+
+        Returns:
+            행별 (prediction, confidence) 리스트 (모델이 없으면 모두 (0, 0.0))
+        """
+        model = self.model
+        if model is None:
+            return [(0, 0.0)] * len(X)
+
+        # 🔧 Scaler는 (x - mean) / scale 만 적용 (모델/스케일러가 바뀔 때만 파라미터 재추출)
+        params = self._fast_params
+        if params is None or params[0] is not model or params[1] is not self.scaler:
+            scaler = self.scaler
+            if scaler is not None:
+                mean = getattr(scaler, 'mean_', None)
+                scale = getattr(scaler, 'scale_', None)
+                # 입력과 같은 float32로 맞춰 연산 중 float64 승격 방지
+                mean = mean.astype(np.float32) if mean is not None else None
+                scale = scale.astype(np.float32) if scale is not None else None
+            else:
+                mean = scale = None
+            params = (model, scaler, mean, scale)
+            self._fast_params = params
+        _, _, mean, scale = params
+
+        x = X
+        if mean is not None:
+            x = x - mean
+        if scale is not None:
+            x = x / scale
+
+        # 🆕 PCA Dimensionality Reduction 적용
+        if self.pca is not None:
+            x = self.pca.transform(x)
+
+        # 예측 (predict_proba 1회 → argmax가 predict와 동일)
+        probabilities = model.predict_proba(x)
+        predictions = np.argmax(probabilities, axis=1)
+
+        # 🆕 Class 2 (좋은 수익) 확률을 confidence로 사용
+        confidences = probabilities[:, 2] if probabilities.shape[1] == 3 else probabilities[:, 1]
+
+        return [(int(p), float(c)) for p, c in zip(predictions, confidences)]
     
     def save_model(self):
         """모델을 디스크에 저장"""
@@ -728,6 +950,17 @@ class FeatureEngineer:
     과거 데이터를 받아 Machine Learning에 사용할 특징(Features)을 생성합니다.
     """
 
+    # 모델 입력 특징 순서 (16개)
+    FEATURE_ORDER: Tuple[str, ...] = (
+        'rsi', 'macd', 'macd_signal', 'bb_position', 'volume_ratio',
+        'price_change_5m', 'price_change_15m', 'ema_9', 'ema_21', 'atr',
+        'hour_of_day', 'day_of_week', 'rsi_change', 'volume_trend',
+        'rsi_prev_5m', 'bb_position_prev_5m'
+    )
+
+    # features_to_array 출력 버퍼 (스레드별 1개 재사용)
+    _array_buffers = threading.local()
+
     @staticmethod
     def extract_features(df: pd.DataFrame) -> Dict:
         """
@@ -747,31 +980,32 @@ class FeatureEngineer:
             return {}
         
         close = df['close']
-        high = df['high']
-        low = df['low']
         volume = df['volume']
         
+        # 1~7. RSI / MACD / BB / Volume MA / EMA / ATR를 Numba 커널 한 번으로 계산
+        ohlcv = df[['close', 'high', 'low', 'volume']].to_numpy(dtype=np.float64).T
+        (rsi_series, macd_series, macd_signal_series, bb_high, bb_low,
+         volume_ma_series, ema_9_series, ema_21_series, atr_series) = _features_njit(
+            np.ascontiguousarray(ohlcv[0]), np.ascontiguousarray(ohlcv[1]),
+            np.ascontiguousarray(ohlcv[2]), np.ascontiguousarray(ohlcv[3])
+        )
+        
         # 1. RSI (Relative Strength Index)
-        rsi_series = RSIIndicator(close, window=14).rsi()
-        rsi = rsi_series.iloc[-1]
+        rsi = rsi_series[-1]
         
         # 2. MACD
-        macd_indicator = MACD(close)
-        macd = macd_indicator.macd().iloc[-1]
-        macd_signal = macd_indicator.macd_signal().iloc[-1]
+        macd = macd_series[-1]
+        macd_signal = macd_signal_series[-1]
         
         # 3. Bollinger Bands
-        bb = BollingerBands(close, window=20, window_dev=2)
-        bb_high = bb.bollinger_hband()
-        bb_low = bb.bollinger_lband()
         current_price = close.iloc[-1]
         # BB 내 상대 위치 (0: 하단, 0.5: 중간, 1: 상단)
-        bb_h = bb_high.iloc[-1]
-        bb_l = bb_low.iloc[-1]
+        bb_h = bb_high[-1]
+        bb_l = bb_low[-1]
         bb_position = (current_price - bb_l) / (bb_h - bb_l) if bb_h != bb_l else 0.5
         
         # 4. Volume Ratio
-        volume_ma = volume.rolling(window=20).mean().iloc[-1]
+        volume_ma = volume_ma_series[-1]
         volume_ratio = volume.iloc[-1] / volume_ma if volume_ma > 0 else 1.0
         
         # 5. Price Change
@@ -779,11 +1013,11 @@ class FeatureEngineer:
         price_change_15m = (close.iloc[-1] - close.iloc[-15]) / close.iloc[-15] if len(close) >= 15 else 0
         
         # 6. EMA (Exponential Moving Average)
-        ema_9 = EMAIndicator(close, window=9).ema_indicator().iloc[-1]
-        ema_21 = EMAIndicator(close, window=21).ema_indicator().iloc[-1]
+        ema_9 = ema_9_series[-1]
+        ema_21 = ema_21_series[-1]
         
         # 7. ATR (Average True Range) - 변동성 측정
-        atr = AverageTrueRange(high, low, close, window=14).average_true_range().iloc[-1]
+        atr = atr_series[-1]
         
         # ============ 🆕 NEW FEATURES ============
         
@@ -794,7 +1028,7 @@ class FeatureEngineer:
         
         # 9. Momentum Features (모멘텀 특징)
         # RSI 변화량 (5분 전 대비)
-        rsi_prev_5m = rsi_series.iloc[-5] if len(rsi_series) >= 5 else rsi
+        rsi_prev_5m = rsi_series[-5] if len(rsi_series) >= 5 else rsi
         rsi_change = rsi - rsi_prev_5m
         
         # 거래량 추세 (최근 5개 vs 이전 5개)
@@ -808,8 +1042,8 @@ class FeatureEngineer:
         # 10. Sequence Features (시계열 특징)
         # 5분 전 BB 위치
         if len(bb_high) >= 5 and len(bb_low) >= 5:
-            bb_h_5m = bb_high.iloc[-5]
-            bb_l_5m = bb_low.iloc[-5]
+            bb_h_5m = bb_high[-5]
+            bb_l_5m = bb_low[-5]
             price_5m = close.iloc[-5]
             bb_position_prev_5m = (price_5m - bb_l_5m) / (bb_h_5m - bb_l_5m) if bb_h_5m != bb_l_5m else 0.5
         else:
@@ -841,11 +1075,107 @@ class FeatureEngineer:
         # JSON 직렬화를 위해 nan/inf 값 정제
         return sanitize_dict_for_json(features)
     
+    @staticmethod
+    def extract_features_batch(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        OHLCV 전체 구간에 대한 특징을 한 번에 계산 (벡터화 버전)
+
+        각 행 i의 값은 extract_features(df.iloc[:i+1])와 동일합니다.
+        (모든 지표가 과거 데이터만 사용하므로 전체 시계열을 한 번만 계산)
+
+        Args:
+            df: OHLCV 컬럼을 가진 DataFrame (close, high, low, volume)
+
+        Returns:
+            features_df: 타임스탬프별 16개 특징 DataFrame (nan/inf는 0으로 정제)
+        """
+        close = df['close']
+        high = df['high']
+        low = df['low']
+        volume = df['volume']
+
+        # 1. RSI
+        rsi = RSIIndicator(close, window=14).rsi()
+
+        # 2. MACD
+        macd_indicator = MACD(close)
+
+        # 3. Bollinger Bands (BB 내 상대 위치, 밴드 폭이 0이면 0.5)
+        bb = BollingerBands(close, window=20, window_dev=2)
+        bb_high = bb.bollinger_hband()
+        bb_low = bb.bollinger_lband()
+        bb_width = bb_high - bb_low
+        bb_position = ((close - bb_low) / bb_width).where(bb_width != 0, 0.5)
+
+        # 4. Volume Ratio
+        volume_ma = volume.rolling(window=20).mean()
+        volume_ratio = (volume / volume_ma).where(volume_ma > 0, 1.0)
+
+        # 9. 거래량 추세 (최근 5개 vs 이전 5개)
+        recent_vol = volume.rolling(window=5).mean()
+        prev_vol = recent_vol.shift(5)
+        volume_trend = ((recent_vol - prev_vol) / prev_vol).where(prev_vol > 0, 0)
+
+        # 8. Time Features (extract_features와 동일하게 현재 시각 사용)
+        now = datetime.now()
+
+        rsi_prev_5m = rsi.shift(4)
+
+        features = pd.DataFrame({
+            'rsi': rsi,
+            'macd': macd_indicator.macd(),
+            'macd_signal': macd_indicator.macd_signal(),
+            'bb_position': bb_position,
+            'volume_ratio': volume_ratio,
+            'price_change_5m': (close - close.shift(4)) / close.shift(4),
+            'price_change_15m': (close - close.shift(14)) / close.shift(14),
+            'ema_9': EMAIndicator(close, window=9).ema_indicator(),
+            'ema_21': EMAIndicator(close, window=21).ema_indicator(),
+            'atr': AverageTrueRange(high, low, close, window=14).average_true_range(),
+            'hour_of_day': now.hour,
+            'day_of_week': now.weekday(),
+            'rsi_change': rsi - rsi_prev_5m,
+            'volume_trend': volume_trend,
+            'rsi_prev_5m': rsi_prev_5m,
+            'bb_position_prev_5m': bb_position.shift(4),
+        }, index=df.index)
+
+        # JSON 직렬화/학습을 위해 nan/inf 값 정제 (sanitize_float와 동일)
+        return features.replace([np.inf, -np.inf], np.nan).fillna(0.0)
+
     @staticmethod
     def features_to_dataframe(features: Dict) -> pd.DataFrame:
         """특징 딕셔너리를 DataFrame으로 변환 (모델 입력용)"""
         return pd.DataFrame([features])
 
+    @classmethod
+    def features_to_array(cls, features: Dict) -> np.ndarray:
+        """
+        특징 딕셔너리를 FEATURE_ORDER 순서의 (1, 16) float32 배열로 변환 (predict_fast 입력용)
+
+        ⚠️ 반환 배열은 호출 스레드의 재사용 버퍼이므로 다음 호출 전에 사용을 마쳐야 합니다.
+        누락된 특징은 ModelLearner.predict와 같은 기본값, NaN은 0으로 채웁니다.
+        """
+        buf = getattr(cls._array_buffers, 'buf', None)
+        if buf is None:
+            buf = np.empty((1, len(cls.FEATURE_ORDER)), dtype=np.float32)
+            cls._array_buffers.buf = buf
+
+        defaults = {
+            'hour_of_day': 12,  # 정오
+            'day_of_week': 0,   # 월요일
+            'rsi_prev_5m': features.get('rsi', 50),
+            'bb_position_prev_5m': features.get('bb_position', 0.5),
+        }
+        row = buf[0]
+        for i, name in enumerate(cls.FEATURE_ORDER):
+            value = features.get(name)
+            if value is None:
+                value = defaults.get(name, 0)
+            row[i] = value
+        row[np.isnan(row)] = 0.0
+        return buf
+
 
 if __name__ == "__main__":
     # 테스트 코드
@@ -80,6 +80,16 @@ class UserDatabase:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_user_profile(self, username: str) -> Optional[Dict]:
+        """Get user profile by username (without password hash)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("""
+                SELECT id, username, email, full_name, is_active, is_admin, created_at, last_login
+                FROM users WHERE username = ?
+            """, (username,)).fetchone()
+            return dict(row) if row else None
+
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email"""
         with sqlite3.connect(self.db_path) as conn:
@@ -98,13 +108,15 @@ class UserDatabase:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def update_last_login(self, username: str):
-        """Update user's last login timestamp"""
+    def update_last_login(self, username: str) -> str:
+        """Update user's last login timestamp (returns the stored value)"""
+        last_login = datetime.now().isoformat()
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("""
                 UPDATE users SET last_login = ? WHERE username = ?
-            """, (datetime.now().isoformat(), username))
+            """, (last_login, username))
             conn.commit()
+        return last_login
 
     def update_user_password(self, username: str, hashed_password: str):
         """Update user password"""
@@ -0,0 +1,115 @@
+"""
+Entry Decision Logic
+====================
+특징 추출/AI 예측 이후의 순수 매수 판단 로직 (I/O 없음).
+
+TradingBot._check_entry_conditions는 데이터 조회 → _entry_decision 호출 →
+결과에 따른 로그/주문만 담당합니다.
+
+모든 함수가 완전한 타입 힌트를 가지므로 mypyc로 AOT 컴파일할 수 있습니다.
+    cd backend && mypyc core/entry_logic.py
+컴파일된 확장 모듈이 없으면 이 파일이 그대로 import 됩니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+from .indicators import (
+    ENTRY_THRESHOLDS, ENTRY_MEAN_REVERSION, ENTRY_MOMENTUM, ENTRY_TREND_UP, _entry_flags_njit
+)
+
+
+@dataclass(frozen=True)
+class CooldownState:
+    """티커의 재매수 쿨다운 상태 (매도 시 등록)"""
+    active: bool
+    exit_price: float
+    is_profit: bool
+
+
+@dataclass(frozen=True)
+class EntryDecision:
+    """매수 판단 결과"""
+    buy: bool
+    reason: str                       # "Mean Reversion" / "MACD Momentum" / ""
+    trend_up: bool                    # EMA9 > EMA21 (로그용)
+    cooldown_blocked: bool = False    # 쿨다운으로 스킵
+    cooldown_released: bool = False   # 이번 체크에서 쿨다운 해제 조건 충족
+    rebuy_price_threshold: float = 0.0
+
+
+def _cooldown_check(cooldown: CooldownState, current_price: float,
+                    rebuy_threshold: float) -> EntryDecision:
+    """
+    익절/손절에 따른 재매수 쿨다운 판단
+
+    - 익절 후: 매도가 대비 rebuy_threshold 이상 하락해야 재매수
+    - 손절 후: 매도가 대비 rebuy_threshold 이상 회복해야 재매수
+    """
+    if cooldown.is_profit:
+        threshold = cooldown.exit_price * (1 - rebuy_threshold)
+        blocked = current_price >= threshold
+    else:
+        threshold = cooldown.exit_price * (1 + rebuy_threshold)
+        blocked = current_price <= threshold
+    return EntryDecision(
+        buy=False, reason="", trend_up=False,
+        cooldown_blocked=blocked, cooldown_released=not blocked,
+        rebuy_price_threshold=threshold,
+    )
+
+
+def _entry_decision(features: Dict[str, float], confidence: float,
+                    cooldown: CooldownState, rebuy_threshold: float,
+                    current_price: float) -> EntryDecision:
+    """
+    매수 여부 판단 (2가지 전략 OR)
+
+    전략 1 Mean Reversion: (RSI < 35 OR BB < 0.25) + 급락 아님(-5% 이상) + 확신도 > 50%
+    전략 2 Momentum: MACD > Signal + 상승 추세(EMA9 > EMA21) + 확신도 > 50%
+
+    Args:
+        features: FeatureEngineer.extract_features 결과
+        confidence: 모델 확신도
+        cooldown: 재매수 쿨다운 상태
+        rebuy_threshold: 재매수 가격 변동 기준
+        current_price: 현재가 (0이면 쿨다운 중 판단 불가 → 스킵)
+    """
+    released = False
+    rebuy_price_threshold = 0.0
+    if cooldown.active:
+        if not current_price:
+            return EntryDecision(buy=False, reason="", trend_up=False, cooldown_blocked=True)
+        check = _cooldown_check(cooldown, current_price, rebuy_threshold)
+        if check.cooldown_blocked:
+            return check
+        released = True
+        rebuy_price_threshold = check.rebuy_price_threshold
+
+    feats = np.array([
+        features['rsi'],
+        features['bb_position'],
+        features.get('price_change_15m', 0.0),
+        features.get('ema_9', 0.0),
+        features.get('ema_21', 0.0),
+        features.get('macd', 0.0),
+        features.get('macd_signal', 0.0),
+    ], dtype=np.float64)
+    flags = int(_entry_flags_njit(feats, float(confidence), ENTRY_THRESHOLDS))
+
+    if flags & ENTRY_MEAN_REVERSION:
+        reason = "Mean Reversion"
+    elif flags & ENTRY_MOMENTUM:
+        reason = "MACD Momentum"
+    else:
+        reason = ""
+
+    return EntryDecision(
+        buy=reason != "",
+        reason=reason,
+        trend_up=bool(flags & ENTRY_TREND_UP),
+        cooldown_released=released,
+        rebuy_price_threshold=rebuy_price_threshold,
+    )
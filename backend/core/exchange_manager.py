@@ -1,120 +1,422 @@
 
 import pybithumb
 import pyupbit
+import asyncio
+import json
 import logging
-from typing import Optional, Dict, Tuple, Any
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Tuple, Any, Iterable, List, Callable
+
+import msgspec
 
 logger = logging.getLogger(__name__)
 
-class ExchangeManager:
+UPBIT_WS_URL = "wss://api.upbit.com/websocket/v1"
+SUBSCRIBE_DEBOUNCE = 1.0  # 구독 목록 변경을 모아서 보내는 간격 (초)
+
+
+class _TickerFrame(msgspec.Struct):
+    """Upbit ticker 메시지에서 사용하는 필드만 (나머지 필드는 디코딩하지 않고 건너뜀)"""
+    code: str = ""
+    trade_price: Optional[float] = None
+
+
+# 체결마다 수신되는 메시지 디코더 (bytes를 그대로 받아 필요한 필드만 파싱)
+_ticker_decoder = msgspec.json.Decoder(_TickerFrame)
+
+
+class PriceStream:
+    """
+    Upbit 실시간 시세 스트림 (WebSocket ticker)
+
+    백그라운드 스레드에서 하나의 WebSocket 연결로 구독 중인 모든 티커의
+    체결가를 수신하여 메모리 테이블 {ticker: (price, timestamp)}에 보관합니다.
+    get_current_price()는 REST 호출 대신 이 테이블을 먼저 조회합니다.
+
+    구독 대상은 봇이 set_tickers()로 명시적으로 지정합니다 (보유 + 감시 티커).
+    목록이 바뀌면 재연결하지 않고, 열린 연결에 구독 요청을 다시 보냅니다.
+    """
+
+    def __init__(self, url: str = UPBIT_WS_URL, max_age: float = 2.0):
+        self.url = url
+        self.max_age = max_age  # 이 시간(초)보다 오래된 가격은 stale로 간주
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._codes: frozenset = frozenset()
+        self._codes_changed_at = 0.0  # 마지막 구독 목록 변경 시각 (time.monotonic)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[str, float], None]] = []
+
+    def add_listener(self, callback: Callable[[str, float], None]):
+        """
+        가격 변동 콜백 등록 callback(ticker, price)
+
+        스트림 스레드에서 호출되므로 콜백은 빠르게 반환해야 합니다.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def set_tickers(self, tickers: Iterable[str]):
+        """
+        구독 티커 목록 교체 (목록이 같으면 아무것도 하지 않음)
+
+        변경은 SUBSCRIBE_DEBOUNCE 동안 모아서 열린 연결에 한 번만 다시 보냅니다.
+        """
+        codes = frozenset(f"KRW-{t}" for t in tickers)
+        with self._lock:
+            if codes == self._codes:
+                return
+            self._codes = codes
+            self._codes_changed_at = time.monotonic()
+            # 구독 해제된 티커의 가격은 더 이상 갱신되지 않으므로 제거
+            self._prices = {t: v for t, v in self._prices.items() if f"KRW-{t}" in codes}
+
+        if codes and (self._thread is None or not self._thread.is_alive()):
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run_forever, daemon=True)
+            self._thread.start()
+
+    def get_price(self, ticker: str) -> Optional[float]:
+        """최신 체결가 반환 (없거나 오래되었으면 None)"""
+        entry = self._prices.get(ticker)
+        if entry is None:
+            return None
+        price, updated_at = entry
+        if time.time() - updated_at > self.max_age:
+            return None
+        return price
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run_forever(self):
+        logger.info("📡 Price stream started")
+        asyncio.run(self._listen())
+        logger.info("📡 Price stream stopped")
+
+    def _update_price(self, ticker: str, price: float):
+        previous = self._prices.get(ticker)
+        self._prices[ticker] = (price, time.time())
+
+        # 가격이 바뀐 경우에만 리스너 통지
+        if previous is not None and previous[0] == price:
+            return
+        for callback in self._listeners:
+            try:
+                callback(ticker, price)
+            except Exception as e:
+                logger.debug(f"⚠️ Price listener error: {e}")
+
+    def _pending_codes(self, sent: frozenset) -> Optional[frozenset]:
+        """다시 보낼 구독 목록 (변경이 없거나 디바운스 중이면 None)"""
+        with self._lock:
+            codes, changed_at = self._codes, self._codes_changed_at
+        if codes == sent:
+            return None
+        if sent and time.monotonic() - changed_at < SUBSCRIBE_DEBOUNCE:
+            return None
+        return codes
+
+    async def _listen(self):
+        import websockets
+
+        while not self._stopped.is_set():
+            if not self._codes:
+                # 구독할 티커가 생길 때까지 연결하지 않음
+                await asyncio.sleep(1.0)
+                continue
+
+            try:
+                async with websockets.connect(self.url, ping_interval=60) as ws:
+                    sent: frozenset = frozenset()
+                    while not self._stopped.is_set():
+                        # 구독 목록이 바뀌었으면 같은 연결에 요청을 다시 보냄 (기존 구독 대체)
+                        codes = self._pending_codes(sent)
+                        if codes is not None:
+                            if not codes:
+                                break  # 구독 대상이 없으면 연결 종료
+                            await ws.send(json.dumps([
+                                {"ticket": str(uuid.uuid4())},
+                                {"type": "ticker", "codes": sorted(codes)}
+                            ]))
+                            sent = codes
+
+                        try:
+                            message = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            continue
+
+                        try:
+                            frame = _ticker_decoder.decode(message)
+                        except msgspec.DecodeError:
+                            continue  # ticker 형식이 아닌 메시지는 무시
+                        code = frame.code
+                        price = frame.trade_price
+                        if price is not None and code in sent:
+                            self._update_price(code[4:], price)
+
+            except Exception as e:
+                logger.debug(f"⚠️ Price stream error: {e}. Reconnecting in 3s...")
+                await asyncio.sleep(3)
+
+
+class ExchangeManager(ABC):
     """
     Exchange Abstraction Layer
     Supports: Bithumb, Upbit
+
+    거래소별 구현은 UpbitExchange / BithumbExchange 서브클래스가 담당하며,
+    create_exchange()가 생성 시점에 한 번만 거래소를 선택합니다.
+    (매 호출마다 exchange_name 문자열 비교로 분기하지 않음)
+    거래소별 메서드는 @abstractmethod → 구현이 빠진 서브클래스는 생성 시점에 TypeError
     """
-    
-    def __init__(self, exchange_name: str, access_key: str, secret_key: str):
-        self.exchange_name = exchange_name.lower()
+
+    exchange_name = ""
+
+    def __init__(self, access_key: str, secret_key: str):
         self.access_key = access_key
         self.secret_key = secret_key
         self.client: Any = None
-        
-        self._initialize_client()
-        
-    def _initialize_client(self):
+        self.price_stream: Optional[PriceStream] = None
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        self._holdings_map_cache: Optional[Tuple[float, Dict[str, float]]] = None  # (fetched_at, {ticker: amount})
+        self._balances_cache: Optional[Tuple[float, frozenset, Dict[str, float]]] = None  # (fetched_at, tickers, balances)
+
         try:
-            if self.exchange_name == 'bithumb':
-                self.client = pybithumb.Bithumb(self.access_key, self.secret_key)
-            elif self.exchange_name == 'upbit':
-                self.client = pyupbit.Upbit(self.access_key, self.secret_key)
-            else:
-                raise ValueError(f"Unsupported exchange: {self.exchange_name}")
+            self.client = self._create_client()
             logger.info(f"✅ Exchange Client Initialized: {self.exchange_name.upper()}")
         except Exception as e:
             logger.error(f"❌ Failed to initialize exchange client: {e}")
             self.client = None
 
+    @abstractmethod
+    def _create_client(self) -> Any:
+        ...
+
+    @abstractmethod
+    def _fetch_current_price(self, ticker: str) -> Optional[float]:
+        """REST 현재가 조회 (거래소별 구현)"""
+
+    def _fetch_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """REST 다중 현재가 조회 (기본: 티커별 개별 호출, 일괄 API가 있으면 재정의)"""
+        prices = {}
+        for ticker in tickers:
+            price = self._fetch_current_price(ticker)
+            if price:
+                prices[ticker] = price
+        return prices
+
+    @abstractmethod
     def get_ohlcv(self, ticker: str, interval: str = "day") -> Optional[Any]:
-        """
-        Get OHLCV data
-        standardize ticker to 'BTC' (no prefix)
-        """
-        try:
-            if self.exchange_name == 'bithumb':
-                # pybithumb defaults to daily if interval not specified or "time"
-                # it supports: "24h", "12h", "6h", "1h", "30m", "10m", "5m", "3m", "1m"
-                # mapping "day" to "24h"
-                if interval == "day":
-                    return pybithumb.get_ohlcv(ticker)
-                
-                # if needed, map other intervals. 
-                # For now, default usage is daily.
-                return pybithumb.get_ohlcv(ticker)
-                
-            elif self.exchange_name == 'upbit':
-                u_ticker = f"KRW-{ticker}"
-                u_interval = "day" if interval == "day" else interval
-                # pyupbit intervals: day, minute1, minute3, etc.
-                return pyupbit.get_ohlcv(u_ticker, interval=u_interval, count=200)
-                
-        except Exception as e:
-            logger.error(f"❌ OHLCV Error ({self.exchange_name}): {e}")
-            return None
+        ...
 
     def get_current_price(self, ticker: str) -> Optional[float]:
         """
-        현재 가격 조회 (캐싱 적용)
+        현재 가격 조회 (실시간 스트림 → 캐시 → REST 순)
         """
-        import time
-        
+        # 📡 실시간 스트림 확인 (2초 이내 체결가)
+        if self.price_stream is not None:
+            live_price = self.price_stream.get_price(ticker)
+            if live_price is not None:
+                return live_price
+
         # 🔥 캐시 확인 (5초 유효)
-        if not hasattr(self, '_price_cache'):
-            self._price_cache = {}
-        
-        cache_key = ticker
         now = time.time()
-        
-        if cache_key in self._price_cache:
-            cached_price, cached_time = self._price_cache[cache_key]
+        cached = self._price_cache.get(ticker)
+        if cached is not None:
+            cached_price, cached_time = cached
             if now - cached_time < 5:  # 5초 이내면 캐시 사용
                 return cached_price
-        
+
         # API 호출
         try:
-            if self.exchange_name == 'bithumb':
-                price = pybithumb.get_current_price(ticker)
-            elif self.exchange_name == 'upbit':
-                price = pyupbit.get_current_price(f"KRW-{ticker}")
-            else:
-                return None
-            
+            price = self._fetch_current_price(ticker)
+
             # 캐시 저장
             if price:
-                self._price_cache[cache_key] = (price, now)
-            
+                self._price_cache[ticker] = (price, now)
+
             return price
-            
+
         except Exception as e:
             logger.debug(f"⚠️ Price Error ({self.exchange_name}): {e}")
             return None
-    
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        여러 티커의 현재 가격 일괄 조회 (스트림/캐시에 없는 티커만 REST 1회 호출)
+
+        Returns:
+            {ticker: price} - 조회 실패한 티커는 포함되지 않음
+        """
+        prices: Dict[str, float] = {}
+        missing = []
+        now = time.time()
+
+        for ticker in tickers:
+            if self.price_stream is not None:
+                live_price = self.price_stream.get_price(ticker)
+                if live_price is not None:
+                    prices[ticker] = live_price
+                    continue
+
+            cached = self._price_cache.get(ticker)
+            if cached is not None and now - cached[1] < 5:
+                prices[ticker] = cached[0]
+                continue
+
+            missing.append(ticker)
+
+        if not missing:
+            return prices
+
+        try:
+            fetched = self._fetch_current_prices(missing)
+            for ticker, price in fetched.items():
+                self._price_cache[ticker] = (price, now)
+            prices.update(fetched)
+        except Exception as e:
+            logger.debug(f"⚠️ Prices Error ({self.exchange_name}): {e}")
+
+        return prices
+
+    @abstractmethod
+    def get_orderbook_bid_price(self, ticker: str) -> Optional[float]:
+        ...
+
+    @abstractmethod
+    def get_balance(self, ticker: str) -> Dict:
+        ...
+
+    @abstractmethod
+    def get_krw_balance(self) -> float:
+        """원화(KRW) 잔고 조회 (실패 시 0)"""
+
+    @abstractmethod
+    def buy_market_order(self, ticker: str, amount_krw: float, amount_unit: float = 0) -> Any:
+        ...
+
+    @abstractmethod
+    def sell_market_order(self, ticker: str, volume: float) -> Any:
+        ...
+
+    @abstractmethod
+    def get_tickers(self) -> list:
+        ...
+
+    @abstractmethod
+    def get_holdings(self) -> list:
+        ...
+
+    def _fetch_balances(self, tickers: List[str]) -> Dict[str, float]:
+        """잔고 조회 (기본: 티커별 개별 호출, 전체 계좌 API가 있으면 재정의)"""
+        balances: Dict[str, float] = {}
+        if not tickers:
+            balances["KRW"] = self.get_krw_balance()
+        for ticker in tickers:
+            data = self.get_balance(ticker)
+            balances["KRW"] = data.get("krw_balance", 0)
+            balances[ticker] = data.get("coin_balance", 0)
+        return balances
+
+    def get_balances(self, tickers: List[str], max_age: float = 2.0) -> Dict[str, float]:
+        """
+        KRW 및 여러 코인 잔고 일괄 조회 (max_age 초 동안 재사용, 주문 시 무효화)
+
+        Returns:
+            {"KRW": krw_balance, ticker: coin_balance, ...} - 없는 코인은 포함되지 않을 수 있음
+        """
+        key = frozenset(tickers)
+        now = time.monotonic()
+        cached = self._balances_cache
+        if cached is not None and cached[1] == key and now - cached[0] < max_age:
+            return cached[2]
+
+        balances = self._fetch_balances(list(tickers))
+        self._balances_cache = (now, key, balances)
+        return balances
+
+    def _invalidate_account_cache(self):
+        """주문 직후 잔고 관련 캐시 무효화"""
+        self._holdings_map_cache = None
+        self._balances_cache = None
+
+    def get_holdings_map(self, max_age: float = 5.0) -> Dict[str, float]:
+        """
+        보유 수량 맵 {ticker: amount} (max_age 초 동안 재사용, 주문 시 무효화)
+        """
+        now = time.monotonic()
+        cached = self._holdings_map_cache
+        if cached is not None and now - cached[0] < max_age:
+            return cached[1]
+
+        holdings = {h['ticker']: h['amount'] for h in self.get_holdings()}
+        self._holdings_map_cache = (now, holdings)
+        return holdings
+
+    @abstractmethod
+    def get_krw_deposits(self, limit: int = 100) -> list:
+        ...
+
+    @abstractmethod
+    def get_krw_withdrawals(self, limit: int = 100) -> list:
+        ...
+
+
+class UpbitExchange(ExchangeManager):
+    """Upbit 구현 (pyupbit + REST)"""
+
+    exchange_name = "upbit"
+
+    def __init__(self, access_key: str, secret_key: str):
+        super().__init__(access_key, secret_key)
+        if self.client is not None:
+            self.price_stream = PriceStream()
+
+    def _create_client(self) -> Any:
+        return pyupbit.Upbit(self.access_key, self.secret_key)
+
+    def _fetch_current_price(self, ticker: str) -> Optional[float]:
+        return pyupbit.get_current_price(f"KRW-{ticker}")
+
+    def _fetch_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        # GET /v1/ticker?markets=KRW-A,KRW-B,... 한 번으로 조회
+        result = pyupbit.get_current_price([f"KRW-{t}" for t in tickers])
+        if not isinstance(result, dict):
+            # 티커 1개면 float 반환
+            return {tickers[0]: result} if result else {}
+        return {market.replace("KRW-", ""): price for market, price in result.items() if price}
+
+    def get_ohlcv(self, ticker: str, interval: str = "day") -> Optional[Any]:
+        """
+        Get OHLCV data
+        standardize ticker to 'BTC' (no prefix)
+        """
+        try:
+            # pyupbit intervals: day, minute1, minute3, etc.
+            return pyupbit.get_ohlcv(f"KRW-{ticker}", interval=interval, count=200)
+        except Exception as e:
+            logger.error(f"❌ OHLCV Error ({self.exchange_name}): {e}")
+            return None
+
     def get_orderbook_bid_price(self, ticker: str) -> Optional[float]:
         """
         매수 1호가 조회 (시장가 매도 시 실제 체결 가격)
         업비트는 시장가 매도 시 '주문 수량 × 매수 1호가'로 계산
         """
         try:
-            if self.exchange_name == 'upbit':
-                orderbook = pyupbit.get_orderbook(f"KRW-{ticker}")
-                if orderbook and 'orderbook_units' in orderbook:
-                    # 매수 1호가 (가장 높은 매수 주문 가격)
-                    bid_price = orderbook['orderbook_units'][0]['bid_price']
-                    return float(bid_price)
-            elif self.exchange_name == 'bithumb':
-                # Bithumb도 유사하게 구현 가능 (pybithumb.get_orderbook 사용)
-                return self.get_current_price(ticker)  # Fallback
+            orderbook = pyupbit.get_orderbook(f"KRW-{ticker}")
+            if orderbook and 'orderbook_units' in orderbook:
+                # 매수 1호가 (가장 높은 매수 주문 가격)
+                bid_price = orderbook['orderbook_units'][0]['bid_price']
+                return float(bid_price)
         except Exception as e:
             logger.error(f"❌ Orderbook Error ({self.exchange_name}): {e}")
-            return None
+        return None
 
     def get_balance(self, ticker: str) -> Dict:
         """
@@ -127,119 +429,81 @@ class ExchangeManager:
             }
         """
         try:
-            if self.exchange_name == 'bithumb':
-                # pybithumb.get_balance returns tuple: (btc_total, btc_in_use, krw_total, krw_in_use) ? 
-                # Actually earlier code handled tuple/dict.
-                # Standard pybithumb.get_balance("BTC") -> (total_coin, total_krw, in_use_coin, in_use_krw)
-                balance = self.client.get_balance(ticker)
-                if isinstance(balance, tuple):
-                     return {
-                        "krw_balance": balance[2], # total krw
-                        "coin_balance": balance[0], # total coin
-                        "total_assets": balance[2] + (balance[0] * self.get_current_price(ticker) or 0)
-                    }
-                return {"krw_balance": 0, "coin_balance": 0, "total_assets": 0}
-
-            elif self.exchange_name == 'upbit':
-                krw_balance = self.client.get_balance("KRW")
-                if krw_balance is None:
-                    krw_balance = 0.0
-                    
-                coin_balance = self.client.get_balance(f"KRW-{ticker}")
-                if coin_balance is None:
-                    coin_balance = 0.0
-                    
-                current_price = self.get_current_price(ticker)
-                
-                if current_price is None:
-                    current_price = 0.0
+            krw_balance = self.client.get_balance("KRW")
+            if krw_balance is None:
+                krw_balance = 0.0
+
+            coin_balance = self.client.get_balance(f"KRW-{ticker}")
+            if coin_balance is None:
+                coin_balance = 0.0
+
+            current_price = self.get_current_price(ticker) if coin_balance > 0 else 0.0
+
+            if current_price is None:
+                current_price = 0.0
+
+            return {
+                "krw_balance": krw_balance,
+                "coin_balance": coin_balance,
+                "total_assets": krw_balance + (coin_balance * current_price)
+            }
 
-                return {
-                    "krw_balance": krw_balance,
-                    "coin_balance": coin_balance,
-                    "total_assets": krw_balance + (coin_balance * current_price)
-                }
-                
         except Exception as e:
             logger.error(f"❌ Balance Error ({self.exchange_name}): {e}")
             return {"krw_balance": 0, "coin_balance": 0, "total_assets": 0}
 
+    def get_krw_balance(self) -> float:
+        try:
+            return self.client.get_balance("KRW") or 0.0
+        except Exception as e:
+            logger.error(f"❌ Balance Error ({self.exchange_name}): {e}")
+            return 0.0
+
+    def _fetch_balances(self, tickers: List[str]) -> Dict[str, float]:
+        """전체 계좌 잔고 1회 조회 (/v1/accounts, 주문 가능 수량 기준)"""
+        try:
+            return {b['currency']: float(b['balance']) for b in self.client.get_balances()}
+        except Exception as e:
+            logger.error(f"❌ Balances Error ({self.exchange_name}): {e}")
+            return {}
+
+    def _check_order_result(self, result: Any, side: str) -> Any:
+        """🛡️ Upbit 응답 검증: 에러 응답인지 확인"""
+        if result is None:
+            logger.error(f"❌ Upbit {side} Order returned None")
+            return None
+        if isinstance(result, dict) and 'error' in result:
+            error_msg = result['error'].get('message', str(result))
+            logger.error(f"❌ Upbit {side} Error: {error_msg}")
+            print(error_msg)  # 터미널에도 출력
+            return None
+
+        logger.info(f"✅ {side} Order Success: {result.get('uuid', 'N/A')}")
+        return result
+
     def buy_market_order(self, ticker: str, amount_krw: float, amount_unit: float = 0) -> Any:
         try:
-            if self.exchange_name == 'bithumb':
-                if amount_unit <= 0:
-                     price = self.get_current_price(ticker)
-                     if price:
-                         amount_unit = amount_krw / price
-                     else:
-                         return None
-                
-                result = self.client.buy_market_order(ticker, amount_unit)
-                # Bithumb 응답 검증
-                if isinstance(result, tuple) and result[0] == 'error':
-                    logger.error(f"❌ Bithumb Buy Error: {result}")
-                    return None
-                return result
-                
-            elif self.exchange_name == 'upbit':
-                result = self.client.buy_market_order(f"KRW-{ticker}", amount_krw)
-                
-                # 🛡️ Upbit 응답 검증: 에러 응답인지 확인
-                if result is None:
-                    logger.error("❌ Upbit Buy Order returned None")
-                    return None
-                if isinstance(result, dict) and 'error' in result:
-                    error_msg = result['error'].get('message', str(result))
-                    logger.error(f"❌ Upbit Buy Error: {error_msg}")
-                    print(error_msg)  # 터미널에도 출력
-                    return None
-                
-                logger.info(f"✅ Buy Order Success: {result.get('uuid', 'N/A')}")
-                return result
-                
+            self._invalidate_account_cache()  # 잔고 변경 → 보유 수량/잔고 캐시 무효화
+            result = self.client.buy_market_order(f"KRW-{ticker}", amount_krw)
+            return self._check_order_result(result, "Buy")
         except Exception as e:
             logger.error(f"❌ Buy Order Error ({self.exchange_name}): {e}")
             return None
 
     def sell_market_order(self, ticker: str, volume: float) -> Any:
         try:
-            if self.exchange_name == 'bithumb':
-                result = self.client.sell_market_order(ticker, volume)
-                # Bithumb 응답 검증
-                if isinstance(result, tuple) and result[0] == 'error':
-                    logger.error(f"❌ Bithumb Sell Error: {result}")
-                    return None
-                return result
-                
-            elif self.exchange_name == 'upbit':
-                result = self.client.sell_market_order(f"KRW-{ticker}", volume)
-                
-                # 🛡️ Upbit 응답 검증: 에러 응답인지 확인
-                if result is None:
-                    logger.error("❌ Upbit Sell Order returned None")
-                    return None
-                if isinstance(result, dict) and 'error' in result:
-                    error_msg = result['error'].get('message', str(result))
-                    logger.error(f"❌ Upbit Sell Error: {error_msg}")
-                    print(error_msg)  # 터미널에도 출력
-                    return None
-                
-                logger.info(f"✅ Sell Order Success: {result.get('uuid', 'N/A')}")
-                return result
-                
+            self._invalidate_account_cache()  # 잔고 변경 → 보유 수량/잔고 캐시 무효화
+            result = self.client.sell_market_order(f"KRW-{ticker}", volume)
+            return self._check_order_result(result, "Sell")
         except Exception as e:
             logger.error(f"❌ Sell Order Error ({self.exchange_name}): {e}")
             return None
 
     def get_tickers(self) -> list:
         try:
-            if self.exchange_name == 'bithumb':
-                 # 🔥 빗썸: KRW 마켓만 명시적으로 요청
-                 return pybithumb.get_tickers(payment_currency="KRW")
-            elif self.exchange_name == 'upbit':
-                # 🔥 업비트: KRW 마켓만 이중 필터링
-                tickers = pyupbit.get_tickers(fiat="KRW")
-                return [t.replace('KRW-', '') for t in tickers if t.startswith('KRW-')]
+            # 🔥 업비트: KRW 마켓만 이중 필터링
+            tickers = pyupbit.get_tickers(fiat="KRW")
+            return [t.replace('KRW-', '') for t in tickers if t.startswith('KRW-')]
         except Exception as e:
             logger.error(f"❌ Failed to get tickers: {e}")
             return []
@@ -252,31 +516,61 @@ class ExchangeManager:
         """
         holdings = []
         try:
-            if self.exchange_name == 'upbit':
-                balances = self.client.get_balances()
-                for b in balances:
-                    currency = b['currency']
-                    if currency == 'KRW': continue
-                    
-                    amount = float(b['balance']) # Available balance only to ensure tradeability
-                    avg_price = float(b['avg_buy_price'])
-                    
-                    if amount > 0:
-                        holdings.append({
-                            "ticker": currency,
-                            "amount": amount,
-                            "avg_buy_price": avg_price
-                        })
-                        
-            elif self.exchange_name == 'bithumb':
-                # Bithumb: fallback not fully implemented yet
-                pass
-                
+            balances = self.client.get_balances()
+            for b in balances:
+                currency = b['currency']
+                if currency == 'KRW': continue
+
+                amount = float(b['balance']) # Available balance only to ensure tradeability
+                avg_price = float(b['avg_buy_price'])
+
+                if amount > 0:
+                    holdings.append({
+                        "ticker": currency,
+                        "amount": amount,
+                        "avg_buy_price": avg_price
+                    })
+
         except Exception as e:
             logger.error(f"❌ Failed to get holdings: {e}")
 
         return holdings
 
+    def _get_krw_transfers(self, endpoint: str, state: str, limit: int) -> list:
+        """
+        Upbit 원화 입출금 내역 조회 (GET /v1/deposits, /v1/withdraws)
+        pyupbit doesn't have this, so we need to use requests directly
+        """
+        import requests
+        import jwt
+        import hashlib
+        from urllib.parse import urlencode, unquote
+
+        query = {
+            'currency': 'KRW',
+            'state': state,
+            'limit': limit
+        }
+
+        query_string = unquote(urlencode(query, doseq=True)).encode("utf-8")
+        m = hashlib.sha512()
+        m.update(query_string)
+        query_hash = m.hexdigest()
+
+        payload = {
+            'access_key': self.access_key,
+            'nonce': str(uuid.uuid4()),
+            'query_hash': query_hash,
+            'query_hash_alg': 'SHA512',
+        }
+
+        jwt_token = jwt.encode(payload, self.secret_key)
+        authorization = f'Bearer {jwt_token}'
+        headers = {'Authorization': authorization}
+
+        url = f'https://api.upbit.com/v1/{endpoint}?{urlencode(query)}'
+        return requests.get(url, headers=headers)
+
     def get_krw_deposits(self, limit: int = 100) -> list:
         """
         원화(KRW) 입금 내역 조회
@@ -285,49 +579,13 @@ class ExchangeManager:
         """
         deposits = []
         try:
-            if self.exchange_name == 'upbit':
-                # Upbit API: GET /v1/deposits
-                # pyupbit doesn't have this, so we need to use requests directly
-                import requests
-                import jwt
-                import hashlib
-                import uuid
-                from urllib.parse import urlencode, unquote
-
-                query = {
-                    'currency': 'KRW',
-                    'state': 'ACCEPTED',  # 완료된 입금만
-                    'limit': limit
-                }
-
-                query_string = unquote(urlencode(query, doseq=True)).encode("utf-8")
-                m = hashlib.sha512()
-                m.update(query_string)
-                query_hash = m.hexdigest()
-
-                payload = {
-                    'access_key': self.access_key,
-                    'nonce': str(uuid.uuid4()),
-                    'query_hash': query_hash,
-                    'query_hash_alg': 'SHA512',
-                }
-
-                jwt_token = jwt.encode(payload, self.secret_key)
-                authorization = f'Bearer {jwt_token}'
-                headers = {'Authorization': authorization}
-
-                url = f'https://api.upbit.com/v1/deposits?{urlencode(query)}'
-                response = requests.get(url, headers=headers)
-
-                if response.status_code == 200:
-                    deposits = response.json()
-                    logger.info(f"✅ 입금 내역 조회: {len(deposits)}건")
-                else:
-                    logger.error(f"❌ 입금 내역 조회 실패: {response.status_code} - {response.text}")
+            response = self._get_krw_transfers('deposits', 'ACCEPTED', limit)  # 완료된 입금만
 
-            elif self.exchange_name == 'bithumb':
-                # Bithumb API는 다른 방식으로 구현 필요
-                logger.warning("⚠️ Bithumb 입금 내역 조회는 아직 구현되지 않았습니다")
+            if response.status_code == 200:
+                deposits = response.json()
+                logger.info(f"✅ 입금 내역 조회: {len(deposits)}건")
+            else:
+                logger.error(f"❌ 입금 내역 조회 실패: {response.status_code} - {response.text}")
 
         except Exception as e:
             logger.error(f"❌ Failed to get KRW deposits: {e}")
@@ -342,48 +600,160 @@ class ExchangeManager:
         """
         withdrawals = []
         try:
-            if self.exchange_name == 'upbit':
-                import requests
-                import jwt
-                import hashlib
-                import uuid
-                from urllib.parse import urlencode, unquote
-
-                query = {
-                    'currency': 'KRW',
-                    'state': 'DONE',  # 완료된 출금만
-                    'limit': limit
-                }
+            response = self._get_krw_transfers('withdraws', 'DONE', limit)  # 완료된 출금만
+
+            if response.status_code == 200:
+                withdrawals = response.json()
+                logger.info(f"✅ 출금 내역 조회: {len(withdrawals)}건")
+            else:
+                logger.error(f"❌ 출금 내역 조회 실패: {response.status_code} - {response.text}")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to get KRW withdrawals: {e}")
+
+        return withdrawals
+
+
+class BithumbExchange(ExchangeManager):
+    """Bithumb 구현 (pybithumb)"""
+
+    exchange_name = "bithumb"
+
+    def _create_client(self) -> Any:
+        return pybithumb.Bithumb(self.access_key, self.secret_key)
+
+    def _fetch_current_price(self, ticker: str) -> Optional[float]:
+        return pybithumb.get_current_price(ticker)
+
+    def _fetch_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        if len(tickers) == 1:
+            return super()._fetch_current_prices(tickers)
+        # 전체 시세 한 번으로 조회 ({ticker: {'closing_price': '...'}})
+        result = pybithumb.get_current_price("ALL") or {}
+        return {
+            t: float(result[t]['closing_price'])
+            for t in tickers
+            if isinstance(result.get(t), dict) and result[t].get('closing_price')
+        }
+
+    def get_ohlcv(self, ticker: str, interval: str = "day") -> Optional[Any]:
+        """
+        Get OHLCV data
+        standardize ticker to 'BTC' (no prefix)
+        """
+        try:
+            # pybithumb defaults to daily if interval not specified or "time"
+            # it supports: "24h", "12h", "6h", "1h", "30m", "10m", "5m", "3m", "1m"
+            # For now, default usage is daily.
+            return pybithumb.get_ohlcv(ticker)
+        except Exception as e:
+            logger.error(f"❌ OHLCV Error ({self.exchange_name}): {e}")
+            return None
 
-                query_string = unquote(urlencode(query, doseq=True)).encode("utf-8")
-                m = hashlib.sha512()
-                m.update(query_string)
-                query_hash = m.hexdigest()
+    def get_orderbook_bid_price(self, ticker: str) -> Optional[float]:
+        # Bithumb도 유사하게 구현 가능 (pybithumb.get_orderbook 사용)
+        return self.get_current_price(ticker)  # Fallback
 
-                payload = {
-                    'access_key': self.access_key,
-                    'nonce': str(uuid.uuid4()),
-                    'query_hash': query_hash,
-                    'query_hash_alg': 'SHA512',
+    def get_balance(self, ticker: str) -> Dict:
+        """
+        Get Balance
+        Returns:
+            {
+                "krw_balance": float,
+                "coin_balance": float,
+                "total_assets": float
+            }
+        """
+        try:
+            # Standard pybithumb.get_balance("BTC") -> (total_coin, in_use_coin, total_krw, in_use_krw)
+            balance = self.client.get_balance(ticker)
+            if isinstance(balance, tuple):
+                coin_balance = balance[0]  # total coin
+                krw_balance = balance[2]   # total krw
+                # 코인 잔고가 없으면 시세 조회 생략
+                price = self.get_current_price(ticker) if coin_balance > 0 else 0
+                return {
+                    "krw_balance": krw_balance,
+                    "coin_balance": coin_balance,
+                    "total_assets": krw_balance + coin_balance * (price or 0)
                 }
+        except Exception as e:
+            logger.error(f"❌ Balance Error ({self.exchange_name}): {e}")
+
+        return {"krw_balance": 0, "coin_balance": 0, "total_assets": 0}
+
+    def get_krw_balance(self) -> float:
+        """pybithumb은 코인별 잔고 조회 결과에 원화 잔고가 함께 오므로 BTC 조회로 얻음"""
+        try:
+            balance = self.client.get_balance("BTC")
+            if isinstance(balance, tuple):
+                return balance[2]  # total krw
+        except Exception as e:
+            logger.error(f"❌ Balance Error ({self.exchange_name}): {e}")
+        return 0.0
 
-                jwt_token = jwt.encode(payload, self.secret_key)
-                authorization = f'Bearer {jwt_token}'
-                headers = {'Authorization': authorization}
+    def _check_order_result(self, result: Any, side: str) -> Any:
+        """Bithumb 응답 검증"""
+        if isinstance(result, tuple) and result[0] == 'error':
+            logger.error(f"❌ Bithumb {side} Error: {result}")
+            return None
+        return result
 
-                url = f'https://api.upbit.com/v1/withdraws?{urlencode(query)}'
-                response = requests.get(url, headers=headers)
+    def buy_market_order(self, ticker: str, amount_krw: float, amount_unit: float = 0) -> Any:
+        try:
+            if amount_unit <= 0:
+                price = self.get_current_price(ticker)
+                if not price:
+                    return None
+                amount_unit = amount_krw / price
 
-                if response.status_code == 200:
-                    withdrawals = response.json()
-                    logger.info(f"✅ 출금 내역 조회: {len(withdrawals)}건")
-                else:
-                    logger.error(f"❌ 출금 내역 조회 실패: {response.status_code} - {response.text}")
+            self._invalidate_account_cache()  # 잔고 변경 → 보유 수량/잔고 캐시 무효화
+            result = self.client.buy_market_order(ticker, amount_unit)
+            return self._check_order_result(result, "Buy")
+        except Exception as e:
+            logger.error(f"❌ Buy Order Error ({self.exchange_name}): {e}")
+            return None
 
-            elif self.exchange_name == 'bithumb':
-                logger.warning("⚠️ Bithumb 출금 내역 조회는 아직 구현되지 않았습니다")
+    def sell_market_order(self, ticker: str, volume: float) -> Any:
+        try:
+            self._invalidate_account_cache()  # 잔고 변경 → 보유 수량/잔고 캐시 무효화
+            result = self.client.sell_market_order(ticker, volume)
+            return self._check_order_result(result, "Sell")
+        except Exception as e:
+            logger.error(f"❌ Sell Order Error ({self.exchange_name}): {e}")
+            return None
 
+    def get_tickers(self) -> list:
+        try:
+            # 🔥 빗썸: KRW 마켓만 명시적으로 요청
+            return pybithumb.get_tickers(payment_currency="KRW")
         except Exception as e:
-            logger.error(f"❌ Failed to get KRW withdrawals: {e}")
+            logger.error(f"❌ Failed to get tickers: {e}")
+            return []
 
-        return withdrawals
+    def get_holdings(self) -> list:
+        # Bithumb: fallback not fully implemented yet
+        return []
+
+    def get_krw_deposits(self, limit: int = 100) -> list:
+        # Bithumb API는 다른 방식으로 구현 필요
+        logger.warning("⚠️ Bithumb 입금 내역 조회는 아직 구현되지 않았습니다")
+        return []
+
+    def get_krw_withdrawals(self, limit: int = 100) -> list:
+        logger.warning("⚠️ Bithumb 출금 내역 조회는 아직 구현되지 않았습니다")
+        return []
+
+
+EXCHANGES = {
+    UpbitExchange.exchange_name: UpbitExchange,
+    BithumbExchange.exchange_name: BithumbExchange,
+}
+
+
+def create_exchange(exchange_name: str, access_key: str, secret_key: str) -> ExchangeManager:
+    """거래소 이름에 맞는 ExchangeManager 구현 생성"""
+    exchange_cls = EXCHANGES.get(exchange_name.lower())
+    if exchange_cls is None:
+        raise ValueError(f"Unsupported exchange: {exchange_name}")
+    return exchange_cls(access_key, secret_key)
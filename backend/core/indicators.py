@@ -0,0 +1,297 @@
+"""
+Indicator Kernels
+=================
+매 틱마다 호출되는 기술적 지표(RSI / MACD / BB / EMA / ATR) 계산 커널과
+진입 규칙 평가 커널, 수수료 포함 수익률 커널.
+
+FeatureEngineer.extract_features가 종목마다 ta 지표 객체를 여러 개 생성하던
+것을, 배열을 한 번만 순회하는 Numba 커널로 대체합니다.
+결과는 ta 라이브러리(RSIIndicator, MACD, BollingerBands, EMAIndicator,
+AverageTrueRange)와 동일한 정의를 따릅니다.
+
+Numba가 설치되어 있지 않으면 동일한 코드를 순수 Python으로 실행합니다.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 무시 (동일 결과, 느린 실행)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+RSI_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+BB_WINDOW = 20
+BB_DEV = 2.0
+VOLUME_WINDOW = 20
+EMA_SHORT = 9
+EMA_LONG = 21
+ATR_WINDOW = 14
+
+
+@njit(cache=True)
+def _features_njit(close, high, low, volume):
+    """
+    단일 순회로 특징 추출에 필요한 지표 시계열을 모두 계산
+
+    Args:
+        close, high, low, volume: float64 1차원 배열 (길이 N)
+
+    Returns:
+        (rsi, macd, macd_signal, bb_high, bb_low, volume_ma, ema_9, ema_21, atr)
+        각 길이 N 배열. 워밍업 구간은 ta와 동일하게 NaN (ATR은 0)
+    """
+    n = close.shape[0]
+    nan = np.nan
+
+    rsi = np.full(n, nan)
+    macd = np.full(n, nan)
+    macd_signal = np.full(n, nan)
+    bb_high = np.full(n, nan)
+    bb_low = np.full(n, nan)
+    volume_ma = np.full(n, nan)
+    ema_9 = np.full(n, nan)
+    ema_21 = np.full(n, nan)
+    atr = np.zeros(n)
+
+    # EMA 평활 계수 (ta: ewm(span=w, adjust=False) / RSI: ewm(alpha=1/w))
+    a_rsi = 1.0 / RSI_WINDOW
+    a_fast = 2.0 / (MACD_FAST + 1)
+    a_slow = 2.0 / (MACD_SLOW + 1)
+    a_sig = 2.0 / (MACD_SIGNAL + 1)
+    a_9 = 2.0 / (EMA_SHORT + 1)
+    a_21 = 2.0 / (EMA_LONG + 1)
+
+    avg_up = 0.0
+    avg_dn = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    ema_sig = 0.0
+    sig_count = 0
+    e9 = 0.0
+    e21 = 0.0
+
+    # 슬라이딩 윈도우 누적값 (BB: Welford 방식 평균/제곱편차, 거래량: 합계)
+    bb_mean = 0.0
+    bb_m2 = 0.0
+    vol_sum = 0.0
+
+    tr_sum = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # ---- EMA 9 / 21, MACD fast / slow ----
+        if i == 0:
+            ema_fast = c
+            ema_slow = c
+            e9 = c
+            e21 = c
+        else:
+            ema_fast += a_fast * (c - ema_fast)
+            ema_slow += a_slow * (c - ema_slow)
+            e9 += a_9 * (c - e9)
+            e21 += a_21 * (c - e21)
+
+        if i >= EMA_SHORT - 1:
+            ema_9[i] = e9
+        if i >= EMA_LONG - 1:
+            ema_21[i] = e21
+
+        # ---- MACD / Signal (Signal은 첫 유효 MACD부터 EMA 시작) ----
+        if i >= MACD_SLOW - 1:
+            m = ema_fast - ema_slow
+            macd[i] = m
+            if sig_count == 0:
+                ema_sig = m
+            else:
+                ema_sig += a_sig * (m - ema_sig)
+            sig_count += 1
+            if sig_count >= MACD_SIGNAL:
+                macd_signal[i] = ema_sig
+
+        # ---- RSI (Wilder 평활, 첫 diff는 0으로 취급) ----
+        if i > 0:
+            diff = c - close[i - 1]
+            up = diff if diff > 0.0 else 0.0
+            dn = -diff if diff < 0.0 else 0.0
+            avg_up += a_rsi * (up - avg_up)
+            avg_dn += a_rsi * (dn - avg_dn)
+        if i >= RSI_WINDOW - 1:
+            if avg_dn == 0.0:
+                rsi[i] = 100.0
+            else:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_up / avg_dn)
+
+        # ---- Bollinger Bands (rolling mean ± 2 * std, ddof=0) ----
+        if i < BB_WINDOW:
+            delta = c - bb_mean
+            bb_mean += delta / (i + 1)
+            bb_m2 += delta * (c - bb_mean)
+        else:
+            old = close[i - BB_WINDOW]
+            prev_mean = bb_mean
+            bb_mean += (c - old) / BB_WINDOW
+            bb_m2 += (c - old) * (c - bb_mean + old - prev_mean)
+        if i >= BB_WINDOW - 1:
+            var = bb_m2 / BB_WINDOW
+            std = np.sqrt(var) if var > 0.0 else 0.0
+            bb_high[i] = bb_mean + BB_DEV * std
+            bb_low[i] = bb_mean - BB_DEV * std
+
+        # ---- Volume MA ----
+        vol_sum += volume[i]
+        if i >= VOLUME_WINDOW:
+            vol_sum -= volume[i - VOLUME_WINDOW]
+        if i >= VOLUME_WINDOW - 1:
+            volume_ma[i] = vol_sum / VOLUME_WINDOW
+
+        # ---- ATR (True Range + Wilder 평활, 첫 값은 단순 평균) ----
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_c = close[i - 1]
+            tr = max(tr, abs(high[i] - prev_c), abs(low[i] - prev_c))
+        if i < ATR_WINDOW:
+            tr_sum += tr
+            if i == ATR_WINDOW - 1:
+                atr[i] = tr_sum / ATR_WINDOW
+        else:
+            atr[i] = (atr[i - 1] * (ATR_WINDOW - 1) + tr) / ATR_WINDOW
+
+    return rsi, macd, macd_signal, bb_high, bb_low, volume_ma, ema_9, ema_21, atr
+
+
+# ---- 진입 규칙 (비트마스크) ----
+# feats 벡터 인덱스
+F_RSI, F_BB_POSITION, F_PRICE_CHANGE_15M, F_EMA_9, F_EMA_21, F_MACD, F_MACD_SIGNAL = range(7)
+
+# thr 벡터 인덱스 / 기본값 (그리드 서치 시 벡터만 교체)
+T_RSI_OVERSOLD, T_BB_OVERSOLD, T_CRASH, T_MIN_CONFIDENCE = range(4)
+ENTRY_THRESHOLDS = np.array([35.0, 0.25, -0.05, 0.5])
+
+ENTRY_MEAN_REVERSION = 1  # bit 0: 과매도 + 급락 아님
+ENTRY_MOMENTUM = 2        # bit 1: MACD 골든크로스 + 상승 추세
+ENTRY_TREND_UP = 4        # bit 2: EMA9 > EMA21 (로그용)
+
+
+@njit(cache=True)
+def _entry_flags_njit(feats, confidence, thr):
+    """
+    진입 조건을 분기 없이 평가하여 uint8 비트마스크로 반환
+
+    Args:
+        feats: [rsi, bb_position, price_change_15m, ema_9, ema_21, macd, macd_signal]
+        confidence: 모델 확신도
+        thr: [rsi 과매도, bb 과매도, 급락 기준, 최소 확신도]
+    """
+    oversold = (feats[F_RSI] < thr[T_RSI_OVERSOLD]) | (feats[F_BB_POSITION] < thr[T_BB_OVERSOLD])
+    not_crashing = feats[F_PRICE_CHANGE_15M] > thr[T_CRASH]
+    trend_up = feats[F_EMA_9] > feats[F_EMA_21]
+    golden_cross = feats[F_MACD] > feats[F_MACD_SIGNAL]
+    min_confidence = confidence > thr[T_MIN_CONFIDENCE]
+
+    mean_reversion = oversold & not_crashing & min_confidence
+    momentum = golden_cross & trend_up & min_confidence
+    return np.uint8(mean_reversion * ENTRY_MEAN_REVERSION
+                    | momentum * ENTRY_MOMENTUM
+                    | trend_up * ENTRY_TREND_UP)
+
+
+# ---- 청산 체크용 단일 값 커널 (마지막 값만 계산) ----
+@njit(cache=True)
+def _atr_last_njit(high, low, close):
+    """
+    마지막 ATR 값만 계산 (Wilder 평활: atr = (atr_prev * (N-1) + tr) / N)
+
+    _features_njit의 atr 시계열 마지막 값과 동일. 데이터가 ATR_WINDOW 미만이면 0
+    """
+    n = close.shape[0]
+    if n < ATR_WINDOW:
+        return 0.0
+
+    atr = 0.0
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_c = close[i - 1]
+            tr = max(tr, abs(high[i] - prev_c), abs(low[i] - prev_c))
+        if i < ATR_WINDOW:
+            atr += tr
+            if i == ATR_WINDOW - 1:
+                atr /= ATR_WINDOW
+        else:
+            atr = (atr * (ATR_WINDOW - 1) + tr) / ATR_WINDOW
+    return atr
+
+
+@njit(cache=True)
+def _bb_position_last_njit(close):
+    """
+    마지막 종가의 볼린저 밴드 내 상대 위치 (0: 하단, 0.5: 중간, 1: 상단)
+
+    최근 BB_WINDOW개만 사용. 데이터 부족 또는 밴드 폭이 0이면 0.5
+    """
+    n = close.shape[0]
+    if n < BB_WINDOW:
+        return 0.5
+
+    mean = 0.0
+    for i in range(n - BB_WINDOW, n):
+        mean += close[i]
+    mean /= BB_WINDOW
+
+    var = 0.0
+    for i in range(n - BB_WINDOW, n):
+        d = close[i] - mean
+        var += d * d
+    std = np.sqrt(var / BB_WINDOW)
+
+    bb_h = mean + BB_DEV * std
+    bb_l = mean - BB_DEV * std
+    if bb_h == bb_l:
+        return 0.5
+    return (close[n - 1] - bb_l) / (bb_h - bb_l)
+
+
+# ---- 수수료 포함 순수익률 ----
+# 매수 비용 = e * (1 + f), 매도 수익 = c * (1 - f) (수량은 약분되어 불필요)
+@njit(cache=True)
+def _net_profit_scalar(entry, current, one_plus_f, one_minus_f):
+    """순수익률 (c*(1-f) - e*(1+f)) / (e*(1+f))"""
+    buy_cost = entry * one_plus_f
+    return (current * one_minus_f - buy_cost) / buy_cost
+
+
+@njit(cache=True)
+def _net_profit_vec(entry, current, one_plus_f, one_minus_f):
+    """포지션 배열 전체의 순수익률 (_net_profit_scalar의 배열 버전)"""
+    n = entry.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        buy_cost = entry[i] * one_plus_f
+        out[i] = (current[i] * one_minus_f - buy_cost) / buy_cost
+    return out
+
+
+def warmup():
+    """
+    모든 커널을 실제 호출과 같은 타입의 더미 입력으로 1회 실행
+
+    cache=True로 디스크 캐시가 있으면 로드만, 없으면 여기서 컴파일하여
+    봇 시작 후 첫 틱이 JIT 컴파일로 지연되지 않도록 합니다.
+    """
+    n = max(MACD_SLOW + MACD_SIGNAL, BB_WINDOW, ATR_WINDOW) + 1
+    x = np.linspace(1.0, 2.0, n)
+    _features_njit(x, x + 0.1, x - 0.1, x)
+    _entry_flags_njit(np.zeros(7), 0.0, ENTRY_THRESHOLDS)
+    _atr_last_njit(x + 0.1, x - 0.1, x)
+    _bb_position_last_njit(x)
+    _net_profit_scalar(1.0, 1.0, 1.0, 1.0)
+    _net_profit_vec(x, x, 1.0, 1.0)
@@ -0,0 +1,74 @@
+"""
+Position Table
+==============
+보유 포지션(dict of dict)의 열 지향(SoA) 스냅샷.
+
+청산 사이클마다 모든 포지션의 수익률 / 목표 도달 / 손절 여부를
+NumPy 연산 한 번으로 계산합니다. 포지션 원본은 TradingBot.positions
+(Copy-on-Write 매핑)이며, 이 테이블은 사이클 시작 시 그 스냅샷에서 만듭니다.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .indicators import _net_profit_vec
+
+
+class PositionTable:
+    """보유 포지션 SoA 뷰 (열: 진입가, 수량, 마지막 동적 목표 수익률)"""
+
+    __slots__ = ('tickers', 'index', 'entry_price', 'amount', 'dynamic_target')
+
+    def __init__(self, tickers: List[str], entry_price: np.ndarray,
+                 amount: np.ndarray, dynamic_target: np.ndarray):
+        self.tickers = tickers
+        self.index: Dict[str, int] = {t: i for i, t in enumerate(tickers)}
+        self.entry_price = entry_price
+        self.amount = amount
+        self.dynamic_target = dynamic_target  # 아직 계산 전이면 NaN
+
+    @classmethod
+    def from_positions(cls, positions: Mapping[str, Dict]) -> 'PositionTable':
+        """포지션 매핑 스냅샷으로부터 테이블 생성"""
+        tickers = list(positions)
+        n = len(tickers)
+        rows = [positions[t] for t in tickers]
+        return cls(
+            tickers,
+            np.fromiter((p['entry_price'] for p in rows), dtype=np.float64, count=n),
+            np.fromiter((p['amount'] for p in rows), dtype=np.float64, count=n),
+            np.fromiter((p.get('dynamic_target', np.nan) for p in rows), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def price_vector(self, prices: Mapping[str, float]) -> np.ndarray:
+        """{ticker: price}를 테이블 순서의 배열로 변환 (없는 티커는 NaN)"""
+        return np.fromiter(
+            (prices.get(t) or np.nan for t in self.tickers), dtype=np.float64, count=len(self.tickers)
+        )
+
+    def profit_rates(self, current: np.ndarray, fee_rate: Optional[float] = None) -> np.ndarray:
+        """
+        포지션별 수익률
+
+        Args:
+            current: 테이블 순서의 현재가 배열
+            fee_rate: 지정 시 수수료 포함 순수익률, None이면 단순 수익률
+        """
+        if fee_rate is None:
+            return (current - self.entry_price) / self.entry_price
+        return _net_profit_vec(self.entry_price, current, 1 + fee_rate, 1 - fee_rate)
+
+    def exit_masks(self, rates: np.ndarray, targets: np.ndarray,
+                   stop_loss: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (목표 도달 인덱스, 손절 인덱스) 반환
+
+        NaN(가격/목표 미확정)은 어느 쪽에도 포함되지 않습니다.
+        """
+        target_hit = rates >= targets
+        stop_hit = ~target_hit & (rates <= -stop_loss)
+        return np.where(target_hit)[0], np.where(stop_hit)[0]
@@ -14,8 +14,11 @@ Trading Flow:
 
 import time
 import threading
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, Mapping, Callable
 import logging
 import os
 from dotenv import load_dotenv
@@ -26,20 +29,94 @@ import numpy as np
 
 from .data_manager import TradeMemory, ModelLearner, FeatureEngineer, sanitize_dict_for_json
 from .coin_selector import CoinSelector
-from .exchange_manager import ExchangeManager
+from .exchange_manager import create_exchange
+from .entry_logic import CooldownState, _entry_decision
+from . import indicators as indicator_kernels
+from .indicators import ATR_WINDOW, BB_WINDOW, _atr_last_njit, _bb_position_last_njit, _net_profit_scalar
+from .position_table import PositionTable
 from .capital_manager import CapitalManager
 from .backtester import Backtester
 
 # Load Environment Variables
 load_dotenv()
 
-# Setup Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 핸들러 설정은 진입점(main.py, 실행 스크립트)에서 담당
 logger = logging.getLogger(__name__)
 
+# 쿨다운 배열 초기 크기 (티커 수가 넘으면 2배로 확장)
+MAX_TICKERS = 256
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# 환경변수 스펙: {BotConfig 필드: (환경변수 이름 또는 None(고정값), 변환 함수, 기본값)}
+_ENV_SPEC: Dict[str, Tuple[Optional[str], Callable[[str], object], object]] = {
+    "trade_amount": ("TRADE_AMOUNT", float, 10000.0),
+    "target_profit": ("TARGET_PROFIT", float, 0.02),
+    "stop_loss": ("STOP_LOSS", float, 0.02),
+    "rebuy_threshold": ("REBUY_THRESHOLD", float, 0.015),
+    "retrain_threshold": ("RETRAIN_THRESHOLD", int, 10),
+    "confidence_threshold": ("MODEL_CONFIDENCE_THRESHOLD", float, 0.7),
+    "trailing_stop_enabled": (None, bool, False),
+    "fee_rate": (None, float, 0.0005),  # 0.05% 편도, 업비트 기준
+    "use_net_profit": ("USE_NET_PROFIT", _parse_bool, True),
+    "use_dynamic_target": ("USE_DYNAMIC_TARGET", _parse_bool, False),
+    "use_dynamic_sizing": ("USE_DYNAMIC_SIZING", _parse_bool, False),
+    "max_position_size": ("MAX_POSITION_SIZE", float, 0.3),
+    "enable_volume_filter": ("ENABLE_VOLUME_FILTER", _parse_bool, True),
+    "min_volume_24h": ("MIN_VOLUME_24H", float, 100_000_000.0),  # 기본값: 1억원
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """
+    매매 설정 스냅샷 (불변)
+
+    환경변수는 생성 시 한 번만 읽고, 설정 변경은 새 인스턴스로 통째로 교체합니다.
+    (틱 처리 중에는 한 스냅샷만 보므로 일부만 바뀐 설정을 읽지 않음)
+    """
+    trade_amount: float
+    target_profit: float
+    stop_loss: float
+    rebuy_threshold: float  # 재매수 하락폭
+    retrain_threshold: int
+    confidence_threshold: float
+    trailing_stop_enabled: bool  # Trailing Stop 비활성화 (단순화)
+    fee_rate: float  # 거래소 수수료 (편도)
+    use_net_profit: bool  # 순수익 계산 활성화
+    use_dynamic_target: bool  # 동적 목표 수익률 활성화
+    use_dynamic_sizing: bool  # Kelly Criterion 기반 동적 매수 금액
+    max_position_size: float
+    enable_volume_filter: bool
+    min_volume_24h: float  # 최소 24시간 거래대금 (KRW)
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "BotConfig":
+        """_ENV_SPEC에 따라 환경변수를 한 번에 파싱 (없는 항목은 기본값)"""
+        env = os.environ if environ is None else environ
+        return cls(**{
+            field: (parse(env[name]) if name is not None and name in env else default)
+            for field, (name, parse, default) in _ENV_SPEC.items()
+        })
+
+
+class _ConfigField:
+    """TradingBot.<name> 읽기/쓰기를 self.cfg로 위임 (기존 API 호환)"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj.cfg, self.name)
+
+    def __set__(self, obj, value):
+        obj.cfg = replace(obj.cfg, **{self.name: value})
+
 
 class TradingBot:
     """
@@ -48,6 +125,22 @@ class TradingBot:
     Renaissance Technologies 스타일의 지속 학습 메커니즘을 탑재한
     자동 매매 봇입니다.
     """
+
+    # ⚙️ 매매 설정 (self.cfg 스냅샷에 위임)
+    trade_amount = _ConfigField()
+    target_profit = _ConfigField()
+    stop_loss = _ConfigField()
+    rebuy_threshold = _ConfigField()
+    retrain_threshold = _ConfigField()
+    confidence_threshold = _ConfigField()
+    trailing_stop_enabled = _ConfigField()
+    fee_rate = _ConfigField()
+    use_net_profit = _ConfigField()
+    use_dynamic_target = _ConfigField()
+    use_dynamic_sizing = _ConfigField()
+    max_position_size = _ConfigField()
+    enable_volume_filter = _ConfigField()
+    min_volume_24h = _ConfigField()
     
     def __init__(self):
         # Exchange Selection
@@ -71,38 +164,36 @@ class TradingBot:
             )
 
         # Initialize Exchange Manager
-        self.exchange = ExchangeManager(self.exchange_name, self.access_key, self.secret_key)
+        self.exchange = create_exchange(self.exchange_name, self.access_key, self.secret_key)
         
+        # 🔒 Thread Safety Locks
+        # positions/tickers는 Copy-on-Write: 쓰기는 락 + 컨테이너 교체, 읽기는 락 없이 스냅샷 사용
+        self._positions_lock = threading.Lock()
+        self._tickers_lock = threading.Lock()  # 티커 리스트 동시 접근 보호
+        # 백그라운드로 기록 중인 진입의 trade_id Future (티커별, 매도 시 실제 ID로 해석)
+        self._pending_trade_ids: Dict[str, "Future[int]"] = {}
+
         # Trading Configuration
-        # Trading Configuration
-        self.tickers = [os.getenv("TICKER", "BTC")] # Manage multiple tickers
+        self._tickers: List[str] = [os.getenv("TICKER", "BTC")] # Manage multiple tickers
+        self._tickers_set = frozenset(self._tickers)  # O(1) 멤버십 체크용 (_set_tickers로만 갱신)
+        self._universe_cache: Tuple = (None, None, frozenset())  # (tickers_set, positions, 감시+보유 티커)
         self.ticker = self.tickers[0] # Keep for backward compatibility with some UI parts if needed, serves as "primary"
         self.use_ai_selection = os.getenv("USE_AI_COIN_SELECTION", "true").lower() == "true"
-        self.trade_amount = float(os.getenv("TRADE_AMOUNT", 10000))
-        self.target_profit = float(os.getenv("TARGET_PROFIT", 0.02))
-        self.stop_loss = float(os.getenv("STOP_LOSS", 0.02))
-        self.rebuy_threshold = float(os.getenv("REBUY_THRESHOLD", 0.015))  # 재매수 하락폭
-        
-        # Learning Configuration
-        self.retrain_threshold = int(os.getenv("RETRAIN_THRESHOLD", 10))
-        self.confidence_threshold = float(os.getenv("MODEL_CONFIDENCE_THRESHOLD", 0.7))
-        
-        # 🆕 Trailing Stop Loss Configuration
-        # Trailing Stop 비활성화 (단순화)
-        self.trailing_stop_enabled = False
-
-        # 🚀 Advanced Profit Logic Configuration
-        self.fee_rate = 0.0005  # 거래소 수수료 (0.05% 편도, 업비트 기준)
-        self.use_net_profit = os.getenv("USE_NET_PROFIT", "true").lower() == "true"  # 순수익 계산 활성화
-        self.use_dynamic_target = os.getenv("USE_DYNAMIC_TARGET", "false").lower() == "true"  # 동적 목표 수익률 활성화
-        self.use_dynamic_sizing = os.getenv("USE_DYNAMIC_SIZING", "false").lower() == "true"  # Kelly Criterion 기반 동적 매수 금액
-
-        # Risk Management
-        self.max_position_size = float(os.getenv("MAX_POSITION_SIZE", 0.3))
-
-        # 🛡️ Volume Filter Configuration
-        self.enable_volume_filter = os.getenv("ENABLE_VOLUME_FILTER", "true").lower() == "true"
-        self.min_volume_24h = float(os.getenv("MIN_VOLUME_24H", 100_000_000))  # 기본값: 1억원
+
+        # ⚙️ 매매/학습/리스크 설정 (환경변수 1회 로드, 불변 스냅샷)
+        self.cfg = BotConfig.from_env()
+
+        # 📦 OHLCV TTL Cache {(ticker, interval): (fetched_at, df)}
+        self.ohlcv_cache_ttl = 30  # 초
+        self._ohlcv_cache: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}
+
+        # 📦 ATR 상태 {ticker: (진행 중 캔들 시각, 마감된 캔들까지의 ATR)} - Wilder 점화식으로 전진
+        self._atr_state: Dict[str, Tuple[pd.Timestamp, float]] = {}
+
+        # 📦 Features LRU Cache {(ticker, last_candle_ts, last_close, last_volume): features}
+        self.feat_cache_size = 128
+        self._feat_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._feat_cache_lock = threading.Lock()  # 진입 체크 스레드 풀에서 동시 접근
         
         # Data & Model Manager
         self.memory = TradeMemory()
@@ -113,6 +204,7 @@ class TradingBot:
 
         # 🔥 AI Coin Selector
         self.coin_selector = CoinSelector(self.learner, self.memory, self.exchange)
+        self.recommended_coins_version = 0  # 추천 목록이 교체될 때마다 증가 (API 응답 캐시 무효화용)
         self.recommended_coins = []  # 추천 코인 리스트 캐시
 
         # 📊 Backtester
@@ -120,21 +212,44 @@ class TradingBot:
 
         # Trading State
         self.is_running = False
-        self.positions: Dict[str, Dict] = {}  # {ticker: {position_info}}
+        self._positions: Mapping[str, Dict] = {}  # {ticker: {position_info}} (교체만, 제자리 수정 금지)
         self.thread: Optional[threading.Thread] = None
 
-        # 🔒 Thread Safety Locks
-        self._positions_lock = threading.Lock()
-        self._tickers_lock = threading.Lock()  # 티커 리스트 동시 접근 보호
+        # ⚡ Entry Check Worker Pool (티커별 진입 체크 병렬화)
+        self._entry_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("ENTRY_WORKERS", 8)),
+            thread_name_prefix="entry-check"
+        )
+        self.entry_check_timeout = 8  # 사이클당 진입 체크 최대 대기 (초)
+        self._btc_block_reason: Optional[str] = None  # 사이클당 1회 평가하는 BTC 하락 필터
+        self._entry_futures: Dict[str, Future] = {}  # {ticker: 진행 중인 진입 체크}
+
+        # 📡 Price Push (실시간 시세 → 청산 체크 즉시 실행)
+        self.loop_interval = 10  # 전체 사이클 주기 (초)
+        self.exit_check_min_interval = 1.0  # 푸시 기반 청산 체크 최소 간격 (초)
+        self._price_event = threading.Event()
+        self._stop_event = threading.Event()  # stop() 시 모든 대기 즉시 해제
+        self._pushed_prices: Dict[str, float] = {}  # {ticker: 최신 푸시 가격}
+        self._pushed_prices_lock = threading.Lock()
+        self._last_exit_check: Dict[str, float] = {}
+
+        # 💼 Holdings Cache (포지션 동기화용, 매매 시 또는 TTL 만료 시에만 재조회)
+        self.holdings_cache_ttl = 60  # 초
+        self._holdings_cache: Optional[Tuple[float, set]] = None  # (조회 시각, 보유 티커 집합)
+        self._holdings_dirty = True  # 매수/매도 직후 강제 갱신
 
         # 💾 Balance & Capital Cache (거래 시에만 업데이트)
         self._balance_cache = None
         self._capital_cache = None
         self._last_deposit_check = None  # 마지막 입출금 체크 시간
 
+        # 📊 Statistics Cache (UI 폴링용, 매도 시 무효화)
+        self.stats_cache_ttl = 0.5  # 초
+        self._stats_cache: Tuple[float, Optional[Dict]] = (float('-inf'), None)  # (조회 시각, 통계)
+        self._stats_dirty = True
+
         # 📉 Dynamic Ticker Management (자동 추가/제거)
         self.ticker_origin_range: Dict[str, Tuple[int, int]] = {}  # {ticker: (start, end) where it was added}
-        self._tickers_lock = threading.Lock()
         self._recommendations_lock = threading.Lock()
         
         # Performance Metrics (Session)
@@ -145,9 +260,12 @@ class TradingBot:
         self.is_updating_recommendations = False
         self.recommendation_thread = None
         
-        # 🔥 매도 후 재매수 방지 (쿨다운)
-        self.sold_coins_cooldown = {}  # {ticker: exit_price}
-        self.failed_buy_cooldown = {}  # {ticker: timestamp} -> 매수 실패 시 쿨다운
+        # 🔥 매도 후 재매수 방지 (쿨다운) - 티커 인덱스 기반 병렬 배열 (_positions_lock 보호)
+        self._ticker_idx: Dict[str, int] = {}  # {ticker: 배열 인덱스}
+        self._exit_price = np.zeros(MAX_TICKERS)  # 마지막 매도가
+        self._exit_is_profit = np.zeros(MAX_TICKERS, dtype=bool)  # 익절 매도 여부
+        self._cooldown_active = np.zeros(MAX_TICKERS, dtype=bool)  # 재매수 쿨다운 활성
+        self._failed_buy_at = np.full(MAX_TICKERS, np.nan)  # 매수 실패 시각 (time.monotonic) -> 1분 쿨다운
         
         # 🔄 Auto Recommendation Timer (5분마다 자동 업데이트 + 1위 종목 추가)
         self.auto_recommendation_enabled = True
@@ -156,13 +274,14 @@ class TradingBot:
         self.auto_timer_thread = None
         
         # 🔄 봇 초기화 시 포지션 자동 복구 (START 버튼 전에도 보유 코인 감지)
+        self._last_recovery_ts = float('-inf')  # 마지막 복구 성공 시각 (monotonic, 60초 내 재호출 시 생략)
         self._recover_positions()
         
         # 🛑 Max Drawdown Limit
         self.max_drawdown = 0.05  # -5% 손실 시 중단
         self.initial_balance = None
         self.peak_balance = None
-        self.last_mdd_check = 0  # 타임스탬프
+        self.last_mdd_check = float('-inf')  # time.monotonic() 기준
         
         logger.info("=" * 60)
         logger.info("🚀 Trading Bot Initialized")
@@ -176,6 +295,105 @@ class TradingBot:
         logger.info(f"   Auto Recommendation: {'✅ ON (5min)' if self.auto_recommendation_enabled else '❌ OFF'}")
         logger.info("=" * 60)
     
+    @property
+    def positions(self) -> Mapping[str, Dict]:
+        """보유 포지션 스냅샷 (읽기 전용, 락 불필요)"""
+        return self._positions
+
+    def _update_positions(self, mutator: Callable[[Dict[str, Dict]], None]):
+        """포지션 변경: 복사본에 mutator 적용 후 통째로 교체 (Copy-on-Write)"""
+        with self._positions_lock:
+            new_positions = dict(self._positions)
+            mutator(new_positions)
+            self._positions = new_positions
+
+    def _set_position(self, ticker: str, position: Dict):
+        self._update_positions(lambda p: p.__setitem__(ticker, position))
+
+    def _update_position_fields(self, ticker: str, **fields) -> Optional[Dict]:
+        """
+        기존 포지션의 일부 필드를 바꾼 새 dict로 교체 (없으면 None)
+
+        값이 모두 같으면 복사 없이 기존 dict를 반환합니다.
+        (매 틱 동적 목표 저장 시 포지션 dict/매핑을 새로 만들지 않음)
+        """
+        current = self._positions.get(ticker)
+        if current is not None and all(
+            k in current and current[k] == v for k, v in fields.items()
+        ):
+            return current
+
+        updated = None
+
+        def mutate(p: Dict[str, Dict]):
+            nonlocal updated
+            if ticker in p:
+                updated = {**p[ticker], **fields}
+                p[ticker] = updated
+
+        self._update_positions(mutate)
+        return updated
+
+    def _remove_position(self, ticker: str):
+        self._update_positions(lambda p: p.pop(ticker, None))
+
+    @property
+    def recommended_coins(self) -> List[Dict]:
+        """추천 코인 리스트 스냅샷 (갱신 시 리스트를 통째로 교체)"""
+        return self._recommended_coins
+
+    @recommended_coins.setter
+    def recommended_coins(self, value: List[Dict]):
+        self._recommended_coins = value
+        self.recommended_coins_version += 1
+
+    @property
+    def tickers(self) -> List[str]:
+        """감시 티커 스냅샷 (읽기 전용, 락 불필요)"""
+        return self._tickers
+
+    @tickers.setter
+    def tickers(self, value: List[str]):
+        with self._tickers_lock:
+            self._set_tickers(list(value))
+
+    def has_ticker(self, ticker: str) -> bool:
+        """감시 목록 포함 여부 (set 조회, 락 불필요)"""
+        return ticker in self._tickers_set
+
+    def _set_tickers(self, tickers: List[str]):
+        """감시 목록 교체 (리스트와 멤버십 set을 함께 갱신, _tickers_lock 보유 상태에서 호출)"""
+        self._tickers = tickers
+        self._tickers_set = frozenset(tickers)
+
+    def _add_ticker(self, ticker: str) -> bool:
+        """감시 목록에 티커 추가 (_tickers_lock 보유 상태에서 호출). 추가했으면 True"""
+        if ticker in self._tickers_set:
+            return False
+        self._set_tickers(self._tickers + [ticker])
+        return True
+
+    def _active_universe(self) -> frozenset:
+        """
+        감시 티커 ∪ 보유 티커 (두 Copy-on-Write 스냅샷이 바뀔 때만 다시 계산)
+        """
+        tickers_set, positions = self._tickers_set, self._positions
+        cached_tickers, cached_positions, universe = self._universe_cache
+        if cached_tickers is tickers_set and cached_positions is positions:
+            return universe
+        universe = tickers_set.union(positions)
+        self._universe_cache = (tickers_set, positions, universe)
+        return universe
+
+    def _remove_ticker(self, ticker: str) -> bool:
+        """감시 목록에서 티커 제거 (출처 범위 정보도 삭제). 제거했으면 True"""
+        with self._tickers_lock:  # 🔒 Thread-safe
+            self.ticker_origin_range.pop(ticker, None)
+            if ticker not in self._tickers_set:
+                return False
+            self._set_tickers([t for t in self._tickers if t != ticker])
+            return True
+
     def start(self):
         """봇 시작 (백그라운드 스레드)"""
         if self.is_running:
@@ -183,6 +401,7 @@ class TradingBot:
             return
         
         self.is_running = True
+        self._stop_event.clear()
         
         # 🛡️ MDD 초기화
         try:
@@ -203,7 +422,7 @@ class TradingBot:
         if self.auto_recommendation_enabled:
             self.auto_timer_thread = threading.Thread(target=self._auto_recommendation_timer, daemon=True)
             self.auto_timer_thread.start()
-            logger.info("⏰ Auto recommendation timer started (5-min interval)")
+            logger.info(f"⏰ Auto recommendation timer started ({self.auto_recommendation_interval}s interval)")
         
         logger.info("✅ Bot STARTED")
     
@@ -214,8 +433,15 @@ class TradingBot:
             return
         
         self.is_running = False
+        self._stop_event.set()
+        self._price_event.set()  # 대기 중인 트레이딩 루프 즉시 깨우기
         if self.thread:
             self.thread.join(timeout=5)
+        if self.auto_timer_thread:
+            self.auto_timer_thread.join(timeout=5)
+        self._atr_state.clear()
+        with self._feat_cache_lock:
+            self._feat_cache.clear()
         logger.info("🛑 Bot STOPPED")
     
     def _check_drawdown_limit(self):
@@ -226,9 +452,9 @@ class TradingBot:
         """
         try:
             # 1. API 호출 제한 (30초마다 체크 - 급락 대응 개선)
-            if time.time() - self.last_mdd_check < 30:
+            if time.monotonic() - self.last_mdd_check < 30:
                 return False
-            self.last_mdd_check = time.time()
+            self.last_mdd_check = time.monotonic()
             
             # 2. 전체 자산 계산
             # KRW 잔고
@@ -237,17 +463,13 @@ class TradingBot:
             
             # 보유 코인 가치
             holdings = self.exchange.get_holdings()
-            coin_value = 0
             
-            for h in holdings:
-                ticker = h['ticker']
-                amount = h['amount']
-                # 현재가 조회 (없으면 평단가 사용)
-                cp = self.exchange.get_current_price(ticker)
-                if not cp:
-                    cp = h.get('avg_buy_price', 0)
-                
-                coin_value += amount * cp
+            # 현재가 일괄 조회 (없으면 평단가 사용)
+            prices = self.exchange.get_current_prices([h['ticker'] for h in holdings])
+            coin_value = sum(
+                h['amount'] * (prices.get(h['ticker']) or h.get('avg_buy_price', 0))
+                for h in holdings
+            )
             
             total_equity = cash + coin_value
             
@@ -290,9 +512,18 @@ class TradingBot:
         """
         메인 트레이딩 루프
         
-        60초 주기로 시장을 모니터링하고 매매 로직을 실행합니다.
+        loop_interval(10초) 주기로 전체 사이클을 실행하고, 그 사이에는
+        보유 코인의 가격 푸시 이벤트로 깨어나 즉시 청산 조건을 체크합니다.
         """
         logger.info("🔄 Trading Loop Started")
+
+        # ⚡ 지표 커널 JIT 준비 (디스크 캐시 로드 또는 컴파일, 첫 틱 지연 방지)
+        try:
+            started_at = time.monotonic()
+            indicator_kernels.warmup()
+            logger.info(f"⚡ Indicator kernels ready ({time.monotonic() - started_at:.2f}s)")
+        except Exception as e:
+            logger.warning(f"⚠️ Indicator kernel warmup failed: {e}")
         
         if self.learner.model is None:
             self._initial_training()
@@ -300,50 +531,178 @@ class TradingBot:
         # Recover positions from exchange (Sync)
         self._recover_positions()
         
+        # 📡 실시간 시세 푸시 구독 (보유 포지션 청산 체크를 즉시 트리거)
+        price_stream = getattr(self.exchange, 'price_stream', None)
+        if price_stream is not None:
+            price_stream.add_listener(self._on_price_update)
+            price_stream.set_tickers(self._active_universe())
+
+        next_cycle_at = 0.0
         while self.is_running:
+            # 처리 전에 이벤트를 내려야 처리 중 들어온 푸시가 유실되지 않음
+            self._price_event.clear()
             try:
-                # 🛑 MDD 체크 (비상 정지)
-                if self._check_drawdown_limit():
-                    break
-                
-                # 1. 포지션 조회 (업비트 실시간 싱크)
-                self._sync_positions_with_exchange()
-                
-                # 1. 포지션 체크 (모든 보유 포지션)
-                for ticker in list(self.positions.keys()):
-                    self._check_exit_conditions(ticker)
-                
-                # 2. 진입 체크 (모든 선택된 티커)
-                # 🛡️ 잔액 사전 체크: 잔액 부족 시 전체 매수 스킵
-                balance_info = self.get_account_balance()
-                available_krw = balance_info.get('krw_balance', 0)
-                
-                if available_krw < self.trade_amount:
-                    logger.debug(f"💸 Insufficient balance ({available_krw:,.0f} KRW). Skipping all buy checks.")
+                if time.monotonic() >= next_cycle_at:
+                    # 🔁 전체 사이클 (10초 주기)
+                    if self._run_trading_cycle():
+                        break
+                    next_cycle_at = time.monotonic() + self.loop_interval
                 else:
-                    # 🔒 Thread-safe: 티커 리스트 복사본 생성
-                    with self._tickers_lock:
-                        tickers_snapshot = self.tickers[:]
-
-                    for ticker in tickers_snapshot:
-                        # 이미 포지션이 있는 코인은 건너뜀
-                        if ticker not in self.positions:
-                            self._check_entry_conditions(ticker)
-                
-                # 2. 대기 (10초)
-                time.sleep(10)
-                
+                    # 📡 가격 푸시로 깨어난 경우: 변동된 보유 코인만 청산 체크
+                    self._check_pushed_exits()
+
             except Exception as e:
                 logger.error(f"❌ Error in trading loop: {e}")
-                time.sleep(10)
+                # 전체 사이클은 다음 주기로 미루되, 그 사이 가격 푸시 청산 체크는 계속
+                next_cycle_at = time.monotonic() + self.loop_interval
+
+            # 대기: 다음 사이클까지 또는 보유 코인 가격 변동 시 즉시 깨어남
+            timeout = max(0.0, next_cycle_at - time.monotonic())
+            if self._pushed_prices:
+                # 체크 간격 제한으로 미뤄진 푸시가 있으면 제한이 풀리는 시점에 재시도
+                timeout = min(timeout, self.exit_check_min_interval)
+            self._price_event.wait(timeout=timeout)
         
         logger.info("🔄 Trading Loop Stopped")
 
+    def _run_trading_cycle(self) -> bool:
+        """
+        전체 트레이딩 사이클 1회 실행 (MDD → 포지션 싱크 → 청산 → 진입)
+
+        Returns:
+            True면 MDD 한도 도달로 루프 종료
+        """
+        # 🛑 MDD 체크 (비상 정지)
+        if self._check_drawdown_limit():
+            return True
+        
+        # 1. 포지션 조회 (업비트 실시간 싱크)
+        self._sync_positions_with_exchange()
+
+        # 📡 실시간 시세 구독을 보유 + 감시 티커로 맞춤 (바뀐 경우에만 구독 요청 재전송)
+        price_stream = self.exchange.price_stream
+        if price_stream is not None:
+            price_stream.set_tickers(self._active_universe())
+        
+        # 📦 보유 포지션 + 감시 티커 현재가를 사이클당 한 번에 조회 (N회 → 1회 요청)
+        held = self.positions
+        prices = self.exchange.get_current_prices(list(dict.fromkeys([*held, *self.tickers])))
+
+        # 1. 포지션 체크: 목표/손절 도달분은 벡터 판정으로 바로 청산, 나머지만 개별 체크
+        exited = self._sell_screened_exits(held, prices)
+        for ticker in held:
+            if ticker in exited:
+                continue
+            # 배치 조회 실패한 티커는 개별 조회
+            self._check_exit_conditions(ticker, current_price=prices.get(ticker))
+        
+        # 2. 진입 체크 (모든 선택된 티커)
+        # 🛡️ 잔액 사전 체크: 잔액 부족 시 전체 매수 스킵
+        balance_info = self.get_account_balance()
+        available_krw = balance_info.get('krw_balance', 0)
+        
+        if available_krw < self.trade_amount:
+            logger.debug(f"💸 Insufficient balance ({available_krw:,.0f} KRW). Skipping all buy checks.")
+            return False
+
+        # 🔒 Copy-on-Write 스냅샷 (락 없이 읽기)
+        tickers_snapshot = self.tickers
+        positions_snapshot = self.positions
+
+        # 📦 BTC 하락 필터는 사이클당 한 번만 평가 (모든 알트코인에 공통)
+        self._btc_block_reason = self._evaluate_btc_gate(self._cached_ohlcv('BTC'))
+        if self._btc_block_reason:
+            logger.debug(f"🚫 {self._btc_block_reason}. Skipping altcoin entries this cycle.")
+
+        # ⚡ 티커별 진입 체크 병렬 실행 (I/O 대기 중첩)
+        for ticker in tickers_snapshot:
+            # 이미 포지션이 있는 코인은 건너뜀
+            if ticker in positions_snapshot:
+                continue
+            # BTC 하락 중이면 알트코인은 OHLCV 조회부터 생략
+            if self._btc_block_reason and ticker != 'BTC':
+                continue
+            # 이전 사이클 체크가 아직 진행 중이면 중복 제출하지 않음 (중복 매수 방지)
+            pending = self._entry_futures.get(ticker)
+            if pending is not None and not pending.done():
+                continue
+            self._entry_futures[ticker] = self._entry_pool.submit(
+                self._fetch_and_check_entry, ticker, prices.get(ticker)
+            )
+        wait(list(self._entry_futures.values()), timeout=self.entry_check_timeout)
+        self._entry_futures = {t: f for t, f in self._entry_futures.items() if not f.done()}
+        return False
+
+    def _sell_screened_exits(self, held: Mapping[str, Dict], prices: Dict[str, float]) -> set:
+        """
+        모든 보유 포지션의 목표 수익률/손절 도달을 NumPy로 한 번에 판정하여 청산
+
+        동적 목표는 직전 체크에서 포지션에 저장한 값을 사용하며, 아직 없으면
+        판정하지 않고 _check_exit_conditions로 넘깁니다.
+
+        Returns:
+            청산을 시도한 티커 집합
+        """
+        if not held:
+            return set()
+
+        cfg = self.cfg
+        table = PositionTable.from_positions(held)
+        current = table.price_vector(prices)
+        rates = table.profit_rates(current, cfg.fee_rate if cfg.use_net_profit else None)
+        if cfg.use_dynamic_target:
+            targets = table.dynamic_target
+        else:
+            targets = np.full(len(table), cfg.target_profit)
+        target_idx, stop_idx = table.exit_masks(rates, targets, cfg.stop_loss)
+
+        exited = set()
+        for i in target_idx:
+            ticker = table.tickers[i]
+            logger.info(f"📊 [{ticker}] Profit:{rates[i]*100:.2f}% >= Target:{targets[i]*100:.1f}%")
+            self._execute_sell(ticker, float(current[i]), f"Target Profit ({targets[i]*100:.1f}%)")
+            exited.add(ticker)
+        for i in stop_idx:
+            ticker = table.tickers[i]
+            logger.info(f"📊 [{ticker}] Profit:{rates[i]*100:.2f}% <= Stop:-{cfg.stop_loss*100:.1f}%")
+            self._execute_sell(ticker, float(current[i]), f"Stop Loss ({cfg.stop_loss*100:.1f}%)")
+            exited.add(ticker)
+        return exited
+
+    def _on_price_update(self, ticker: str, price: float):
+        """📡 실시간 시세 콜백 (스트림 스레드): 보유 코인이면 트레이딩 루프를 깨움"""
+        if ticker not in self.positions:
+            return
+        with self._pushed_prices_lock:
+            self._pushed_prices[ticker] = price
+        self._price_event.set()
+
+    def _check_pushed_exits(self):
+        """가격 푸시가 들어온 보유 코인만 청산 조건 체크"""
+        with self._pushed_prices_lock:
+            pushed, self._pushed_prices = self._pushed_prices, {}
+
+        now = time.monotonic()
+        for ticker, price in pushed.items():
+            # 같은 코인을 너무 자주 체크하지 않도록 제한 (다음 깨어날 때 재시도)
+            if now - self._last_exit_check.get(ticker, float('-inf')) < self.exit_check_min_interval:
+                with self._pushed_prices_lock:
+                    self._pushed_prices.setdefault(ticker, price)
+                continue
+            self._last_exit_check[ticker] = now
+            self._check_exit_conditions(ticker, current_price=price)
+
     def _recover_positions(self):
         """
         거래소 잔고를 조회하여 누락된 포지션을 복구합니다.
         (재시작 시 포지션 유지용 - 보유 시간도 유지)
+
+        __init__과 트레이딩 루프 시작 시 모두 호출되므로, 60초 내 재호출은 생략합니다.
         """
+        if time.monotonic() - self._last_recovery_ts < 60:
+            logger.info("ℹ️ Positions recovered recently. Skipping exchange sync.")
+            return
+
         logger.info("🔄 Syncing positions from exchange...")
         try:
             # 0. DB에서 열린 포지션 조회 (진입 시간 복구용)
@@ -353,6 +712,13 @@ class TradingBot:
             # 1. 모든 보유 코인 조회 (Upbit API 사용)
             holdings = self.exchange.get_holdings()
             
+            # 평단가가 없는 코인만 현재가 일괄 조회
+            no_avg_tickers = [
+                h['ticker'] for h in holdings
+                if h['avg_buy_price'] <= 0 and h['ticker'] not in self.positions
+            ]
+            prices = self.exchange.get_current_prices(no_avg_tickers) if no_avg_tickers else {}
+            
             for item in holdings:
                 ticker = item['ticker']
                 amount = item['amount']
@@ -364,7 +730,7 @@ class TradingBot:
                 # 포지션 등록 (평단가 정보 활용)
                 entry_price = avg_price
                 if entry_price <= 0:
-                     entry_price = self.exchange.get_current_price(ticker) or 0
+                     entry_price = prices.get(ticker, 0)
                 
                 if entry_price <= 0:
                     continue
@@ -375,60 +741,74 @@ class TradingBot:
                     trade_id = db_entry['id']
                     entry_time_str = db_entry['entry_time']
                     try:
-                        entry_time = datetime.fromisoformat(entry_time_str)
+                        entry_ts = datetime.fromisoformat(entry_time_str).timestamp()
                     except:
-                        entry_time = datetime.now()
+                        entry_ts = time.time()
                     logger.info(f"♻️ Recovered Position: {ticker} (Amt: {amount:.4f}, Avg: {entry_price:,.0f}, EntryTime: {entry_time_str})")
                 else:
                     trade_id = f"recovered_{ticker}_{int(time.time())}"
-                    entry_time = datetime.now()
+                    entry_ts = time.time()
                     logger.info(f"♻️ New Position: {ticker} (Amt: {amount:.4f}, Avg: {entry_price:,.0f})")
 
-                self.positions[ticker] = {
+                self._set_position(ticker, {
                     "ticker": ticker,
                     "trade_id": trade_id,
                     "entry_price": entry_price,
                     "amount": amount,
-                    "entry_time": entry_time  # 🔥 DB에서 복구된 시간!
-                }
+                    "entry_ts": entry_ts  # 🔥 DB에서 복구된 시간! (epoch 초, 표시할 때만 datetime 변환)
+                })
 
                 # 감시 목록(Tickers)에 자동 추가 (포지션 보호를 위해)
                 with self._tickers_lock:  # 🔒 Thread-safe
-                    if ticker not in self.tickers:
-                        self.tickers.append(ticker)
+                    if self._add_ticker(ticker):
                         logger.info(f"➕ Auto-added to watch list: {ticker}")
             
             logger.info(f"✅ Position Recovery Complete. Managing {len(self.positions)} positions.")
+            self._last_recovery_ts = time.monotonic()
             
         except Exception as e:
             logger.error(f"❌ Position recovery failed: {e}")
     
+    def _get_holdings_cached(self, ttl: float = None) -> set:
+        """
+        보유 티커 집합 조회 (TTL 캐시, 매수/매도 후에는 즉시 재조회)
+        """
+        ttl = self.holdings_cache_ttl if ttl is None else ttl
+        now = time.monotonic()
+        if (self._holdings_dirty or self._holdings_cache is None
+                or now - self._holdings_cache[0] >= ttl):
+            holdings = self.exchange.get_holdings()
+            self._holdings_cache = (now, {h['ticker'] for h in holdings})
+            self._holdings_dirty = False
+        return self._holdings_cache[1]
+
     def _sync_positions_with_exchange(self):
         """
         실시간 잔고 조회하여 수동 매도된 포지션 제거
+
+        매매가 없었고 마지막 조회 후 holdings_cache_ttl이 지나지 않았으면 생략합니다.
         """
         try:
-            holdings = self.exchange.get_holdings()
-            holding_tickers = {h['ticker'] for h in holdings}
+            if (not self._holdings_dirty and self._holdings_cache is not None
+                    and time.monotonic() - self._holdings_cache[0] < self.holdings_cache_ttl):
+                return
+
+            holding_tickers = self._get_holdings_cached()
             
             # 봇은 포지션으로 인식하고 있지만, 거래소에는 없는 코인 찾기
-            removed_tickers = []
-            for ticker in list(self.positions.keys()):
-                if ticker not in holding_tickers:
-                    removed_tickers.append(ticker)
-                    del self.positions[ticker]
+            removed_tickers = [t for t in self.positions if t not in holding_tickers]
+            if removed_tickers:
+                def drop_removed(p: Dict[str, Dict]):
+                    for t in removed_tickers:
+                        p.pop(t, None)
+                self._update_positions(drop_removed)
             
             # 로그 출력
             if removed_tickers:
                 for ticker in removed_tickers:
                     logger.info(f"🗑️ Position removed: {ticker} (Sold manually or insufficient balance)")
-                    # Active Tickers에서도 제거
-                    with self._tickers_lock:  # 🔒 Thread-safe
-                        if ticker in self.tickers:
-                            self.tickers.remove(ticker)
-                        # 출처 범위 정보도 삭제
-                        if ticker in self.ticker_origin_range:
-                            del self.ticker_origin_range[ticker]
+                    # Active Tickers에서도 제거 (출처 범위 정보도 삭제)
+                    self._remove_ticker(ticker)
         
         except Exception as e:
             logger.error(f"❌ Position sync failed: {e}")
@@ -443,8 +823,8 @@ class TradingBot:
         
         try:
             # 과거 30일 데이터 수집 (Primary Ticker 기준)
-            with self._tickers_lock:  # 🔒 Thread-safe read
-                primary_ticker = self.tickers[0] if self.tickers else "BTC"
+            tickers = self.tickers  # 스냅샷
+            primary_ticker = tickers[0] if tickers else "BTC"
             df = self.exchange.get_ohlcv(primary_ticker, interval="day")
             
             if df is None or len(df) < 30:
@@ -452,29 +832,13 @@ class TradingBot:
                 return
             
             # 특징 추출 및 라벨 생성 (단순화: 다음 날 상승 여부)
-            features_list = []
-            labels = []
-            
-            for i in range(len(df) - 1):
-                # i번째 날의 특징 추출
-                window_df = df.iloc[:i+1]
-                if len(window_df) < 30:
-                    continue
-                
-                features = FeatureEngineer.extract_features(window_df)
-                if not features:
-                    continue
-                
-                # 다음 날 상승 여부 (라벨)
-                next_day_return = (df.iloc[i+1]['close'] - df.iloc[i]['close']) / df.iloc[i]['close']
-                label = 1 if next_day_return > 0 else 0
-                
-                features_list.append(features)
-                labels.append(label)
-            
-            # DataFrame으로 변환
-            X = pd.DataFrame(features_list)
-            y = pd.Series(labels)
+            # 전체 구간을 한 번에 계산 후, 30일 이상 데이터가 쌓인 날부터 마지막 전날까지 사용
+            features_df = FeatureEngineer.extract_features_batch(df)
+            X = features_df.iloc[29:-1].reset_index(drop=True)
+
+            # 다음 날 상승 여부 (라벨)
+            next_day_up = (df['close'].shift(-1) > df['close']).astype(int)
+            y = next_day_up.iloc[29:-1].reset_index(drop=True)
             
             # 모델 학습
             if len(X) >= 30:
@@ -486,177 +850,201 @@ class TradingBot:
         except Exception as e:
             logger.error(f"❌ Initial training failed: {e}")
     
-    def _check_entry_conditions(self, ticker: str):
+    def _cached_ohlcv(self, ticker: str, interval: str = "day") -> Optional[pd.DataFrame]:
+        """
+        OHLCV 조회 (TTL 캐시)
+
+        같은 사이클 안에서 동일한 (ticker, interval)을 반복 조회하지 않도록
+        self.ohlcv_cache_ttl 초 동안 결과를 재사용합니다.
+        """
+        key = (ticker, interval)
+        now = time.monotonic()
+        cached = self._ohlcv_cache.get(key)
+        if cached is not None and now - cached[0] < self.ohlcv_cache_ttl:
+            return cached[1]
+
+        df = self.exchange.get_ohlcv(ticker, interval=interval)
+        if df is not None:
+            self._ohlcv_cache[key] = (now, df)
+        return df
+
+    def _features(self, ticker: str, df: pd.DataFrame) -> Dict:
+        """
+        FeatureEngineer.extract_features 결과 LRU 캐시
+
+        키에 마지막 캔들의 시각뿐 아니라 종가/거래량도 포함하므로, 진행 중인
+        캔들이 갱신되면 재계산하고 같은 데이터면 재사용합니다.
+        """
+        last = df.iloc[-1]
+        key = (ticker, df.index[-1], float(last['close']), float(last['volume']))
+        with self._feat_cache_lock:
+            features = self._feat_cache.get(key)
+            if features is not None:
+                self._feat_cache.move_to_end(key)
+                return features
+
+        features = FeatureEngineer.extract_features(df)
+        if features:
+            with self._feat_cache_lock:
+                self._feat_cache[key] = features
+                self._feat_cache.move_to_end(key)
+                while len(self._feat_cache) > self.feat_cache_size:
+                    self._feat_cache.popitem(last=False)
+        return features
+
+    def _fetch_and_check_entry(self, ticker: str, current_price: Optional[float] = None):
+        """진입 체크 작업 단위 (스레드 풀에서 실행, 사이클 배치 시세가 없으면 개별 조회)"""
+        df = self._cached_ohlcv(ticker)
+        if current_price is None:
+            current_price = self.exchange.get_current_price(ticker)
+        self._check_entry_conditions(ticker, df, current_price)
+
+    @staticmethod
+    def _evaluate_btc_gate(btc_df: Optional[pd.DataFrame]) -> Optional[str]:
+        """
+        비트코인 상관관계 체크: BTC 하락 시 알트코인 진입 금지 (하이브리드 방식)
+
+        Returns:
+            차단 사유 문자열 (차단하지 않으면 None)
+        """
+        if btc_df is None:
+            return None
+        close = btc_df['close'].to_numpy()
+
+        # 🔧 조건 1: 전일 대비 -3% 체크
+        if len(close) >= 2:
+            btc_daily_trend = (close[-1] - close[-2]) / close[-2]
+            if btc_daily_trend < -0.03:  # 전일 대비 -3%
+                return f"BTC declining {btc_daily_trend*100:.1f}% (vs yesterday)"
+
+        # 🔧 조건 2: 당일 급락 -5% 체크 (분봉 기준)
+        if len(close) >= 60:
+            btc_intraday_trend = (close[-1] - close[-60]) / close[-60]  # 1시간 전 대비
+            if btc_intraday_trend < -0.05:  # 1시간 내 -5%
+                return f"BTC flash crash {btc_intraday_trend*100:.1f}% (1h)"
+
+        return None
+
+    def _ticker_slot(self, ticker: str) -> int:
+        """
+        쿨다운 배열에서 티커의 인덱스 반환 (처음 보는 티커는 새 슬롯 할당)
+
+        _positions_lock을 잡은 상태에서 호출해야 합니다.
+        """
+        i = self._ticker_idx.get(ticker)
+        if i is None:
+            i = len(self._ticker_idx)
+            if i >= len(self._exit_price):
+                # 배열이 가득 차면 2배로 확장
+                grow = len(self._exit_price)
+                self._exit_price = np.concatenate([self._exit_price, np.zeros(grow)])
+                self._exit_is_profit = np.concatenate([self._exit_is_profit, np.zeros(grow, dtype=bool)])
+                self._cooldown_active = np.concatenate([self._cooldown_active, np.zeros(grow, dtype=bool)])
+                self._failed_buy_at = np.concatenate([self._failed_buy_at, np.full(grow, np.nan)])
+            self._ticker_idx[ticker] = i
+        return i
+
+    def _check_entry_conditions(self, ticker: str, df: Optional[pd.DataFrame],
+                                current_price: Optional[float]):
         """
         매수 조건 체크 및 진입
+
+        Args:
+            ticker: 티커
+            df: 해당 티커의 OHLCV (루프에서 한 번 조회)
+            current_price: 현재가
         """
+        cfg = self.cfg  # 이번 체크 동안 사용할 설정 스냅샷
         try:
             # 🚫 매수 실패 쿨다운 체크 (1분)
-            if ticker in self.failed_buy_cooldown:
-                last_fail_time = self.failed_buy_cooldown[ticker]
-                if datetime.now() - last_fail_time < timedelta(minutes=1):
-                    # 쿨다운 중이면 스킵
-                    return
-                else:
+            with self._positions_lock:
+                i = self._ticker_slot(ticker)
+                last_fail_at = self._failed_buy_at[i]
+                if last_fail_at == last_fail_at:  # NaN이 아니면 실패 기록 있음
+                    if time.monotonic() - last_fail_at < 60:
+                        # 쿨다운 중이면 스킵
+                        return
                     # 시간 지났으면 해제 및 재도전 허용
-                    del self.failed_buy_cooldown[ticker]
+                    self._failed_buy_at[i] = np.nan
                     logger.info(f"🔓 {ticker} buy cooldown released.")
 
-            # 1. 비트코인 상관관계 체크: BTC 하락 시 알트코인 진입 금지 (하이브리드 방식)
-            if ticker != 'BTC':  # BTC 자체는 체크 안 함
-                # 🔧 조건 1: 전일 대비 -3% 체크
-                btc_daily = self.exchange.get_ohlcv('BTC', interval='day')
-                if btc_daily is not None and len(btc_daily) >= 2:
-                    btc_today = btc_daily['close'].iloc[-1]
-                    btc_yesterday = btc_daily['close'].iloc[-2]
-                    btc_daily_trend = (btc_today - btc_yesterday) / btc_yesterday
-                    if btc_daily_trend < -0.03:  # 전일 대비 -3%
-                        logger.debug(f"🚫 [{ticker}] BTC declining {btc_daily_trend*100:.1f}% (vs yesterday). Skipping altcoin entry.")
-                        return
-
-                # 🔧 조건 2: 당일 급락 -5% 체크 (분봉 기준)
-                btc_minute = self.exchange.get_ohlcv('BTC')
-                if btc_minute is not None and len(btc_minute) >= 60:
-                    btc_now = btc_minute['close'].iloc[-1]
-                    btc_1h_ago = btc_minute['close'].iloc[-60]  # 1시간 전
-                    btc_intraday_trend = (btc_now - btc_1h_ago) / btc_1h_ago
-                    if btc_intraday_trend < -0.05:  # 1시간 내 -5%
-                        logger.debug(f"🚫 [{ticker}] BTC flash crash {btc_intraday_trend*100:.1f}% (1h). Skipping altcoin entry.")
-                        return
+            # 1. 비트코인 상관관계 체크 (사이클 시작 시 평가한 결과 사용, BTC 자체는 체크 안 함)
+            if ticker != 'BTC' and self._btc_block_reason:
+                logger.debug(f"🚫 [{ticker}] {self._btc_block_reason}. Skipping altcoin entry.")
+                return
 
-            # 2. 현재 데이터 수집
-            df = self.exchange.get_ohlcv(ticker)
+            # 2. 현재 데이터 확인
             if df is None or len(df) < 30:
                 return
             
             # 🛡️ 최소 가격 필터 (저가 코인 제외)
-            current_price = self.exchange.get_current_price(ticker)
             MIN_PRICE = 100  # 100원 미만 코인 제외
             if current_price and current_price < MIN_PRICE:
                 logger.debug(f"⚠️ [{ticker}] Price too low ({current_price} KRW), skipping")
                 return
 
             # 🛡️ 거래량 검증: 최소 24시간 거래량 체크 (슬리피지 방지)
-            if self.enable_volume_filter and len(df) >= 24 and current_price:
-                volume_24h = df['volume'].iloc[-24:].sum() * current_price
-                if volume_24h < self.min_volume_24h:
-                    logger.debug(f"⚠️ [{ticker}] 24h volume too low: {volume_24h:,.0f} KRW (min: {self.min_volume_24h:,.0f}), skipping")
+            if cfg.enable_volume_filter and len(df) >= 24 and current_price:
+                volume_24h = float(df['volume'].to_numpy()[-24:].sum()) * current_price
+                if volume_24h < cfg.min_volume_24h:
+                    logger.debug(f"⚠️ [{ticker}] 24h volume too low: {volume_24h:,.0f} KRW (min: {cfg.min_volume_24h:,.0f}), skipping")
                     return
 
-            # 2. 특징 추출
-            features = FeatureEngineer.extract_features(df)
+            # 2. 특징 추출 (마지막 캔들이 그대로면 캐시 재사용)
+            features = self._features(ticker, df)
             if not features:
                 return
             
             # 3. AI 예측
-            features_df = FeatureEngineer.features_to_dataframe(features)
-            prediction, confidence = self.learner.predict(features_df)
-            
-            # 4. 매수 조건 평가 (단순화)
-            rsi = features['rsi']
-            bb_position = features['bb_position']
-
-            # 🔥 단순화된 지표 (과적합 방지)
-            ema_9 = features.get('ema_9', 0)
-            ema_21 = features.get('ema_21', 0)
-            macd = features.get('macd', 0)
-            macd_signal_val = features.get('macd_signal', 0)
-
-            # 추세 확인
-            trend_up = ema_9 > ema_21  # 상승 추세
-            price_change = features.get('price_change_15m', 0)
-            not_crashing = price_change > -0.05  # 급락 아님 (-5% 이상)
-
-            # 과매도 조건: RSI < 35 OR BB < 0.25
-            oversold = (rsi < 35) or (bb_position < 0.25)
-
-            # MACD 골든크로스
-            macd_golden_cross = macd > macd_signal_val
+            prediction, confidence = self.learner.predict_fast(FeatureEngineer.features_to_array(features))
             
             # 🛡️ 중복 매수 방지: 이미 포지션이 있으면 스킵
             if ticker in self.positions:
                 logger.debug(f"📊 [{ticker}] Already in position. Skipping buy.")
                 return
             
-            # 🚫 쿨다운 체크: 익절/손절에 따라 다른 로직
-            if ticker in self.sold_coins_cooldown:
-                cooldown_info = self.sold_coins_cooldown[ticker]
-                
-                # 🔧 하위 호환성: 기존 float 형식 처리
-                if isinstance(cooldown_info, (int, float)):
-                    # 기존 형식 → 새 형식으로 변환 (익절로 가정)
-                    cooldown_info = {'exit_price': cooldown_info, 'reason': 'Target Profit'}
-                    self.sold_coins_cooldown[ticker] = cooldown_info
-                
-                last_exit_price = cooldown_info['exit_price']
-                exit_reason = cooldown_info['reason']
-                current_price = self.exchange.get_current_price(ticker)
-                
-                if not current_price:
-                    return
-                
-                # 익절 케이스: 가격 하락 시 재매수
-                if 'Profit' in exit_reason:
-                    rebuy_price_threshold = last_exit_price * (1 - self.rebuy_threshold)
-                    
-                    if current_price >= rebuy_price_threshold:
-                        logger.debug(
-                            f"🚫 [{ticker}] Profit cooldown active. "
-                            f"Current: {current_price:,.0f} >= Threshold: {rebuy_price_threshold:,.0f}"
-                        )
-                        return
-                    else:
-                        drop_pct = (last_exit_price - current_price) / last_exit_price * 100
-                        logger.info(
-                            f"✅ [{ticker}] Profit cooldown released! "
-                            f"Price dropped {drop_pct:.1f}%"
-                        )
-                
-                # 손절 케이스: 가격 회복 시 재매수
-                else:
-                    rebuy_price_threshold = last_exit_price * (1 + self.rebuy_threshold)
-                    
-                    if current_price <= rebuy_price_threshold:
-                        logger.debug(
-                            f"🚫 [{ticker}] Loss cooldown active. "
-                            f"Current: {current_price:,.0f} <= Threshold: {rebuy_price_threshold:,.0f}"
-                        )
-                        return
-                    else:
-                        rise_pct = (current_price - last_exit_price) / last_exit_price * 100
-                        logger.info(
-                            f"✅ [{ticker}] Loss cooldown released! "
-                            f"Price recovered {rise_pct:.1f}%"
-                        )
-                
-                # 쿨다운 해제
-                del self.sold_coins_cooldown[ticker]
-
-                # ⚠️ 쿨다운 해제 후에는 다음 추천 업데이트 때 다시 추가되도록 함
-                # 출처 범위를 알 수 없으므로 수동으로 추가하지 않음
-                # (다음 스캔 때 Top 5에 들면 자동으로 추가됨)
-            
-            # 🔥 단순화된 매수 조건 (2가지 전략 OR)
-            # 최소 확신도: AI가 "큰 손실" 예측이 아니면 진입 허용
-            min_confidence = confidence > 0.5  # 50% 이상 (중립 이상)
+            # 4. 매수 조건 평가 (쿨다운 + 전략 판단은 entry_logic에서 I/O 없이 수행)
+            with self._positions_lock:
+                cooldown = CooldownState(
+                    active=bool(self._cooldown_active[i]),
+                    exit_price=float(self._exit_price[i]),
+                    is_profit=bool(self._exit_is_profit[i]),
+                )
+            decision = _entry_decision(
+                features, float(confidence), cooldown, cfg.rebuy_threshold, float(current_price or 0.0)
+            )
 
-            # ========== 전략 1: Mean Reversion (과매도 + 급락 아님) ==========
-            # 조건: (RSI < 35 OR BB < 0.25) + 급락 아님 + 최소 확신도
-            mean_reversion = oversold and not_crashing and min_confidence
+            # 🚫 쿨다운: 익절 후엔 가격 하락, 손절 후엔 가격 회복 시 재매수
+            if decision.cooldown_blocked:
+                if current_price:
+                    kind, op = ("Profit", ">=") if cooldown.is_profit else ("Loss", "<=")
+                    logger.debug(
+                        f"🚫 [{ticker}] {kind} cooldown active. "
+                        f"Current: {current_price:,.0f} {op} Threshold: {decision.rebuy_price_threshold:,.0f}"
+                    )
+                return
 
-            # ========== 전략 2: Momentum (MACD 골든크로스 + 상승 추세) ==========
-            # 조건: MACD > Signal + 상승 추세(EMA9 > EMA21) + 최소 확신도
-            momentum_strategy = macd_golden_cross and trend_up and min_confidence
+            if decision.cooldown_released:
+                change_pct = abs(current_price - cooldown.exit_price) / cooldown.exit_price * 100
+                if cooldown.is_profit:
+                    logger.info(f"✅ [{ticker}] Profit cooldown released! Price dropped {change_pct:.1f}%")
+                else:
+                    logger.info(f"✅ [{ticker}] Loss cooldown released! Price recovered {change_pct:.1f}%")
+                # 쿨다운 해제
+                # ⚠️ 해제 후에는 다음 추천 업데이트 때 다시 추가되도록 함 (Top 5에 들면 자동 추가)
+                with self._positions_lock:
+                    self._cooldown_active[i] = False
 
-            if mean_reversion or momentum_strategy:
-                reason = "Mean Reversion" if mean_reversion else "MACD Momentum"
-                logger.info(f"✅ [{ticker}] Entry: {reason} (Conf={confidence:.1%}, RSI={rsi:.1f}, MACD={macd:.4f})")
+            rsi = features['rsi']
+            macd = features.get('macd', 0)
+            if decision.buy:
+                logger.info(f"✅ [{ticker}] Entry: {decision.reason} (Conf={confidence:.1%}, RSI={rsi:.1f}, MACD={macd:.4f})")
                 self._execute_buy(ticker, features, confidence)
             else:
                 logger.debug(
                     f"📊 [{ticker}] No Signal - "
-                    f"Conf:{confidence:.1%}, RSI:{rsi:.1f}, BB:{bb_position:.2f}, "
-                    f"MACD:{macd:.4f}, Trend:{'↑' if trend_up else '↓'}"
+                    f"Conf:{confidence:.1%}, RSI:{rsi:.1f}, BB:{features['bb_position']:.2f}, "
+                    f"MACD:{macd:.4f}, Trend:{'↑' if decision.trend_up else '↓'}"
                 )
         
         except Exception as e:
@@ -758,7 +1146,8 @@ class TradingBot:
             if not order:
                 logger.error("❌ Order Failed")
                 # 실패 쿨다운 등록 (1분)
-                self.failed_buy_cooldown[ticker] = datetime.now()
+                with self._positions_lock:
+                    self._failed_buy_at[self._ticker_slot(ticker)] = time.monotonic()
                 logger.warning(f"⏳ {ticker} added to failed buy cooldown for 1 minute.")
                 return
             
@@ -769,24 +1158,25 @@ class TradingBot:
             logger.info(f"   Amount: {buy_amount:.6f} {ticker}")
             logger.info(f"   Confidence: {confidence:.2%}")
             
-            # 4. TradeMemory에 진입 기록
-            trade_id = self.memory.save_trade_entry(
+            # 4. TradeMemory에 진입 기록 (백그라운드 쓰기, 실제 ID는 Writer가 Future로 전달)
+            self._pending_trade_ids[ticker] = self.memory.save_trade_entry_async(
                 ticker=ticker,
                 entry_price=current_price,
                 features=features,
                 model_confidence=confidence
             )
             
-            # 5. 포지션 저장
-            self.positions[ticker] = {
+            # 5. 포지션 저장 (trade_id는 매도 시 Future에서 확정)
+            self._set_position(ticker, {
                 "ticker": ticker,
-                "trade_id": trade_id,
+                "trade_id": None,
                 "entry_price": current_price,
                 "amount": buy_amount,
-                "entry_time": datetime.now()
-            }
+                "entry_ts": time.time()  # epoch 초 (표시할 때만 datetime 변환)
+            })
 
-            logger.info(f"✅ Position Opened: {ticker} (Trade ID={trade_id})")
+            logger.info(f"✅ Position Opened: {ticker}")
+            self._holdings_dirty = True
 
             # 🔥 매수 후 잔고 캐시 갱신
             self._refresh_balance_cache()
@@ -806,24 +1196,19 @@ class TradingBot:
         Returns:
             순수익률 (소수점, 예: 0.02 = 2%)
         """
-        # 매수 비용 = 진입가 × 수량 + 매수 수수료
-        buy_cost = (entry_price * amount) * (1 + self.fee_rate)
-
-        # 매도 수익 = 현재가 × 수량 - 매도 수수료
-        sell_proceeds = (current_price * amount) * (1 - self.fee_rate)
-
-        # 순수익률 계산
-        net_profit_rate = (sell_proceeds - buy_cost) / buy_cost
+        # (매도 수익 - 매수 비용) / 매수 비용, 수량은 약분됨
+        fee_rate = self.fee_rate
+        return float(_net_profit_scalar(entry_price, current_price, 1 + fee_rate, 1 - fee_rate))
 
-        return net_profit_rate
-
-    def calculate_dynamic_target(self, ticker: str, base_target: float = None) -> float:
+    def calculate_dynamic_target(self, ticker: str, base_target: float = None,
+                                 df: Optional[pd.DataFrame] = None) -> float:
         """
         ATR 기반 변동성에 따른 동적 목표 수익률 계산
 
         Args:
             ticker: 티커 심볼
             base_target: 기본 목표 수익률 (None이면 self.target_profit 사용)
+            df: 이미 조회한 OHLCV (None이면 조회)
 
         Returns:
             동적 목표 수익률 (소수점, 예: 0.035 = 3.5%)
@@ -832,16 +1217,15 @@ class TradingBot:
             base_target = self.target_profit
 
         try:
-            # 최근 OHLCV 데이터 가져오기
-            df = self.exchange.get_ohlcv(ticker)
+            # 최근 OHLCV 데이터 가져오기 (TTL 캐시)
+            if df is None:
+                df = self._cached_ohlcv(ticker)
             if df is None or len(df) < 14:
                 logger.debug(f"[{ticker}] Insufficient data for dynamic target, using base target")
                 return base_target
 
-            # ATR 추출
-            features = FeatureEngineer.extract_features(df)
-            atr = features.get('atr', 0)
-            current_price = df['close'].iloc[-1]
+            # ATR 추출 (마지막 캔들 기준 캐시)
+            atr, current_price = self._atr_for_candle(ticker, df)
 
             if current_price <= 0:
                 return base_target
@@ -864,26 +1248,75 @@ class TradingBot:
             logger.error(f"Failed to calculate dynamic target for {ticker}: {e}")
             return base_target
 
-    def _check_exit_conditions(self, ticker: str):
+    def _atr_for_candle(self, ticker: str, df: pd.DataFrame) -> Tuple[float, float]:
+        """
+        (ATR, 종가) 반환 - 마감된 캔들까지의 ATR을 상태로 유지하고 Wilder 점화식으로 전진
+
+            ATR_t = (ATR_{t-1} * (N-1) + TR_t) / N
+
+        - 같은 캔들 진행 중: 저장된 ATR에 진행 중 캔들의 TR만 반영 (O(1))
+        - 새 캔들 1개 생성: 직전 캔들(이제 마감)의 TR로 상태를 한 칸 전진 (O(1))
+        - 그 외(최초/캔들 누락): 마감된 구간 전체를 ATR 커널로 재계산해 상태 시드
+        """
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        close_last = float(close[-1])
+        n = len(close)
+        if n <= ATR_WINDOW:
+            # 마감 캔들만으로는 시드 불가 → 전체 구간으로 1회 계산 (상태 저장 안 함)
+            return float(_atr_last_njit(high, low, close)), close_last
+
+        candle_ts = df.index[-1]
+        state = self._atr_state.get(ticker)
+        if state is not None and state[0] == candle_ts:
+            atr_closed = state[1]
+        elif state is not None and df.index[-2] == state[0]:
+            # 진행 중이던 캔들이 마감됨 → 확정된 고가/저가로 한 칸 전진
+            tr = self._true_range(high[-2], low[-2], close[-3])
+            atr_closed = (state[1] * (ATR_WINDOW - 1) + tr) / ATR_WINDOW
+            self._atr_state[ticker] = (candle_ts, atr_closed)
+        else:
+            atr_closed = float(_atr_last_njit(high[:-1], low[:-1], close[:-1]))
+            self._atr_state[ticker] = (candle_ts, atr_closed)
+
+        tr = self._true_range(high[-1], low[-1], close[-2])
+        atr = (atr_closed * (ATR_WINDOW - 1) + tr) / ATR_WINDOW
+        return float(atr), close_last
+
+    @staticmethod
+    def _true_range(high: float, low: float, prev_close: float) -> float:
+        """True Range = max(H-L, |H-C_prev|, |L-C_prev|)"""
+        return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+    def _check_exit_conditions(self, ticker: str, current_price: Optional[float] = None):
         """
         매도 조건 체크 및 청산
+
+        Args:
+            ticker: 티커
+            current_price: 실시간 스트림으로 받은 가격 (없으면 조회)
         """
-        if ticker not in self.positions:
+        position = self.positions.get(ticker)
+        if position is None:
             return
         
-        position = self.positions[ticker]
-        
         try:
             # 1. 현재 가격
-            current_price = self.exchange.get_current_price(ticker)
+            if current_price is None:
+                current_price = self.exchange.get_current_price(ticker)
             if not current_price:
                 return
 
             entry_price = position['entry_price']
             amount = position['amount']
+            cfg = self.cfg  # 이번 체크 동안 사용할 설정 스냅샷
+
+            # OHLCV는 한 번만 조회하여 동적 목표/볼린저 밴드 체크에서 공유
+            df = self._cached_ohlcv(ticker)
 
             # 🚀 순수익 계산 (수수료 포함)
-            if self.use_net_profit:
+            if cfg.use_net_profit:
                 profit_rate = self.calculate_net_profit(entry_price, current_price, amount)
                 profit_label = "Net Profit"
             else:
@@ -891,11 +1324,11 @@ class TradingBot:
                 profit_label = "Simple Profit"
 
             # 🚀 동적 목표 수익률 계산
-            if self.use_dynamic_target:
-                target_profit = self.calculate_dynamic_target(ticker, self.target_profit)
-                position['dynamic_target'] = target_profit  # 포지션에 저장
+            if cfg.use_dynamic_target:
+                target_profit = self.calculate_dynamic_target(ticker, cfg.target_profit, df=df)
+                self._update_position_fields(ticker, dynamic_target=target_profit)  # 포지션에 저장
             else:
-                target_profit = self.target_profit
+                target_profit = cfg.target_profit
 
             # 🔍 디버그: 모든 포지션 상태 출력
             logger.info(
@@ -913,16 +1346,17 @@ class TradingBot:
                 exit_reason = f"Target Profit ({target_profit*100:.1f}%)"
 
             # 조건 2: 손절
-            elif profit_rate <= -self.stop_loss:
+            elif profit_rate <= -cfg.stop_loss:
                 should_exit = True
-                exit_reason = f"Stop Loss ({self.stop_loss*100:.1f}%)"
+                exit_reason = f"Stop Loss ({cfg.stop_loss*100:.1f}%)"
 
             # 조건 3: 볼린저 밴드 상단 (과매수 청산)
             else:
-                df = self.exchange.get_ohlcv(ticker)
-                if df is not None and len(df) >= 20:
-                    features = FeatureEngineer.extract_features(df)
-                    if features.get('bb_position', 0) > 0.95:
+                if df is not None and len(df) >= BB_WINDOW:
+                    # 마지막 BB_WINDOW개 종가만 변환 (전체 특징 추출 없이 bb_position 하나만 계산)
+                    close_tail = np.ascontiguousarray(df['close'].to_numpy()[-BB_WINDOW:], dtype=np.float64)
+                    bb_position = _bb_position_last_njit(close_tail)
+                    if bb_position > 0.95:
                         should_exit = True
                         exit_reason = "BB Upper (Overbought)"
             
@@ -939,6 +1373,21 @@ class TradingBot:
         except Exception as e:
             logger.error(f"❌ Exit check failed: {e}")
     
+    def _resolve_trade_id(self, ticker: str) -> Optional[int]:
+        """
+        매수 시 백그라운드로 기록한 진입의 실제 trade_id (기록 완료까지 대기)
+
+        진입 기록이 실패했으면 None (DB 업데이트 생략)
+        """
+        future = self._pending_trade_ids.pop(ticker, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"❌ Trade entry for {ticker} was not saved: {e}")
+            return None
+
     def _execute_sell(self, ticker: str, exit_price: float, reason: str):
         """
         매도 주문 실행
@@ -946,14 +1395,8 @@ class TradingBot:
         try:
             position = self.positions[ticker]
             
-            # � 실시간 잔고 동기화 (수동 매수/매도 반영)
-            holdings = self.exchange.get_holdings()
-            actual_amount = None
-            
-            for holding in holdings:
-                if holding['ticker'] == ticker:
-                    actual_amount = holding['amount']
-                    break
+            # 🔄 실시간 잔고 동기화 (수동 매수/매도 반영, 5초 캐시 + 주문 시 무효화)
+            actual_amount = self.exchange.get_holdings_map().get(ticker)
             
             if actual_amount is not None and actual_amount != position['amount']:
                 logger.info(
@@ -961,10 +1404,10 @@ class TradingBot:
                     f"{position['amount']:.4f} → {actual_amount:.4f} "
                     f"(Manual trade detected)"
                 )
-                position['amount'] = actual_amount
+                position = self._update_position_fields(ticker, amount=actual_amount) or position
             elif actual_amount is None:
                 logger.warning(f"⚠️ {ticker} not found in holdings. Position may have been sold manually.")
-                del self.positions[ticker]
+                self._remove_position(ticker)
                 return
             
             # �🛡️ 최소 주문 금액 검증 (업비트: 5,000원)
@@ -1009,6 +1452,8 @@ class TradingBot:
             
             # 2. TradeMemory 업데이트 (trade_id가 있는 경우에만)
             trade_id = position.get('trade_id')
+            if trade_id is None:
+                trade_id = self._resolve_trade_id(ticker)
             if trade_id is not None:
                 self.memory.update_trade_exit(
                     trade_id=trade_id,
@@ -1023,13 +1468,14 @@ class TradingBot:
                 self.session_wins += 1
             
             # 4. trade_id 저장 (없을 수도 있음)
-            closed_trade_id = position.get('trade_id', 'N/A')
+            closed_trade_id = trade_id if trade_id is not None else 'N/A'
             
             # 5. 🔥 익절/손절 모두 쿨다운 등록 (재매수 방지)
-            self.sold_coins_cooldown[ticker] = {
-                'exit_price': exit_price,
-                'reason': reason  # 'Target Profit' or 'Stop Loss'
-            }
+            with self._positions_lock:
+                i = self._ticker_slot(ticker)
+                self._exit_price[i] = exit_price
+                self._exit_is_profit[i] = 'Profit' in reason  # 'Target Profit' or 'Stop Loss'
+                self._cooldown_active[i] = True
             
             if profit_rate > 0:
                 logger.info(
@@ -1042,23 +1488,20 @@ class TradingBot:
                     f"Will rebuy if price recovers above {exit_price * (1 + self.rebuy_threshold):,.0f} KRW"
                 )
             
-            # 티커 리스트에서 제거
-            with self._tickers_lock:  # 🔒 Thread-safe
-                if ticker in self.tickers:
-                    self.tickers.remove(ticker)
-                    logger.info(f"➖ [{ticker}] Removed from active tickers")
-                # 출처 범위 정보도 삭제 (메모리 누수 방지)
-                if ticker in self.ticker_origin_range:
-                    del self.ticker_origin_range[ticker]
+            # 티커 리스트에서 제거 (출처 범위 정보도 삭제 - 메모리 누수 방지)
+            if self._remove_ticker(ticker):
+                logger.info(f"➖ [{ticker}] Removed from active tickers")
             
             # 6. 포지션 클리어
-            del self.positions[ticker]
+            self._remove_position(ticker)
+            self._holdings_dirty = True
 
             # 🔥 매도 후 잔고 캐시 갱신
             self._refresh_balance_cache()
 
-            # 7. 🔥 학습 트리거 (N건 누적 시)
-            stats = self.memory.get_statistics()
+            # 7. 🔥 학습 트리거 (N건 누적 시, 청산 반영된 통계로 캐시도 갱신)
+            self._stats_dirty = True
+            stats = self._cached_statistics()
             if stats and stats.get('total_trades', 0) % self.retrain_threshold == 0 and stats.get('total_trades', 0) > 0:
                 logger.info("🎓 Triggering Model Retraining...")
                 self._retrain_model()
@@ -1066,9 +1509,7 @@ class TradingBot:
             logger.info(f"✅ Position Closed: Trade ID={closed_trade_id}")
 
         except Exception as e:
-            logger.error(f"❌ Sell execution failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"❌ Sell execution failed: {e}")
     
     def _retrain_model(self):
         """
@@ -1218,10 +1659,8 @@ class TradingBot:
         except Exception as e:
             logger.error("=" * 60)
             logger.error(f"❌ RECOMMENDATION UPDATE FAILED")
-            logger.error(f"   Error: {e}")
+            logger.error(f"   Error: {e}", exc_info=True)
             logger.error("=" * 60)
-            import traceback
-            logger.error(traceback.format_exc())
         finally:
             self.is_updating_recommendations = False
 
@@ -1242,6 +1681,10 @@ class TradingBot:
             return
 
         with self._tickers_lock:  # 🔒 Thread-safe ticker list modification
+            # Copy-on-Write: 복사본을 수정한 뒤 마지막에 교체
+            tickers = list(self._tickers)
+            tickers_set = set(tickers)
+
             # 현재 스캔 범위 가져오기
             current_scan_range = (
                 self.coin_selector.scan_index - self.coin_selector.batch_size,
@@ -1257,8 +1700,9 @@ class TradingBot:
                 ticker = rec['ticker']
 
                 # 티커 리스트에 추가 (중복 체크)
-                if ticker not in self.tickers:
-                    self.tickers.append(ticker)
+                if ticker not in tickers_set:
+                    tickers.append(ticker)
+                    tickers_set.add(ticker)
                     self.ticker_origin_range[ticker] = current_scan_range  # 📍 출처 범위 기록
                     logger.info(f"   ✅ [{ticker}] Added to watch list (from range {current_scan_range[0]}-{current_scan_range[1]})")
 
@@ -1267,7 +1711,7 @@ class TradingBot:
             if self.auto_remove_from_watchlist:
                 tickers_to_remove = []
 
-                for ticker in self.tickers[:]:  # 복사본으로 순회
+                for ticker in tickers:
                     ticker_origin = self.ticker_origin_range.get(ticker)
 
                     # 📌 핵심: 이 티커의 출처 범위가 현재 스캔 범위와 같을 때만 체크
@@ -1283,42 +1727,51 @@ class TradingBot:
 
                 # 3️⃣ 제거 실행
                 for ticker in tickers_to_remove:
-                    self.tickers.remove(ticker)
+                    tickers.remove(ticker)
                     if ticker in self.ticker_origin_range:
                         del self.ticker_origin_range[ticker]  # 출처 범위 삭제
                     logger.info(f"   ❌ [{ticker}] Removed from watch list")
 
+            self._set_tickers(tickers)
+
             # 결과 요약
-            logger.info(f"📊 Watch List Status: {len(self.tickers)} tickers {self.tickers}")
+            logger.info(f"📊 Watch List Status: {len(tickers)} tickers {tickers}")
 
     def _auto_recommendation_timer(self):
         """
         🕐 30초마다 추천 업데이트 + Top 5 기반 동적 티커 관리
+
+        실행 시각을 벽시계 주기(:00, :30 ...)에 맞춰 드리프트가 쌓이지 않으며,
+        stop() 시 _stop_event로 즉시 종료됩니다.
         """
         logger.info("🔄 Auto recommendation timer loop started")
         
-        while self.is_running:
-            try:
-                logger.info("🔄 Auto-updating coin recommendations...")
-                
-                # 추천 업데이트
-                recs = self.coin_selector.get_top_recommendations(top_n=5)
-                self.recommended_coins = recs
-
-                # 🆕 동적 티커 관리 (유예 기간 적용)
-                if recs:
-                    self._manage_tickers_dynamically(recs)
-                
-                # 대기 (1초 단위로 체크하여 빠른 종료 지원)
-                for _ in range(self.auto_recommendation_interval):
-                    if not self.is_running:
-                        break
-                    time.sleep(1)
-            except Exception as e:
-                logger.error(f"❌ Auto recommendation timer error: {e}")
-                time.sleep(60) # 에러 시 1분 대기
+        self._update_recommendations_and_add_top()
+        while not self._stop_event.wait(timeout=self._next_aligned_delay(self.auto_recommendation_interval)):
+            self._update_recommendations_and_add_top()
                 
         logger.info("🔄 Auto recommendation timer stopped")
+
+    @staticmethod
+    def _next_aligned_delay(interval: float) -> float:
+        """다음 벽시계 주기 경계까지 남은 시간 (초)"""
+        return interval - (time.time() % interval)
+
+    def _update_recommendations_and_add_top(self):
+        """추천 업데이트 1회 + Top 5 기반 동적 티커 관리"""
+        try:
+            logger.info("🔄 Auto-updating coin recommendations...")
+            
+            # 추천 업데이트
+            recs = self.coin_selector.get_top_recommendations(top_n=5)
+            self.recommended_coins = recs
+
+            # 🆕 동적 티커 관리 (유예 기간 적용)
+            if recs:
+                self._manage_tickers_dynamically(recs)
+        except Exception as e:
+            logger.error(f"❌ Auto recommendation timer error: {e}")
+            self._stop_event.wait(60) # 에러 시 1분 대기
     
     def toggle_ticker(self, ticker: str):
         """
@@ -1326,9 +1779,9 @@ class TradingBot:
         ⚠️ 수동으로 추가된 티커는 출처 범위가 없으므로 동적 제거 대상이 아님
         """
         with self._tickers_lock:  # 🔒 Thread-safe
-            if ticker in self.tickers:
-                if len(self.tickers) > 1: # 최소 1개 유지를 원한다면
-                    self.tickers.remove(ticker)
+            if ticker in self._tickers_set:
+                if len(self._tickers) > 1: # 최소 1개 유지를 원한다면
+                    self._set_tickers([t for t in self._tickers if t != ticker])
                     # 출처 범위 정보도 삭제 (있는 경우만)
                     if ticker in self.ticker_origin_range:
                         del self.ticker_origin_range[ticker]
@@ -1336,7 +1789,7 @@ class TradingBot:
                 else:
                     logger.warning("⚠️ Cannot remove last ticker")
             else:
-                self.tickers.append(ticker)
+                self._add_ticker(ticker)
                 # 수동 추가된 티커는 출처 범위를 기록하지 않음
                 # (동적 제거 대상이 아니므로 계속 유지됨)
                 logger.info(f"➕ Ticker Added (Manual): {ticker}")
@@ -1345,10 +1798,9 @@ class TradingBot:
         """
         봇 현재 상태 반환 (UI용)
         """
-        stats = self.memory.get_statistics()
+        stats = self._cached_statistics()
 
-        with self._tickers_lock:  # 🔒 Thread-safe read
-            tickers_snapshot = self.tickers[:]
+        tickers_snapshot = self.tickers  # Copy-on-Write 스냅샷
 
         status = {
             "is_running": self.is_running,
@@ -1380,35 +1832,42 @@ class TradingBot:
 
 
     
+    def _cached_statistics(self) -> Dict:
+        """
+        매매 통계 조회 (stats_cache_ttl 동안 재사용, 매도 후에는 즉시 재조회)
+        """
+        fetched_at, stats = self._stats_cache
+        now = time.monotonic()
+        if self._stats_dirty or stats is None or now - fetched_at >= self.stats_cache_ttl:
+            self._stats_dirty = False
+            stats = self.memory.get_statistics()
+            self._stats_cache = (now, stats)
+        return stats
+
     def _refresh_balance_cache(self):
         """잔고 캐시 갱신 (거래 후 호출)"""
         try:
-            # 1. KRW 잔액 (Upbit/Bithumb 공통)
-            with self._tickers_lock:  # 🔒 Thread-safe read
-                first_ticker = self.tickers[0] if self.tickers else "BTC"
-            balance_data = self.exchange.get_balance(first_ticker)
-            total_krw = balance_data.get("krw_balance", 0)
+            # 1. 선택된 코인들 + KRW 잔고 일괄 조회
+            target_tickers = list(self._active_universe())
+            balances = self.exchange.get_balances(target_tickers)
+            total_krw = balances.get("KRW", 0)
             total_value = total_krw
             holdings = []
 
-            # 2. 선택된 코인들의 보유량 확인
-            with self._tickers_lock:  # 🔒 Thread-safe read
-                target_tickers = set(self.tickers) | set(self.positions.keys())
-
-            for ticker in target_tickers:
-                b_data = self.exchange.get_balance(ticker)
-                coin_amount = b_data.get("coin_balance", 0)
+            # 2. 보유 중인 코인만 현재가 일괄 조회
+            held = [t for t in target_tickers if balances.get(t, 0) > 0]
+            prices = self.exchange.get_current_prices(held) if held else {}
 
-                if coin_amount > 0:
-                    current_price = self.exchange.get_current_price(ticker) or 0
-                    val = coin_amount * current_price
-                    total_value += val
+            for ticker in held:
+                coin_amount = balances[ticker]
+                val = coin_amount * prices.get(ticker, 0)
+                total_value += val
 
-                    holdings.append({
-                        "ticker": ticker,
-                        "amount": coin_amount,
-                        "value": val
-                    })
+                holdings.append({
+                    "ticker": ticker,
+                    "amount": coin_amount,
+                    "value": val
+                })
 
             # 캐시 업데이트
             self._balance_cache = {
@@ -9,12 +9,15 @@ Features:
 - Async support for better performance
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 import logging
 import asyncio
+import queue
 from typing import Dict, List, Set
 from datetime import datetime
 
@@ -33,49 +36,68 @@ from routers import capital as capital_router
 
 
 # Setup Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# 호출 스레드(이벤트 루프/봇 스레드)는 큐에 넣기만 하고, 출력 I/O는 QueueListener 스레드에서 처리
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+log_listener.start()  # 종료는 lifespan 정리 단계에서 (남은 로그 flush)
+
+# 루트 핸들러를 큐 핸들러로 교체 (basicConfig는 이미 핸들러가 있으면 무시되므로 직접 설정)
+# 큐 핸들러에는 포매터를 두지 않음 → 메시지 원문만 넘기고 포맷은 리스너 쪽 핸들러가 적용
+_root_logger = logging.getLogger()
+_root_logger.handlers[:] = [QueueHandler(_log_queue)]
+_root_logger.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Global bot instance (Singleton)
-trading_bot: TradingBot = None
+# 루트 헬스 체크 응답 (타임스탬프만 바뀌므로 나머지는 미리 인코딩)
+API_VERSION = "2.0.0"
+_ROOT_PREFIX = (
+    b'{"success":true,"message":"Trading Bot API is running","data":'
+    b'{"version":"' + API_VERSION.encode() + b'","status":"healthy","timestamp":"'
+)
+_ROOT_SUFFIX = b'"}}'
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     애플리케이션 수명 주기 관리
-    - 시작 시: TradingBot 인스턴스 생성
+    - 시작 시: TradingBot 인스턴스 생성 (app.state.trading_bot, 라우터는 Depends로 주입)
     - 종료 시: 리소스 정리
     """
-    global trading_bot
-
     logger.info("=" * 60)
     logger.info("🚀 FastAPI Application Starting...")
     logger.info("=" * 60)
 
     # Bot 인스턴스 생성
     trading_bot = TradingBot()
+    app.state.trading_bot = trading_bot
     logger.info("✅ Trading Bot Initialized")
 
+    status_task = asyncio.create_task(websocket_router.status_broadcaster(app))
+
     yield
 
     # Cleanup
     logger.info("🛑 Shutting down...")
+    status_task.cancel()
     if trading_bot and trading_bot.is_running:
         trading_bot.stop()
     logger.info("✅ Cleanup Complete")
+    log_listener.stop()
 
 
 # FastAPI App
 app = FastAPI(
     title="Trading Bot API",
     description="Self-Evolving Trading System REST API",
-    version="2.0.0",
-    lifespan=lifespan
+    version=API_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson(C 구현)으로 응답 직렬화
 )
 
 
@@ -90,10 +112,15 @@ app.add_middleware(
         "http://localhost:8080",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # 실제 사용하는 메서드/헤더만 명시 + preflight 결과를 하루 동안 브라우저에 캐시
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# 응답 압축 (추천/포지션이 많은 상태 응답 등 1KB 이상만, 작은 응답은 그대로)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Include Routers
 app.include_router(auth_router.router, prefix="/api/auth", tags=["Authentication"])
@@ -106,25 +133,19 @@ app.include_router(websocket_router.router, prefix="/ws", tags=["WebSocket"])
 @app.get("/", response_model=SuccessResponse)
 async def root():
     """
-    Health Check Endpoint
+    Health Check Endpoint (타임스탬프 외에는 미리 인코딩된 바이트로 응답 조립)
     """
-    return SuccessResponse(
-        success=True,
-        message="Trading Bot API is running",
-        data={
-            "version": "2.0.0",
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat()
-        }
-    )
+    body = _ROOT_PREFIX + datetime.now().isoformat().encode() + _ROOT_SUFFIX
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/health")
-async def health_check():
+async def health_check(request: Request):
     """
     상세 헬스 체크
     """
     try:
+        trading_bot: TradingBot = request.app.state.trading_bot
         bot_status = trading_bot.get_status()
         return {
             "status": "healthy",
@@ -141,7 +162,7 @@ async def health_check():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """HTTP 예외 핸들러"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -155,7 +176,7 @@ async def http_exception_handler(request, exc):
 async def general_exception_handler(request, exc):
     """일반 예외 핸들러"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -167,13 +188,18 @@ async def general_exception_handler(request, exc):
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
     # Uvicorn으로 서버 실행
+    # uvloop(Cython 이벤트 루프)은 Windows 미지원 → asyncio 기본 루프 사용
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,  # 개발 모드: 코드 변경 시 자동 재시작
-        log_level="info"
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",  # C 기반 HTTP 파서
+        log_level="info",
+        access_log=False,  # 요청마다 동기 로깅하지 않음
     )
@@ -1,10 +1,14 @@
 """
 Pydantic Models for API Request/Response
 """
-from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import List, Dict, Optional, Any
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from typing import Annotated, List, Dict, Optional, Any
 from datetime import datetime
 
+import msgspec
+import numpy as np
+from fastapi.responses import Response
+
 
 class BotStatus(BaseModel):
     """봇 상태 응답 모델"""
@@ -48,8 +52,8 @@ class AccountBalance(BaseModel):
 
 
 class Trade(BaseModel):
-    """거래 내역 모델"""
-    model_config = ConfigDict(protected_namespaces=())
+    """거래 내역 모델 (응답 전용, 불변)"""
+    model_config = ConfigDict(frozen=True, protected_namespaces=())
 
     id: Optional[int]
     ticker: str
@@ -68,10 +72,13 @@ class TradeHistoryResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 키셋 커서 (마지막 페이지면 None)
 
 
 class CoinRecommendation(BaseModel):
-    """코인 추천 모델"""
+    """코인 추천 모델 (응답 전용, 불변)"""
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     score: float
     confidence: float
@@ -86,9 +93,14 @@ class RecommendationsResponse(BaseModel):
     updated_at: str
 
 
+# 코인 심볼 (마켓 접두어 없이, 예: "BTC", "1INCH")
+# 패턴은 모델 생성 시 pydantic-core(Rust regex)로 한 번만 컴파일됨
+Ticker = Annotated[str, Field(pattern=r'^[A-Z0-9]{1,10}$')]
+
+
 class StartBotRequest(BaseModel):
     """봇 시작 요청 (옵션)"""
-    tickers: Optional[List[str]] = None
+    tickers: Optional[List[Ticker]] = None
 
 
 class StopBotRequest(BaseModel):
@@ -109,11 +121,13 @@ class UpdateConfigRequest(BaseModel):
 
 class TickerToggleRequest(BaseModel):
     """티커 토글 요청"""
-    ticker: str
+    ticker: Ticker
 
 
 class WebSocketMessage(BaseModel):
-    """WebSocket 메시지 모델"""
+    """WebSocket 메시지 모델 (불변)"""
+    model_config = ConfigDict(frozen=True)
+
     type: str  # "log", "price", "status", "trade"
     data: Dict[str, Any]
     timestamp: str
@@ -189,3 +203,68 @@ class UserWithToken(BaseModel):
     """User data with authentication token"""
     user: User
     token: Token
+
+
+# ============================================================
+# msgspec 응답 모델 (폴링이 잦은 핫 경로 전용)
+# Pydantic 모델은 OpenAPI 스키마 용도로만 유지하고, 실제 응답은 검증 없이 바로 인코딩
+# ============================================================
+
+class BotStatusMsg(msgspec.Struct, kw_only=True, gc=False):
+    """BotStatus와 동일한 필드의 msgspec 버전"""
+    is_running: bool
+    tickers: List[str]
+    use_ai_selection: bool
+    recommended_coins: List[Dict[str, Any]]
+    positions: Dict[str, Dict[str, Any]]
+    model_accuracy: float
+    total_trades: int
+    win_rate: float
+    avg_profit_pct: float
+    session_trades: int
+    session_win_rate: float
+    last_trained: Optional[str]
+    total_learning_samples: int
+    today_profit: Optional[float] = None
+    is_updating_recommendations: bool
+
+    # Configuration
+    trade_amount: Optional[float] = None
+    target_profit: Optional[float] = None
+    stop_loss: Optional[float] = None
+    rebuy_threshold: Optional[float] = None
+    use_net_profit: Optional[bool] = None
+    use_dynamic_target: Optional[bool] = None
+    use_dynamic_sizing: Optional[bool] = None
+
+
+class SuccessResponseMsg(msgspec.Struct, kw_only=True, gc=False):
+    """SuccessResponse와 동일한 필드의 msgspec 버전"""
+    success: bool
+    message: str
+    data: Optional[Dict[str, Any]] = None
+
+
+def _msgspec_enc_hook(obj: Any) -> Any:
+    """msgspec이 직접 지원하지 않는 타입 변환 (numpy 스칼라/배열, 나머지는 str)"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)  # json.dumps(default=str)와 동일한 폴백
+
+
+_msgspec_encoder = msgspec.json.Encoder(enc_hook=_msgspec_enc_hook)
+
+
+def encode_json(content: Any) -> bytes:
+    """Struct/dict를 JSON bytes로 인코딩 (MsgspecResponse와 같은 인코더)"""
+    return _msgspec_encoder.encode(content)
+
+
+class MsgspecResponse(Response):
+    """msgspec으로 인코딩하는 JSON 응답 (Struct/dict 모두 지원)"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _msgspec_encoder.encode(content)
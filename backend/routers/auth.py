@@ -6,8 +6,12 @@ Handles user registration, login, and profile management.
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
 import logging
+import time
 
 from models.schemas import (
     UserCreate, UserLogin, User, Token, UserWithToken,
@@ -16,7 +20,7 @@ from models.schemas import (
 from core.database import user_db
 from core.auth import (
     verify_password, get_password_hash, create_access_token,
-    validate_token
+    validate_token, user_claims
 )
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,65 @@ router = APIRouter()
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# 비밀번호 해시/검증(bcrypt, 수백 ms CPU) 전용 스레드 풀
+# 로그인이 몰려도 이벤트 루프(상태 폴링, WebSocket 푸시)가 막히지 않도록 분리
+PASSWORD_HASH_WORKERS = 4
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="pwhash")
+
+
+async def _run_password_op(func: Callable[..., Any], *args: Any) -> Any:
+    """비밀번호 해시/검증 함수를 전용 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
+
+# 토큰 → 인증된 사용자 캐시 (JWT 디코딩 + 프로필/활성 여부 DB 조회를 폴링마다 반복하지 않음)
+# 키는 토큰 원문 대신 SHA-256 해시, 항목 만료는 토큰 exp를 넘지 않음
+# ⚠️ 적중 시에는 DB를 다시 보지 않으므로 계정 비활성화/프로필 변경은 최대 USER_CACHE_TTL 뒤에 반영
+#    (즉시 반영이 필요하면 TTL을 줄이거나 0으로 두어 캐시를 끔)
+USER_CACHE_TTL = 5.0
+USER_CACHE_MAX_SIZE = 1024
+_user_cache: Dict[str, Tuple[float, User]] = {}
+
+
+def _token_key(token: str) -> str:
+    """캐시 키 (토큰 해시)"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _cache_user(key: str, user: User, token_exp: Optional[float]):
+    """
+    인증된 사용자 캐시 등록 (가득 차면 만료 항목 정리, 그래도 가득 차면 비움)
+
+    Args:
+        token_exp: 토큰 만료 시각 (UNIX epoch, 클레임의 exp) - 항목 만료가 이를 넘지 않음
+    """
+    now = time.monotonic()
+    ttl = USER_CACHE_TTL
+    if token_exp is not None:
+        ttl = min(ttl, token_exp - time.time())
+    if ttl <= 0:
+        return
+    if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+        for k in [k for k, (expires, _) in _user_cache.items() if expires <= now]:
+            del _user_cache[k]
+        if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            _user_cache.clear()
+    _user_cache[key] = (now + ttl, user)
+
+
+def _user_from_row(user_dict: Dict) -> User:
+    """
+    DB 행으로 User 생성 (신뢰된 내부 데이터이므로 검증 생략)
+
+    SQLite의 0/1 플래그만 bool로 변환하고, 비밀번호 해시 등 스키마 밖 컬럼은 무시됩니다.
+    """
+    return User.model_construct(**{
+        **user_dict,
+        "is_active": bool(user_dict.get("is_active")),
+        "is_admin": bool(user_dict.get("is_admin")),
+    })
+
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """
@@ -34,20 +97,32 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    cache_key = _token_key(token)
+    cached = _user_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    username = validate_token(token)
-    if username is None:
+    claims = validate_token(token)
+    if claims is None:
         raise credentials_exception
+    username = claims["sub"]
 
-    user_dict = user_db.get_user_by_username(username)
+    # 프로필 + 활성 여부를 username 인덱스 조회 한 번으로 확인
+    # (비활성화가 다른 워커/프로세스에서 일어나도 즉시 반영)
+    user_dict = user_db.get_user_profile(username)
     if user_dict is None:
         raise credentials_exception
 
+    # 삭제 후 같은 이름으로 재가입한 계정에 이전 토큰이 통하지 않도록 uid 확인
+    if "uid" in claims and claims["uid"] != user_dict["id"]:
+        raise credentials_exception
+
     # Check if user is active
     if not user_dict.get("is_active", False):
         raise HTTPException(
@@ -55,7 +130,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
             detail="User account is deactivated"
         )
 
-    return User(**user_dict)
+    user = _user_from_row(user_dict)
+    _cache_user(cache_key, user, claims.get("exp"))
+    return user
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -92,7 +169,7 @@ async def register(user: UserCreate):
             )
 
         # Hash password and create user
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await _run_password_op(get_password_hash, user.password)
         user_dict = user_db.create_user(
             username=user.username,
             email=user.email,
@@ -101,12 +178,12 @@ async def register(user: UserCreate):
         )
 
         # Generate token
-        access_token = create_access_token(data={"sub": user.username})
+        access_token = create_access_token(data=user_claims(user_dict))
 
         logger.info(f"✅ New user registered: {user.username}")
 
         return UserWithToken(
-            user=User(**user_dict),
+            user=_user_from_row(user_dict),
             token=Token(access_token=access_token, token_type="bearer")
         )
 
@@ -142,7 +219,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         )
 
     # Verify password
-    if not verify_password(form_data.password, user_dict["hashed_password"]):
+    if not await _run_password_op(verify_password, form_data.password, user_dict["hashed_password"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -156,19 +233,16 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
             detail="User account is deactivated"
         )
 
-    # Update last login
-    user_db.update_last_login(form_data.username)
+    # Update last login (재조회 없이 메모리에서 갱신)
+    user_dict["last_login"] = user_db.update_last_login(form_data.username)
 
     # Generate token
-    access_token = create_access_token(data={"sub": form_data.username})
+    access_token = create_access_token(data=user_claims(user_dict))
 
     logger.info(f"✅ User logged in: {form_data.username}")
 
-    # Refresh user data with updated last_login
-    user_dict = user_db.get_user_by_username(form_data.username)
-
     return UserWithToken(
-        user=User(**user_dict),
+        user=_user_from_row(user_dict),
         token=Token(access_token=access_token, token_type="bearer")
     )
 
@@ -186,7 +260,9 @@ async def login_json(credentials: UserLogin):
     """
     user_dict = user_db.get_user_by_username(credentials.username)
 
-    if not user_dict or not verify_password(credentials.password, user_dict["hashed_password"]):
+    if not user_dict or not await _run_password_op(
+        verify_password, credentials.password, user_dict["hashed_password"]
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -198,15 +274,13 @@ async def login_json(credentials: UserLogin):
             detail="User account is deactivated"
         )
 
-    user_db.update_last_login(credentials.username)
-    access_token = create_access_token(data={"sub": credentials.username})
+    user_dict["last_login"] = user_db.update_last_login(credentials.username)
+    access_token = create_access_token(data=user_claims(user_dict))
 
     logger.info(f"✅ User logged in (JSON): {credentials.username}")
 
-    user_dict = user_db.get_user_by_username(credentials.username)
-
     return UserWithToken(
-        user=User(**user_dict),
+        user=_user_from_row(user_dict),
         token=Token(access_token=access_token, token_type="bearer")
     )
 
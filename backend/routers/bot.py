@@ -4,17 +4,27 @@ Bot Control Router
 봇 시작/중지, 설정 변경, 추천 업데이트 등 제어 API
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from dataclasses import replace
+from typing import Dict, Optional, Tuple
+import asyncio
 import logging
 
+import msgspec
+
+from core.trading_bot import TradingBot
+from routers.dependencies import get_bot
+from routers.error_route import ErrorLoggingRoute
+from routers.websocket import get_status_snapshot_bytes
 from models.schemas import (
     BotStatus, SuccessResponse, StartBotRequest, StopBotRequest,
-    UpdateConfigRequest, TickerToggleRequest, User
+    UpdateConfigRequest, TickerToggleRequest, User,
+    BotStatusMsg, SuccessResponseMsg, MsgspecResponse, encode_json
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorLoggingRoute)
 logger = logging.getLogger(__name__)
 
 
@@ -24,33 +34,27 @@ def get_current_user():
     return get_current_user
 
 
-def get_bot():
-    """봇 인스턴스 가져오기"""
-    from main import trading_bot
-    if trading_bot is None:
-        raise HTTPException(status_code=500, detail="Bot not initialized")
-    return trading_bot
-
-
-@router.get("/status", response_model=BotStatus)
-async def get_bot_status():
+@router.get("/status", response_model=BotStatus, response_class=MsgspecResponse)
+async def get_bot_status(bot: TradingBot = Depends(get_bot)):
     """
     봇 현재 상태 조회
 
     Returns:
         BotStatus: 봇의 현재 상태 정보
     """
-    try:
-        bot = get_bot()
-        status = bot.get_status()
-        return BotStatus(**status)
-    except Exception as e:
-        logger.error(f"Failed to get bot status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # status_broadcaster가 주기적으로 인코딩한 스냅샷을 그대로 반환
+    # (유휴 상태였으면 None → 이번 조회가 브로드캐스터 갱신을 다시 깨움)
+    snapshot = get_status_snapshot_bytes()
+    if snapshot is not None:
+        return Response(content=snapshot, media_type="application/json")
+
+    status = await asyncio.to_thread(bot.get_status)
+    # 봇 내부에서 만든 신뢰된 데이터 → 검증 없이 msgspec으로 바로 인코딩
+    return MsgspecResponse(BotStatusMsg(**status))
 
 
 @router.post("/start", response_model=SuccessResponse)
-async def start_bot(request: StartBotRequest = None, current_user: User = Depends(get_current_user)):
+async def start_bot(request: StartBotRequest = None, current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     봇 시작
 
@@ -60,92 +64,73 @@ async def start_bot(request: StartBotRequest = None, current_user: User = Depend
     Returns:
         SuccessResponse: 성공 여부
     """
-    try:
-        bot = get_bot()
-
-        if bot.is_running:
-            return SuccessResponse(
-                success=False,
-                message="Bot is already running"
-            )
-
-        # 티커 설정 (요청에 포함된 경우)
-        if request and request.tickers:
-            bot.tickers = request.tickers
-
-        bot.start()
-
+    if bot.is_running:
         return SuccessResponse(
-            success=True,
-            message="Bot started successfully",
-            data={"tickers": bot.tickers}
+            success=False,
+            message="Bot is already running"
         )
 
-    except Exception as e:
-        logger.error(f"Failed to start bot: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # 티커 설정 (요청에 포함된 경우)
+    if request and request.tickers:
+        bot.tickers = request.tickers
+
+    bot.start()
+
+    return SuccessResponse(
+        success=True,
+        message="Bot started successfully",
+        data={"tickers": bot.tickers}
+    )
 
 
 @router.post("/stop", response_model=SuccessResponse)
-async def stop_bot(current_user: User = Depends(get_current_user)):
+async def stop_bot(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     봇 중지
 
     Returns:
         SuccessResponse: 성공 여부
     """
-    try:
-        bot = get_bot()
-
-        if not bot.is_running:
-            return SuccessResponse(
-                success=False,
-                message="Bot is not running"
-            )
-
-        bot.stop()
-
+    if not bot.is_running:
         return SuccessResponse(
-            success=True,
-            message="Bot stopped successfully"
+            success=False,
+            message="Bot is not running"
         )
 
-    except Exception as e:
-        logger.error(f"Failed to stop bot: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    bot.stop()
+
+    return SuccessResponse(
+        success=True,
+        message="Bot stopped successfully"
+    )
 
 
 @router.post("/retrain", response_model=SuccessResponse)
-async def retrain_model(current_user: User = Depends(get_current_user)):
+async def retrain_model(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     모델 강제 재학습
 
     Returns:
         SuccessResponse: 성공 여부
     """
-    try:
-        bot = get_bot()
-        bot.force_retrain()
+    bot.force_retrain()
 
-        return SuccessResponse(
-            success=True,
-            message="Model retrained successfully",
-            data={
-                "accuracy": bot.learner.metrics.get('accuracy', 0),
-                "total_samples": bot.learner.metrics.get('total_samples', 0)
-            }
-        )
-
-    except Exception as e:
-        logger.error(f"Failed to retrain model: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return SuccessResponse(
+        success=True,
+        message="Model retrained successfully",
+        data={
+            "accuracy": bot.learner.metrics.get('accuracy', 0),
+            "total_samples": bot.learner.metrics.get('total_samples', 0)
+        }
+    )
 
 
 @router.post("/backtest/run", response_model=SuccessResponse)
 async def run_backtest(
     days: int = 200,
     async_mode: bool = True,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """
     백테스팅 실행 (멀티 코인)
@@ -160,76 +145,75 @@ async def run_backtest(
     Note:
         실제 거래 내역에서 상위 10개 코인을 자동으로 선택하여 백테스팅합니다.
     """
-    try:
-        bot = get_bot()
-        # tickers=None이면 자동으로 거래 내역에서 선택
-        result = bot.run_backtest(tickers=None, days=min(days, 200), async_mode=async_mode)
+    # tickers=None이면 자동으로 거래 내역에서 선택
+    result = bot.run_backtest(tickers=None, days=min(days, 200), async_mode=async_mode)
 
-        return SuccessResponse(
-            success=True,
-            message=result.get('message', 'Backtest started'),
-            data=result
-        )
+    return SuccessResponse(
+        success=True,
+        message=result.get('message', 'Backtest started'),
+        data=result
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to run backtest: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
 
+# 완료된 백테스트 결과는 바뀌지 않으므로 한 번만 인코딩해 재사용 (결과 dict, 인코딩된 JSON)
+_backtest_results_cache: Tuple[Optional[Dict], Optional[msgspec.Raw]] = (None, None)
 
-@router.get("/backtest/status", response_model=SuccessResponse)
-async def get_backtest_status(current_user: User = Depends(get_current_user)):
+
+def _encoded_backtest_results(results: Dict) -> msgspec.Raw:
+    """백테스트 결과를 인코딩된 JSON(msgspec.Raw)으로 반환 (같은 결과 객체면 캐시 사용)"""
+    global _backtest_results_cache
+    cached_results, raw = _backtest_results_cache
+    if cached_results is not results:
+        raw = msgspec.Raw(encode_json(results))
+        _backtest_results_cache = (results, raw)
+    return raw
+
+
+@router.get("/backtest/status", response_model=SuccessResponse, response_class=MsgspecResponse)
+async def get_backtest_status(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     백테스팅 상태 조회
 
     Returns:
         SuccessResponse: 백테스팅 진행 상태
     """
-    try:
-        bot = get_bot()
-        status = bot.get_backtest_status()
+    status = bot.get_backtest_status()
 
-        return SuccessResponse(
-            success=True,
-            message="Backtest status retrieved",
-            data=status
-        )
+    # 완료 후(결과 확정)에만 캐시 - 실행 중에는 결과 dict가 아직 채워지는 중일 수 있음
+    if status.get('status') == 'completed' and status.get('results') is not None:
+        status = {**status, 'results': _encoded_backtest_results(status['results'])}
 
-    except Exception as e:
-        logger.error(f"Failed to get backtest status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return MsgspecResponse(SuccessResponseMsg(
+        success=True,
+        message="Backtest status retrieved",
+        data=status
+    ))
 
 
 @router.post("/update-recommendations", response_model=SuccessResponse)
-async def update_recommendations(current_user: User = Depends(get_current_user)):
+async def update_recommendations(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     코인 추천 목록 업데이트 (비동기)
 
     Returns:
         SuccessResponse: 성공 여부
     """
-    try:
-        bot = get_bot()
-
-        if bot.is_updating_recommendations:
-            return SuccessResponse(
-                success=False,
-                message="Recommendation update already in progress"
-            )
-
-        bot.update_recommendations_async()
-
+    if bot.is_updating_recommendations:
         return SuccessResponse(
-            success=True,
-            message="Recommendation update started"
+            success=False,
+            message="Recommendation update already in progress"
         )
 
-    except Exception as e:
-        logger.error(f"Failed to update recommendations: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    bot.update_recommendations_async()
+
+    return SuccessResponse(
+        success=True,
+        message="Recommendation update started"
+    )
 
 
 @router.post("/config", response_model=SuccessResponse)
-async def update_config(request: UpdateConfigRequest, current_user: User = Depends(get_current_user)):
+async def update_config(request: UpdateConfigRequest, current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     봇 설정 업데이트
 
@@ -239,63 +223,33 @@ async def update_config(request: UpdateConfigRequest, current_user: User = Depen
     Returns:
         SuccessResponse: 성공 여부
     """
-    try:
-        bot = get_bot()
-
-        updated = {}
-
-        if request.trade_amount is not None:
-            bot.trade_amount = request.trade_amount
-            updated['trade_amount'] = request.trade_amount
-
-        if request.target_profit is not None:
-            bot.target_profit = request.target_profit
-            updated['target_profit'] = request.target_profit
-
-        if request.stop_loss is not None:
-            bot.stop_loss = request.stop_loss
-            updated['stop_loss'] = request.stop_loss
-
-        if request.rebuy_threshold is not None:
-            bot.rebuy_threshold = request.rebuy_threshold
-            updated['rebuy_threshold'] = request.rebuy_threshold
-
-        if request.use_net_profit is not None:
-            bot.use_net_profit = request.use_net_profit
-            updated['use_net_profit'] = request.use_net_profit
-
-        if request.use_dynamic_target is not None:
-            bot.use_dynamic_target = request.use_dynamic_target
-            updated['use_dynamic_target'] = request.use_dynamic_target
-
-        if request.use_dynamic_sizing is not None:
-            bot.use_dynamic_sizing = request.use_dynamic_sizing
-            updated['use_dynamic_sizing'] = request.use_dynamic_sizing
-
-        logger.info("=" * 60)
-        logger.info("⚙️ TRADING SETTINGS UPDATED")
-        for key, value in updated.items():
-            if 'profit' in key or 'loss' in key or 'threshold' in key:
-                logger.info(f"   {key}: {value * 100:.1f}%")
-            elif isinstance(value, bool):
-                logger.info(f"   {key}: {'Enabled' if value else 'Disabled'}")
-            else:
-                logger.info(f"   {key}: {value:,.0f} KRW")
-        logger.info("=" * 60)
-
-        return SuccessResponse(
-            success=True,
-            message="Configuration updated successfully",
-            data={"updated": updated}
-        )
-
-    except Exception as e:
-        logger.error(f"Failed to update config: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # 클라이언트가 실제로 보낸 값만 (null은 변경 없음으로 취급)
+    updated = request.model_dump(exclude_unset=True, exclude_none=True)
+
+    # 설정 스냅샷을 한 번에 교체 (필드마다 복사하지 않음)
+    if updated:
+        bot.cfg = replace(bot.cfg, **updated)
+
+    logger.info("=" * 60)
+    logger.info("⚙️ TRADING SETTINGS UPDATED")
+    for key, value in updated.items():
+        if 'profit' in key or 'loss' in key or 'threshold' in key:
+            logger.info(f"   {key}: {value * 100:.1f}%")
+        elif isinstance(value, bool):
+            logger.info(f"   {key}: {'Enabled' if value else 'Disabled'}")
+        else:
+            logger.info(f"   {key}: {value:,.0f} KRW")
+    logger.info("=" * 60)
+
+    return SuccessResponse(
+        success=True,
+        message="Configuration updated successfully",
+        data={"updated": updated}
+    )
 
 
 @router.post("/ticker/toggle", response_model=SuccessResponse)
-async def toggle_ticker(request: TickerToggleRequest, current_user: User = Depends(get_current_user)):
+async def toggle_ticker(request: TickerToggleRequest, current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     티커 추가/제거 토글
 
@@ -305,25 +259,18 @@ async def toggle_ticker(request: TickerToggleRequest, current_user: User = Depen
     Returns:
         SuccessResponse: 성공 여부
     """
-    try:
-        bot = get_bot()
-
-        was_active = request.ticker in bot.tickers
-        bot.toggle_ticker(request.ticker)
-        is_active = request.ticker in bot.tickers
-
-        action = "added" if is_active else "removed"
-
-        return SuccessResponse(
-            success=True,
-            message=f"Ticker {request.ticker} {action}",
-            data={
-                "ticker": request.ticker,
-                "is_active": is_active,
-                "active_tickers": bot.tickers
-            }
-        )
-
-    except Exception as e:
-        logger.error(f"Failed to toggle ticker: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    was_active = bot.has_ticker(request.ticker)
+    bot.toggle_ticker(request.ticker)
+    is_active = bot.has_ticker(request.ticker)
+
+    action = "added" if is_active else "removed"
+
+    return SuccessResponse(
+        success=True,
+        message=f"Ticker {request.ticker} {action}",
+        data={
+            "ticker": request.ticker,
+            "is_active": is_active,
+            "active_tickers": bot.tickers
+        }
+    )
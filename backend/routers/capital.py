@@ -9,6 +9,8 @@ from pydantic import BaseModel
 from typing import List, Optional
 import logging
 
+from core.trading_bot import TradingBot
+from routers.dependencies import get_bot
 from models.schemas import User
 from routers.auth import get_current_user
 
@@ -16,14 +18,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Dependency: Get Trading Bot Instance
-def get_bot():
-    from main import trading_bot
-    if trading_bot is None:
-        raise HTTPException(status_code=503, detail="Trading bot not initialized")
-    return trading_bot
-
-
 class DepositRequest(BaseModel):
     """입금 요청"""
     amount: float
@@ -53,11 +47,11 @@ class CapitalSummary(BaseModel):
 @router.post("/deposit", response_model=TransactionResponse)
 async def add_deposit(
     request: DepositRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """입금 기록 추가"""
     try:
-        bot = get_bot()
         transaction_id = bot.capital.add_deposit(request.amount, request.note)
 
         return TransactionResponse(
@@ -73,11 +67,11 @@ async def add_deposit(
 @router.post("/withdrawal", response_model=TransactionResponse)
 async def add_withdrawal(
     request: WithdrawalRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """출금 기록 추가"""
     try:
-        bot = get_bot()
         transaction_id = bot.capital.add_withdrawal(request.amount, request.note)
 
         return TransactionResponse(
@@ -91,11 +85,9 @@ async def add_withdrawal(
 
 
 @router.get("/summary", response_model=CapitalSummary)
-async def get_capital_summary(current_user: User = Depends(get_current_user)):
+async def get_capital_summary(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """자본 요약 조회"""
     try:
-        bot = get_bot()
-
         return CapitalSummary(
             total_deposits=bot.capital.get_total_deposits(),
             total_withdrawals=bot.capital.get_total_withdrawals(),
@@ -109,12 +101,11 @@ async def get_capital_summary(current_user: User = Depends(get_current_user)):
 @router.get("/transactions")
 async def get_transactions(
     limit: int = 100,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """전체 입출금 내역 조회 (업비트 API)"""
     try:
-        bot = get_bot()
-
         # 업비트 API에서 입출금 내역 가져오기
         deposits_raw = bot.exchange.get_krw_deposits(limit)
         withdrawals_raw = bot.exchange.get_krw_withdrawals(limit)
@@ -157,11 +148,11 @@ async def get_transactions(
 @router.delete("/deposit/{deposit_id}", response_model=TransactionResponse)
 async def delete_deposit(
     deposit_id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """입금 기록 삭제"""
     try:
-        bot = get_bot()
         success = bot.capital.delete_deposit(deposit_id)
 
         if success:
@@ -181,11 +172,11 @@ async def delete_deposit(
 @router.delete("/withdrawal/{withdrawal_id}", response_model=TransactionResponse)
 async def delete_withdrawal(
     withdrawal_id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """출금 기록 삭제"""
     try:
-        bot = get_bot()
         success = bot.capital.delete_withdrawal(withdrawal_id)
 
         if success:
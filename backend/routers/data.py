@@ -5,21 +5,32 @@ Data Router
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import asyncio
+import base64
+import json
 import logging
 import sqlite3
-import pandas as pd
+import time
 from datetime import datetime
 
+from core.trading_bot import TradingBot
+from routers.dependencies import get_bot
 from models.schemas import (
     AccountBalance, TradeHistoryResponse, RecommendationsResponse,
-    CoinRecommendation, OHLCVData, Trade, User
+    CoinRecommendation, OHLCVData, Trade, User, Ticker, encode_json
 )
 
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 목록 검증기를 모듈 로드 시 한 번만 생성 (행마다 모델 생성자를 호출하지 않고 한 번에 검증)
+_TRADES_ADAPTER = TypeAdapter(List[Trade])
+_RECOMMENDATIONS_ADAPTER = TypeAdapter(List[CoinRecommendation])
+
 
 def get_current_user():
     """Import auth dependency to avoid circular imports"""
@@ -27,16 +38,78 @@ def get_current_user():
     return get_current_user
 
 
-def get_bot():
-    """봇 인스턴스 가져오기"""
-    from main import trading_bot
-    if trading_bot is None:
-        raise HTTPException(status_code=500, detail="Bot not initialized")
-    return trading_bot
+# 대시보드 조회 캐시: 프론트엔드가 폴링하는 잔액/통계/포지션을 항목별로 짧게 공유
+# TTL 안의 요청과 동시에 들어온 미스는 같은 결과를 사용 (클라이언트 수와 무관하게 항목별 상류 호출 최대 2회/초)
+# 항목마다 따로 캐시하므로 /statistics는 거래소 REST 호출을 기다리지 않고, 한 항목의 실패가 다른 엔드포인트로 번지지 않음
+DASHBOARD_SNAPSHOT_TTL = 0.5
+_dashboard_cache: Dict[str, Tuple[float, Any]] = {}
+_dashboard_locks: Dict[str, asyncio.Lock] = {
+    "balance": asyncio.Lock(),
+    "statistics": asyncio.Lock(),
+    "positions": asyncio.Lock(),
+}
+
+
+def _build_positions(bot: TradingBot) -> List[Dict]:
+    """현재 보유 포지션 목록 생성 (가격 REST 호출 포함 - 워커 스레드에서 실행)"""
+    held = bot.positions  # Copy-on-Write 스냅샷
+
+    # 현재 가격 일괄 조회 (REST 1회, 조회 실패한 티커는 None)
+    prices = bot.exchange.get_current_prices(list(held)) if held else {}
+
+    positions = []
+    for ticker, position in held.items():
+        current_price = prices.get(ticker)
+
+        # 수익률 계산
+        profit_rate = 0
+        if current_price and position['entry_price'] > 0:
+            profit_rate = (current_price - position['entry_price']) / position['entry_price']
+
+        positions.append({
+            "ticker": ticker,
+            "entry_price": position['entry_price'],
+            "amount": position['amount'],
+            "entry_time": datetime.fromtimestamp(position['entry_ts']).isoformat(),
+            "current_price": current_price,
+            "profit_rate": profit_rate,
+            "profit_pct": profit_rate * 100
+        })
+
+    return positions
+
+
+def _fresh_dashboard_item(name: str) -> Tuple[bool, Any]:
+    """유효한 캐시 항목 (hit 여부, 값) 반환"""
+    cached = _dashboard_cache.get(name)
+    if cached is not None and cached[0] > time.monotonic():
+        return True, cached[1]
+    return False, None
+
+
+async def get_dashboard_item(name: str, func: Callable[..., Any], *args: Any) -> Any:
+    """
+    대시보드 항목 조회 (워커 스레드에서 실행, 항목별로 DASHBOARD_SNAPSHOT_TTL 동안 캐시)
+
+    실패(예외)는 캐시하지 않고 해당 요청에만 전달됩니다.
+    """
+    hit, value = _fresh_dashboard_item(name)
+    if hit:
+        return value
+
+    async with _dashboard_locks[name]:
+        # 락을 기다리는 동안 다른 요청이 갱신했으면 그 결과 사용
+        hit, value = _fresh_dashboard_item(name)
+        if hit:
+            return value
+
+        value = await asyncio.to_thread(func, *args)
+        _dashboard_cache[name] = (time.monotonic() + DASHBOARD_SNAPSHOT_TTL, value)
+        return value
 
 
 @router.get("/balance", response_model=AccountBalance)
-async def get_account_balance(current_user: User = Depends(get_current_user)):
+async def get_account_balance(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     계좌 잔액 조회
 
@@ -44,105 +117,152 @@ async def get_account_balance(current_user: User = Depends(get_current_user)):
         AccountBalance: KRW 잔액 및 보유 코인 정보
     """
     try:
-        bot = get_bot()
-        balance = bot.get_account_balance()
+        balance = await get_dashboard_item("balance", bot.get_account_balance)
         return AccountBalance(**balance)
     except Exception as e:
         logger.error(f"Failed to get account balance: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _encode_cursor(timestamp: str, trade_id: int) -> str:
+    """마지막 행의 (timestamp, id)를 키셋 커서 문자열로 인코딩"""
+    return base64.urlsafe_b64encode(json.dumps([timestamp, trade_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    """키셋 커서 디코딩 (형식이 잘못되면 400)"""
+    try:
+        timestamp, trade_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(timestamp), int(trade_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _fetch_history(
+    memory,
+    status: Optional[str],
+    page: int,
+    page_size: int,
+    keyset: Optional[Tuple[str, int]]
+) -> Tuple[List[sqlite3.Row], int]:
+    """
+    거래 내역 페이지 조회 (동기 SQL - 워커 스레드에서 실행)
+
+    Returns:
+        (rows, total): 페이지 행 리스트와 전체 개수
+    """
+    where = "WHERE status = ?" if status else ""
+    filter_params = (status,) if status else ()
+
+    # DB 조회 (풀에서 빌린 조회 전용 연결 사용)
+    with memory.read_connection() as conn:
+        if keyset:
+            # 키셋 페이지네이션: 마지막으로 본 (timestamp, id) 이후부터 인덱스 탐색
+            last_timestamp, last_id = keyset
+            keyset_where = f"{where} {'AND' if where else 'WHERE'} (timestamp, id) < (?, ?)"
+            query = f"""
+                SELECT
+                    id, ticker, timestamp, entry_price, exit_price,
+                    profit_rate, is_profitable, model_confidence, status
+                FROM trades
+                {keyset_where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            """
+            rows = conn.execute(query, (*filter_params, last_timestamp, last_id, page_size)).fetchall()
+            total = conn.execute(f"SELECT COUNT(*) FROM trades {where}", filter_params).fetchone()[0]
+        else:
+            # 데이터 + 전체 개수를 한 번에 조회 (COUNT(*) OVER (): 별도 COUNT 쿼리 불필요)
+            query = f"""
+                SELECT
+                    id, ticker, timestamp, entry_price, exit_price,
+                    profit_rate, is_profitable, model_confidence, status,
+                    COUNT(*) OVER () AS _total
+                FROM trades
+                {where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ? OFFSET ?
+            """
+            rows = conn.execute(query, (*filter_params, page_size, (page - 1) * page_size)).fetchall()
+
+            if rows:
+                total = rows[0]["_total"]
+            else:
+                # 범위를 벗어난 페이지 → 행이 없어 윈도 결과도 없으므로 개수만 따로 조회
+                total = conn.execute(f"SELECT COUNT(*) FROM trades {where}", filter_params).fetchone()[0]
+
+    return rows, total
+
+
 @router.get("/history", response_model=TradeHistoryResponse)
 async def get_trade_history(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by status (open/closed)"),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the previous page (next_cursor)"),
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """
     거래 내역 조회 (페이지네이션)
 
     Args:
-        page: 페이지 번호 (1부터 시작)
+        page: 페이지 번호 (1부터 시작, cursor가 없을 때만 사용)
         page_size: 페이지당 항목 수 (1~100)
         status: 상태 필터 (open/closed)
+        cursor: 이전 응답의 next_cursor (있으면 OFFSET 없이 인덱스 탐색으로 다음 페이지 조회)
 
     Returns:
         TradeHistoryResponse: 거래 내역 리스트
     """
     try:
-        bot = get_bot()
-
-        # DB 조회 (use context manager for safe connection handling)
-        with sqlite3.connect(bot.memory.db_path) as conn:
-            # 전체 개수 (parameterized query for safety)
-            if status:
-                count_query = "SELECT COUNT(*) FROM trades WHERE status = ?"
-                total = pd.read_sql_query(count_query, conn, params=(status,)).iloc[0, 0]
-            else:
-                count_query = "SELECT COUNT(*) FROM trades"
-                total = pd.read_sql_query(count_query, conn).iloc[0, 0]
-
-            # 데이터 조회 (parameterized query)
-            if status:
-                query = """
-                    SELECT
-                        id, ticker, timestamp, entry_price, exit_price,
-                        profit_rate, is_profitable, model_confidence, status
-                    FROM trades
-                    WHERE status = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ? OFFSET ?
-                """
-                df = pd.read_sql_query(query, conn, params=(status, page_size, (page - 1) * page_size))
-            else:
-                query = """
-                    SELECT
-                        id, ticker, timestamp, entry_price, exit_price,
-                        profit_rate, is_profitable, model_confidence, status
-                    FROM trades
-                    ORDER BY timestamp DESC
-                    LIMIT ? OFFSET ?
-                """
-                df = pd.read_sql_query(query, conn, params=(page_size, (page - 1) * page_size))
-
-        # Trade 모델로 변환
-        trades = []
-        for _, row in df.iterrows():
-            trades.append(Trade(
-                id=int(row['id']) if pd.notna(row['id']) else None,
-                ticker=row['ticker'],
-                timestamp=row['timestamp'],
-                entry_price=float(row['entry_price']),
-                exit_price=float(row['exit_price']) if pd.notna(row['exit_price']) else None,
-                profit_rate=float(row['profit_rate']) if pd.notna(row['profit_rate']) else None,
-                is_profitable=bool(row['is_profitable']) if pd.notna(row['is_profitable']) else None,
-                model_confidence=float(row['model_confidence']),
-                status=row['status']
-            ))
+        keyset = _decode_cursor(cursor) if cursor else None
+
+        # SQL은 워커 스레드에서 실행 (큰 스캔 중에도 WebSocket 푸시 등 이벤트 루프가 막히지 않음)
+        rows, total = await asyncio.to_thread(_fetch_history, bot.memory, status, page, page_size, keyset)
+
+        next_cursor = _encode_cursor(rows[-1]["timestamp"], rows[-1]["id"]) if len(rows) == page_size else None
+
+        # Trade 리스트로 일괄 변환 (sqlite3.Row → dict, 값은 이미 파이썬 기본 타입이므로 형변환 불필요)
+        # 윈도 집계 열 _total은 Trade 스키마 밖이므로 무시됨
+        trades = _TRADES_ADAPTER.validate_python([dict(r) for r in rows])
 
         return TradeHistoryResponse(
             trades=trades,
             total=int(total),
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get trade history: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# 추천 목록 응답 캐시: (bot.recommended_coins_version, 인코딩된 JSON)
+# 추천 목록은 몇 분마다만 바뀌므로 버전이 같으면 모델 생성/직렬화 없이 그대로 반환
+_recommendations_cache: Tuple[Optional[int], Optional[bytes]] = (None, None)
+
+
 @router.get("/recommendations", response_model=RecommendationsResponse)
-async def get_recommendations(current_user: User = Depends(get_current_user)):
+async def get_recommendations(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     AI 추천 코인 목록 조회
 
     Returns:
-        RecommendationsResponse: 추천 코인 리스트 (상위 5개)
+        RecommendationsResponse: 추천 코인 리스트 (상위 5개, updated_at은 목록이 갱신된 뒤 처음 응답한 시각)
     """
+    global _recommendations_cache
+
     try:
-        bot = get_bot()
+        # 버전을 목록보다 먼저 읽음 → 그 사이 교체되면 새 목록이 이전 버전으로 저장되어 다음 요청에서 다시 생성
+        version = bot.recommended_coins_version
+        cached_version, body = _recommendations_cache
+        if body is not None and cached_version == version:
+            return Response(content=body, media_type="application/json")
 
         # 캐시된 추천 목록 사용
         recs = bot.recommended_coins
@@ -151,70 +271,128 @@ async def get_recommendations(current_user: User = Depends(get_current_user)):
         if not recs:
             recs = bot.update_coin_recommendations()
 
-        # CoinRecommendation 모델로 변환
-        recommendations = []
-        for rec in recs:
-            recommendations.append(CoinRecommendation(
-                ticker=rec['ticker'],
-                score=rec['score'],
-                confidence=rec['confidence'],
-                recommendation=rec['recommendation'],
-                current_price=rec.get('current_price'),
-                features=rec['features']
-            ))
-
-        return RecommendationsResponse(
+        # CoinRecommendation 리스트로 일괄 변환 (current_price는 없을 수 있음)
+        recommendations = _RECOMMENDATIONS_ADAPTER.validate_python(
+            [{**rec, 'current_price': rec.get('current_price')} for rec in recs]
+        )
+
+        body = RecommendationsResponse(
             recommendations=recommendations,
             updated_at=datetime.now().isoformat()
-        )
+        ).model_dump_json().encode()
+
+        # 빈 목록은 캐시하지 않음 (다음 요청에서 다시 생성 시도)
+        if recs:
+            _recommendations_cache = (version, body)
+
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Failed to get recommendations: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# OHLCV 응답 캐시: (ticker, interval) → (만료 시각, 인코딩된 JSON)
+# 캔들은 간격 단위로만 바뀌므로 업비트 REST 호출과 변환/직렬화를 TTL 동안 재사용
+# 일/주/월봉도 현재 캔들은 계속 갱신되므로 TTL은 최대 5분으로 제한
+OHLCV_CACHE_TTL = {
+    'minute1': 20, 'minute3': 60, 'minute5': 120, 'minute10': 180, 'minute15': 300,
+    'minute30': 300, 'minute60': 300, 'minute240': 300, 'day': 300, 'week': 300, 'month': 300,
+}
+# pyupbit가 지원하는 캔들 간격 전체 (그 외 값은 422)
+OHLCVInterval = Literal[
+    'minute1', 'minute3', 'minute5', 'minute10', 'minute15', 'minute30',
+    'minute60', 'minute240', 'day', 'week', 'month'
+]
+OHLCV_CACHE_MAX_SIZE = 512
+_ohlcv_cache: Dict[Tuple[str, str], Tuple[float, bytes]] = {}
+_ohlcv_locks: Dict[Tuple[str, str], asyncio.Lock] = {}  # 조회 중인 키만 보관 (조회 후 제거)
+
+
+def _get_cached_ohlcv(key: Tuple[str, str]) -> Optional[bytes]:
+    """유효한 캐시 항목 반환 (없거나 만료되면 None)"""
+    cached = _ohlcv_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _cache_ohlcv(key: Tuple[str, str], body: bytes):
+    """OHLCV 응답 캐시 등록 (가득 차면 만료 항목 정리, 그래도 가득 차면 비움)"""
+    now = time.monotonic()
+    if len(_ohlcv_cache) >= OHLCV_CACHE_MAX_SIZE:
+        for k in [k for k, (expires, _) in _ohlcv_cache.items() if expires <= now]:
+            del _ohlcv_cache[k]
+        if len(_ohlcv_cache) >= OHLCV_CACHE_MAX_SIZE:
+            _ohlcv_cache.clear()
+    _ohlcv_cache[key] = (now + OHLCV_CACHE_TTL[key[1]], body)
+
+
 @router.get("/ohlcv/{ticker}", response_model=OHLCVData)
 async def get_ohlcv_data(
-    ticker: str,
-    interval: str = Query("day", description="Candle interval (minute1, minute3, minute5, day)"),
-    current_user: User = Depends(get_current_user)
+    ticker: Ticker,
+    interval: OHLCVInterval = Query(
+        "day",
+        description="Candle interval (minute1/3/5/10/15/30/60/240, day, week, month)"
+    ),
+    current_user: User = Depends(get_current_user),
+    bot: TradingBot = Depends(get_bot)
 ):
     """
     OHLCV 차트 데이터 조회
 
     Args:
         ticker: 코인 티커 (예: BTC, ETH)
-        interval: 캔들 간격 (minute1, minute3, minute5, day)
+        interval: 캔들 간격 (minute1/3/5/10/15/30/60/240, day, week, month)
 
     Returns:
-        OHLCVData: OHLCV 데이터
+        OHLCVData: OHLCV 데이터 (간격별 TTL 동안 캐시된 응답)
     """
+    key = (ticker, interval)
+    body = _get_cached_ohlcv(key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
     try:
-        bot = get_bot()
-
-        # 데이터 조회
-        df = bot.exchange.get_ohlcv(ticker, interval=interval)
-
-        if df is None or df.empty:
-            raise HTTPException(status_code=404, detail=f"No data found for {ticker}")
-
-        # DataFrame을 dict 리스트로 변환
-        data = []
-        for idx, row in df.iterrows():
-            data.append({
-                "timestamp": idx.isoformat() if hasattr(idx, 'isoformat') else str(idx),
-                "open": float(row['open']),
-                "high": float(row['high']),
-                "low": float(row['low']),
-                "close": float(row['close']),
-                "volume": float(row['volume']) if 'volume' in row else 0
-            })
-
-        return OHLCVData(
-            ticker=ticker,
-            interval=interval,
-            data=data
-        )
+        # 같은 키의 동시 미스는 한 번만 조회 (나머지는 락 해제 후 캐시 사용)
+        lock = _ohlcv_locks.get(key)
+        if lock is None:
+            lock = _ohlcv_locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                body = _get_cached_ohlcv(key)
+                if body is None:
+                    # 데이터 조회 (REST 호출 → 이벤트 루프 밖에서 실행)
+                    df = await asyncio.to_thread(bot.exchange.get_ohlcv, ticker, interval=interval)
+
+                    if df is None or df.empty:
+                        raise HTTPException(status_code=404, detail=f"No data found for {ticker}")
+
+                    # DataFrame을 dict 리스트로 변환 (열 단위로 한 번에 추출 후 조립)
+                    if hasattr(df.index, 'strftime'):
+                        timestamps = df.index.strftime('%Y-%m-%dT%H:%M:%S').tolist()
+                    else:
+                        timestamps = [str(idx) for idx in df.index]
+                    ohlc = df[['open', 'high', 'low', 'close']].to_numpy(dtype=float).tolist()
+                    volumes = df['volume'].to_numpy(dtype=float).tolist() if 'volume' in df.columns else [0.0] * len(df)
+
+                    data = [
+                        {"timestamp": ts, "open": o, "high": h, "low": l, "close": c, "volume": v}
+                        for ts, (o, h, l, c), v in zip(timestamps, ohlc, volumes)
+                    ]
+
+                    body = encode_json({
+                        "ticker": ticker,
+                        "interval": interval,
+                        "data": data
+                    })
+                    _cache_ohlcv(key, body)
+        finally:
+            # 대기 중인 요청이 없으면 락 제거 (키가 요청 파라미터에서 오므로 누적 방지)
+            if not lock.locked() and _ohlcv_locks.get(key) is lock:
+                del _ohlcv_locks[key]
+
+        return Response(content=body, media_type="application/json")
 
     except HTTPException:
         raise
@@ -224,7 +402,7 @@ async def get_ohlcv_data(
 
 
 @router.get("/statistics")
-async def get_statistics(current_user: User = Depends(get_current_user)):
+async def get_statistics(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     트레이딩 통계 조회
 
@@ -232,12 +410,11 @@ async def get_statistics(current_user: User = Depends(get_current_user)):
         dict: 통계 정보 (승률, 평균 수익률, 총 거래 수 등)
     """
     try:
-        bot = get_bot()
-        stats = bot.memory.get_statistics()
+        statistics = await get_dashboard_item("statistics", bot.memory.get_statistics)
 
         return {
             "success": True,
-            "data": stats
+            "data": statistics
         }
 
     except Exception as e:
@@ -246,7 +423,7 @@ async def get_statistics(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/positions")
-async def get_current_positions(current_user: User = Depends(get_current_user)):
+async def get_current_positions(current_user: User = Depends(get_current_user), bot: TradingBot = Depends(get_bot)):
     """
     현재 보유 포지션 조회
 
@@ -254,27 +431,7 @@ async def get_current_positions(current_user: User = Depends(get_current_user)):
         dict: 현재 보유 중인 포지션 정보
     """
     try:
-        bot = get_bot()
-
-        positions = []
-        for ticker, position in bot.positions.items():
-            # 현재 가격 조회
-            current_price = bot.exchange.get_current_price(ticker)
-
-            # 수익률 계산
-            profit_rate = 0
-            if current_price and position['entry_price'] > 0:
-                profit_rate = (current_price - position['entry_price']) / position['entry_price']
-
-            positions.append({
-                "ticker": ticker,
-                "entry_price": position['entry_price'],
-                "amount": position['amount'],
-                "entry_time": position['entry_time'].isoformat() if hasattr(position['entry_time'], 'isoformat') else str(position['entry_time']),
-                "current_price": current_price,
-                "profit_rate": profit_rate,
-                "profit_pct": profit_rate * 100
-            })
+        positions = await get_dashboard_item("positions", _build_positions, bot)
 
         return {
             "success": True,
@@ -0,0 +1,22 @@
+"""
+Router Dependencies
+===================
+라우터들이 공유하는 FastAPI 의존성
+"""
+
+from fastapi import HTTPException, Request
+
+from core.trading_bot import TradingBot
+
+
+def get_bot(request: Request) -> TradingBot:
+    """
+    봇 인스턴스 가져오기 (lifespan에서 app.state에 등록)
+
+    Raises:
+        HTTPException: 봇이 아직 초기화되지 않은 경우 (503)
+    """
+    trading_bot = getattr(request.app.state, "trading_bot", None)
+    if trading_bot is None:
+        raise HTTPException(status_code=503, detail="Trading bot not initialized")
+    return trading_bot
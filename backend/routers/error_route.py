@@ -0,0 +1,38 @@
+"""
+Error Logging Route
+===================
+핸들러마다 반복되던 try/except(로그 + 500 응답)를 라우트 단위로 처리하는 APIRoute
+"""
+
+import logging
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+
+class ErrorLoggingRoute(APIRoute):
+    """
+    예상치 못한 예외를 로그로 남기고 HTTP 500으로 변환
+
+    HTTPException / 요청 검증 오류는 그대로 전달됩니다.
+    로그 메시지는 핸들러 이름 기준 (예: get_bot_status → "Failed to get bot status: ...")
+    """
+
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+        action = self.name.replace("_", " ")
+        logger = logging.getLogger(self.endpoint.__module__)
+
+        async def error_logging_handler(request: Request) -> Response:
+            try:
+                return await route_handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.error(f"Failed to {action}: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        return error_logging_handler
@@ -4,13 +4,13 @@ WebSocket Router
 실시간 데이터 스트리밍 (로그, 가격, 상태 변경 등)
 """
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Set
+from fastapi import APIRouter, FastAPI, WebSocket, WebSocketDisconnect
+from typing import Dict, Optional
 import logging
 import asyncio
-import json
 from datetime import datetime
-import traceback
+
+from models.schemas import BotStatusMsg, encode_json
 
 
 router = APIRouter()
@@ -18,56 +18,155 @@ logger = logging.getLogger(__name__)
 
 
 def safe_json_dumps(data: dict) -> str:
-    """JSON 직렬화 안전하게 수행 (nan/inf 처리)"""
-    def sanitize(obj):
-        if isinstance(obj, float):
-            if obj != obj or obj == float('inf') or obj == float('-inf'):  # nan or inf
-                return 0.0
-        return obj
-
-    return json.dumps(data, default=str)
+    """JSON 직렬화 안전하게 수행 (nan/inf → null, numpy/datetime 등 변환)"""
+    return encode_json(data).decode()
 
 
 # 연결된 클라이언트 관리
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+        # id(websocket) → websocket (브로드캐스트마다 리스트로 복사하지 않고 바로 순회)
+        self.active_connections: Dict[int, WebSocket] = {}
 
     async def connect(self, websocket: WebSocket):
         """클라이언트 연결"""
         await websocket.accept()
-        self.active_connections.add(websocket)
+        self.active_connections[id(websocket)] = websocket
         logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """클라이언트 연결 해제"""
-        self.active_connections.discard(websocket)
+        self.active_connections.pop(id(websocket), None)
         logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
 
     async def broadcast(self, message: dict):
         """모든 클라이언트에게 메시지 전송"""
-        disconnected = set()
+        if not self.active_connections:
+            return  # 구독자가 없으면 인코딩도 생략
+        # 클라이언트 수와 무관하게 1회만 인코딩
+        await self.broadcast_text(safe_json_dumps(message))
+
+    async def broadcast_text(self, text: str):
+        """이미 인코딩된 메시지를 모든 클라이언트에게 동시에 전송 (느린 클라이언트가 나머지를 지연시키지 않음)"""
+        connections = self.active_connections
+        if not connections:
+            return
+
+        results = await asyncio.gather(
+            *(self._send(key, connection, text) for key, connection in connections.items())
+        )
+
+        # 전송 실패(연결 끊김)가 있을 때만 새 dict로 교체
+        failed = {key for key in results if key is not None}
+        if failed:
+            self.active_connections = {
+                key: connection for key, connection in self.active_connections.items()
+                if key not in failed
+            }
+            logger.info(f"Removed {len(failed)} disconnected clients. Total connections: {len(self.active_connections)}")
+
+    @staticmethod
+    async def _send(key: int, connection: WebSocket, text: str) -> Optional[int]:
+        """단일 클라이언트 전송 (실패하면 해당 키 반환)"""
+        try:
+            await connection.send_text(text)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to send message to client: {e}")
+            return key
 
-        for connection in self.active_connections:
-            try:
-                # datetime 직렬화 문제 해결을 위해 default=str 사용
-                await connection.send_text(json.dumps(message, default=str))
-            except Exception as e:
-                logger.error(f"Failed to send message to client: {e}")
-                disconnected.add(connection)
 
-        # 연결 끊긴 클라이언트 제거
-        for conn in disconnected:
-            self.disconnect(conn)
+manager = ConnectionManager()
 
 
-manager = ConnectionManager()
+# ============================================================
+# 상태 스냅샷 브로드캐스터
+# 클라이언트마다 get_status()/가격 조회/직렬화를 반복하지 않고,
+# 주기마다 한 번 계산·인코딩한 결과를 REST(/api/bot/status)와 WS 푸시가 공유
+# ============================================================
+STATUS_SNAPSHOT_INTERVAL = 0.2  # 상태 스냅샷 갱신 주기 (초)
+STATUS_PUSH_INTERVAL = 10       # WebSocket 상태 푸시 주기 (초)
+STATUS_PUSH_MAX_TICKERS = 10    # 푸시에 포함할 최대 가격 수 (속도 개선)
+STATUS_IDLE_TIMEOUT = 5.0       # 마지막 REST 폴링 후 이 시간이 지나고 WS 구독자도 없으면 갱신 중단 (초)
+STATUS_SNAPSHOT_MAX_AGE = 1.0   # 이보다 오래된 스냅샷은 REST 응답에 쓰지 않음 (초)
+
+_status_snapshot: Optional[BotStatusMsg] = None
+_status_snapshot_bytes: Optional[bytes] = None
+_status_snapshot_at = float("-inf")  # 스냅샷 갱신 시각 (loop.time)
+_last_status_poll = float("-inf")    # 마지막 REST 상태 조회 시각 (loop.time)
+
+
+def get_status_snapshot_bytes() -> Optional[bytes]:
+    """
+    최근 상태 스냅샷 (JSON bytes), REST 상태 조회 시 호출
+
+    조회 시각을 기록하여 브로드캐스터가 갱신을 이어가게 합니다.
+    브로드캐스터 시작 전이거나 유휴 상태였어서 스냅샷이 오래되었으면 None.
+    """
+    global _last_status_poll
+    now = asyncio.get_running_loop().time()
+    _last_status_poll = now
+    if now - _status_snapshot_at > STATUS_SNAPSHOT_MAX_AGE:
+        return None
+    return _status_snapshot_bytes
+
+
+def _status_snapshot_fresh() -> bool:
+    """최근 스냅샷이 REST/초기 전송에 쓸 만큼 최신인지"""
+    return asyncio.get_running_loop().time() - _status_snapshot_at <= STATUS_SNAPSHOT_MAX_AGE
+
+
+async def status_broadcaster(app: FastAPI):
+    """
+    상태 스냅샷 갱신 + 구독자 일괄 푸시 (lifespan에서 백그라운드 태스크로 실행)
+
+    - STATUS_SNAPSHOT_INTERVAL마다 get_status() 1회 → 인코딩 1회
+      (통계 조회에 SQLite를 읽을 수 있으므로 이벤트 루프 밖 스레드에서 실행)
+    - WS 구독자가 없고 최근 REST 폴링도 없으면 갱신을 건너뜀
+    - STATUS_PUSH_INTERVAL마다 가격을 일괄 조회하여 모든 클라이언트에 같은 메시지 전송
+    """
+    global _status_snapshot, _status_snapshot_bytes, _status_snapshot_at
+
+    loop = asyncio.get_running_loop()
+    last_push = loop.time()
+
+    while True:
+        try:
+            bot = get_bot(app)
+            idle = (
+                not manager.active_connections
+                and loop.time() - _last_status_poll > STATUS_IDLE_TIMEOUT
+            )
+            if bot and not idle:
+                status = await asyncio.to_thread(bot.get_status)
+                _status_snapshot = BotStatusMsg(**status)
+                _status_snapshot_bytes = encode_json(_status_snapshot)
+
+                now = loop.time()
+                _status_snapshot_at = now
+                if manager.active_connections and now - last_push >= STATUS_PUSH_INTERVAL:
+                    last_push = now
+                    # 현재 가격 정보 (REST 호출 가능 → 이벤트 루프 밖에서 일괄 조회)
+                    prices = await asyncio.to_thread(
+                        bot.exchange.get_current_prices, bot.tickers[:STATUS_PUSH_MAX_TICKERS]
+                    )
+                    await manager.broadcast_text(safe_json_dumps({
+                        "type": "update",
+                        "data": {
+                            "status": _status_snapshot,
+                            "prices": prices
+                        },
+                        "timestamp": datetime.now().isoformat()
+                    }))
+        except Exception as e:
+            logger.warning(f"Status broadcaster error: {e}")
+
+        await asyncio.sleep(STATUS_SNAPSHOT_INTERVAL)
 
 
-def get_bot():
-    """봇 인스턴스 가져오기"""
-    from main import trading_bot
-    return trading_bot
+def get_bot(app: FastAPI):
+    """봇 인스턴스 가져오기 (lifespan에서 app.state에 등록, 없으면 None)"""
+    return getattr(app.state, "trading_bot", None)
 
 
 @router.websocket("/live")
@@ -82,110 +181,84 @@ async def websocket_live_updates(websocket: WebSocket):
     - log: 로그 메시지
     """
     await manager.connect(websocket)
-    update_interval = 10  # 10초마다 상태 업데이트
+    update_interval = STATUS_PUSH_INTERVAL  # 상태 업데이트는 status_broadcaster가 일괄 푸시
     client_timeout = 120  # 클라이언트 메시지 타임아웃 2분 (백그라운드 탭 고려)
 
     try:
-        # 초기 상태 전송
-        bot = get_bot()
+        # 초기 상태 전송 (최근 스냅샷 재사용)
+        bot = get_bot(websocket.app)
         if bot:
             try:
-                status = bot.get_status()
-                await websocket.send_text(json.dumps({
+                if _status_snapshot is not None and _status_snapshot_fresh():
+                    status = _status_snapshot
+                else:
+                    status = BotStatusMsg(**await asyncio.to_thread(bot.get_status))
+                await websocket.send_text(safe_json_dumps({
                     "type": "status",
                     "data": status,
                     "timestamp": datetime.now().isoformat()
-                }, default=str))
+                }))
             except Exception as e:
                 logger.warning(f"Failed to send initial status: {e}")
 
-        last_client_message = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        last_client_message = loop.time()
 
-        # 클라이언트로부터 메시지 수신 대기
-        while True:
-            try:
-                # 클라이언트 메시지 수신 (keep-alive) - update_interval 타임아웃
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=float(update_interval)
-                )
-                last_client_message = asyncio.get_event_loop().time()
+        # 클라이언트 메시지 수신 태스크는 메시지가 도착했을 때만 새로 만듦
+        # (asyncio.wait 타임아웃은 예외를 던지거나 수신을 취소하지 않음)
+        recv_task = asyncio.create_task(websocket.receive_text())
+        try:
+            while True:
+                done, _ = await asyncio.wait({recv_task}, timeout=float(update_interval))
 
-                # ping/pong 처리
-                if data == "ping":
-                    await websocket.send_text(json.dumps({
-                        "type": "pong",
-                        "timestamp": datetime.now().isoformat()
-                    }, default=str))
-
-            except asyncio.TimeoutError:
-                # 클라이언트 타임아웃 체크 (백그라운드 탭이 오래 방치된 경우)
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_client_message > client_timeout:
-                    logger.info("Client inactive for too long, closing connection")
-                    break
+                if not done:
+                    # 클라이언트 타임아웃 체크 (백그라운드 탭이 오래 방치된 경우)
+                    if loop.time() - last_client_message > client_timeout:
+                        logger.info("Client inactive for too long, closing connection")
+                        break
 
-                # 주기적으로 상태 업데이트 전송 + 서버 heartbeat
-                if bot:
-                    try:
-                        # 봇 상태
-                        status = bot.get_status()
-
-                        # 현재 가격 정보
-                        prices = {}
-                        for ticker in bot.tickers[:10]:  # 최대 10개만 조회 (속도 개선)
-                            try:
-                                price = bot.exchange.get_current_price(ticker)
-                                if price:
-                                    prices[ticker] = price
-                            except Exception:
-                                pass  # 개별 가격 조회 실패는 무시
-
-                        # 상태 전송
-                        await websocket.send_text(json.dumps({
-                            "type": "update",
-                            "data": {
-                                "status": status,
-                                "prices": prices
-                            },
-                            "timestamp": datetime.now().isoformat()
-                        }, default=str))
-
-                    except Exception as e:
-                        logger.warning(f"Error preparing update: {e}")
-                        # 연결 유지를 위해 최소한 heartbeat 전송
+                    # 봇이 있으면 status_broadcaster가 상태 업데이트를 푸시
+                    if not bot:
+                        # 봇이 없어도 heartbeat 전송하여 연결 유지
                         try:
-                            await websocket.send_text(json.dumps({
+                            await websocket.send_text(safe_json_dumps({
                                 "type": "heartbeat",
                                 "timestamp": datetime.now().isoformat()
                             }))
                         except Exception:
-                            break  # heartbeat도 실패하면 연결 종료
-                else:
-                    # 봇이 없어도 heartbeat 전송하여 연결 유지
-                    try:
-                        await websocket.send_text(json.dumps({
-                            "type": "heartbeat",
-                            "timestamp": datetime.now().isoformat()
-                        }))
-                    except Exception:
-                        break
+                            break
+                    continue
 
-            except WebSocketDisconnect:
-                logger.info("Client initiated disconnect")
-                break
+                try:
+                    data = recv_task.result()
+                except WebSocketDisconnect:
+                    logger.info("Client initiated disconnect")
+                    break
+                except Exception as e:
+                    # 예상치 못한 에러 - 로깅 후 계속 시도
+                    logger.warning(f"WebSocket receive error: {type(e).__name__}: {e}")
+                    await asyncio.sleep(1)  # 잠시 대기 후 재시도
+                    recv_task = asyncio.create_task(websocket.receive_text())
+                    continue
 
-            except Exception as e:
-                # 예상치 못한 에러 - 로깅 후 계속 시도
-                logger.warning(f"WebSocket receive error: {type(e).__name__}: {e}")
-                await asyncio.sleep(1)  # 잠시 대기 후 재시도
+                last_client_message = loop.time()
+                recv_task = asyncio.create_task(websocket.receive_text())
+
+                # ping/pong 처리
+                if data == "ping":
+                    await websocket.send_text(safe_json_dumps({
+                        "type": "pong",
+                        "timestamp": datetime.now().isoformat()
+                    }))
+        finally:
+            recv_task.cancel()
 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected normally")
 
     except Exception as e:
         logger.error(f"WebSocket error: {type(e).__name__}: {e}")
-        logger.debug(traceback.format_exc())
+        logger.debug("WebSocket error traceback", exc_info=True)
 
     finally:
         manager.disconnect(websocket)
@@ -212,12 +285,12 @@ async def websocket_logs(websocket: WebSocket):
                 await asyncio.sleep(5)
 
                 # 로그 메시지 전송 (실제로는 로그 핸들러에서 가져와야 함)
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(safe_json_dumps({
                     "type": "log",
                     "level": "info",
                     "message": "System is running normally",
                     "timestamp": datetime.now().isoformat()
-                }, default=str))
+                }))
 
             except WebSocketDisconnect:
                 break
@@ -1,8 +1,8 @@
 import sqlite3
-import pandas as pd
 import os
 
 DB_PATH = "data/trade_memory.db"
+DELETE_CHUNK_SIZE = 10000  # 한 번의 트랜잭션에서 삭제할 최대 행 수
 
 def clean_database():
     if not os.path.exists(DB_PATH):
@@ -12,37 +12,55 @@ def clean_database():
     try:
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
+
+        # 대량 삭제용 설정 (WAL + 메모리 임시 저장소 + 200MB 페이지 캐시)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-200000")
         
         # 1. 전체 데이터 수 확인
         cursor.execute("SELECT COUNT(*) FROM trades")
         total_before = cursor.fetchone()[0]
         print(f"📊 Total Records Before: {total_before}")
         
-        # 2. NULL 값을 가진 레코드 확인 (rsi_change는 새로 추가된 컬럼)
+        # 2. NULL 값을 가진 레코드 삭제 (rsi_change는 새로 추가된 컬럼)
         # 새로 추가된 컬럼 중 하나라도 NULL이면 삭제 대상
-        cursor.execute("""
-            SELECT COUNT(*) FROM trades 
-            WHERE rsi_change IS NULL 
-               OR volume_trend IS NULL
-               OR profit_class IS NULL
-        """)
-        null_count = cursor.fetchone()[0]
-        print(f"🗑️ Records with NULL features: {null_count}")
-        
-        if null_count > 0:
-            # 3. NULL 데이터 삭제
-            cursor.execute("""
-                DELETE FROM trades 
-                WHERE rsi_change IS NULL 
-                   OR volume_trend IS NULL
-                   OR profit_class IS NULL
-            """)
+        # 청크 단위로 삭제/커밋하여 쓰기 잠금을 짧게 유지 (봇의 기록/조회가 사이사이 진행됨)
+        # 봇이 추가한 missing_mask 생성 컬럼이 있으면 부분 인덱스(idx_trades_missing) 탐색으로 대상 선별
+        columns = {row[1] for row in cursor.execute("PRAGMA table_xinfo(trades)")}
+        if "missing_mask" in columns:
+            missing_where = "missing_mask > 0"
+        else:
+            missing_where = "rsi_change IS NULL OR volume_trend IS NULL OR profit_class IS NULL"
+
+        deleted = 0
+        while True:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(f"""
+                DELETE FROM trades
+                WHERE id IN (
+                    SELECT id FROM trades
+                    WHERE {missing_where}
+                    LIMIT ?
+                )
+            """, (DELETE_CHUNK_SIZE,))
+            n = cursor.rowcount
+            conn.commit()
+            deleted += n
+            if n > 0:
+                print(f"   🗑️ Deleted {deleted} records so far...")
+            if n < DELETE_CHUNK_SIZE:
+                break
+
+        if deleted > 0:
+            print(f"✅ Deleted {deleted} records with NULL features.")
+            # 대량 삭제 후 플래너 통계 갱신
+            cursor.execute("ANALYZE")
             conn.commit()
-            print(f"✅ Deleted {null_count} records.")
         else:
             print("✨ No NULL records found.")
             
-        # 4. 삭제 후 데이터 수 확인
+        # 3. 삭제 후 데이터 수 확인 (청크 사이에 봇이 기록했을 수 있으므로 재조회)
         cursor.execute("SELECT COUNT(*) FROM trades")
         total_after = cursor.fetchone()[0]
         print(f"📊 Total Records After: {total_after}")
@@ -11,16 +11,24 @@ Features:
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Optional, Tuple
 import time
 import os
+import math
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from trading_bot import TradingBot
 from data_manager import TradeMemory
 
+# plotly는 차트 fragment가 처음 실행될 때 지연 import (콜드 스타트 단축)
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 # Page Configuration
 st.set_page_config(
     page_title="🤖 자가 진화 트레이딩 봇",
@@ -32,12 +40,10 @@ st.set_page_config(
 # Custom CSS for Premium Design
 st.markdown("""
 <style>
-    /* Import Modern Font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-    
     /* Global Styles */
+    /* 웹폰트 @import는 첫 렌더링을 막으므로 로컬/시스템 폰트 스택 사용 (Inter 설치 시 우선) */
     * {
-        font-family: 'Inter', sans-serif;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif;
     }
     
     /* Main Container */
@@ -48,8 +54,7 @@ st.markdown("""
     
     /* Metric Cards */
     .metric-card {
-        background: rgba(255, 255, 255, 0.05);
-        backdrop-filter: blur(10px);
+        background: rgba(255, 255, 255, 0.05);  /* backdrop-filter blur 제거 (GPU 합성 비용) */
         border: 1px solid rgba(255, 255, 255, 0.1);
         border-radius: 16px;
         padding: 20px;
@@ -120,6 +125,137 @@ def get_bot():
 bot = get_bot()
 memory = bot.memory  # 봇 내부의 memory 객체 사용
 
+
+# ============================================================
+# 📦 데이터 캐시 (Streamlit 재실행마다 SQLite/API를 다시 읽지 않음)
+# total_trades를 인자로 받아 새 매매가 종료되면 캐시 키가 바뀌어 자동 무효화
+# ============================================================
+def _ensure_math_functions(conn: sqlite3.Connection):
+    """LN/EXP가 없는 SQLite 빌드(수학 함수 미포함)면 파이썬 함수로 등록"""
+    try:
+        conn.execute("SELECT LN(1), EXP(0)")
+    except sqlite3.OperationalError:
+        conn.create_function("LN", 1, math.log, deterministic=True)
+        conn.create_function("EXP", 1, math.exp, deterministic=True)
+
+
+@st.cache_resource
+def get_db_conn() -> Tuple[sqlite3.Connection, threading.Lock]:
+    """
+    대시보드 공용 조회 전용 DB 연결 (재실행마다 connect/close 및 페이지 캐시 워밍업 반복 방지)
+
+    WAL 모드라 봇의 기록 스레드와 동시에 읽을 수 있고, 세션(스레드) 간 공유하므로 락과 함께 반환
+    """
+    conn = sqlite3.connect(memory.db_path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA query_only=1")
+    _ensure_math_functions(conn)
+    return conn, threading.Lock()
+
+
+def read_sql(query: str, params: tuple = ()) -> pd.DataFrame:
+    """공용 연결로 조회 (연결은 닫지 않음)"""
+    conn, lock = get_db_conn()
+    with lock:
+        return pd.read_sql_query(query, conn, params=params)
+
+
+def load_performance_series(after_id: int = 0) -> pd.DataFrame:
+    """
+    성과 차트 시계열 (누적 수익률 %, 최근 10건 승률 %)
+
+    누적 곱/이동 평균을 SQL 윈도 함수로 계산하여 파생 열만 가져옴
+    (누적 수익률 = exp(Σ ln(1 + r)) - 1)
+    after_id 지정 시 윈도 계산은 전체 기준, 전송은 id > after_id 행만
+    """
+    return read_sql("""
+        SELECT id, cumulative_return_pct, win_rate_ma
+        FROM (
+            SELECT
+                id,
+                (EXP(SUM(LN(1 + profit_rate)) OVER (ORDER BY id)) - 1) * 100 AS cumulative_return_pct,
+                AVG(CAST(is_profitable AS REAL)) OVER (
+                    ORDER BY id ROWS BETWEEN 9 PRECEDING AND CURRENT ROW
+                ) * 100 AS win_rate_ma
+            FROM trades
+            WHERE status = 'closed'
+        )
+        WHERE id > ?
+        ORDER BY id
+    """, (after_id,))
+
+
+def get_performance_series(total_trades: int) -> pd.DataFrame:
+    """
+    세션별 성과 시계열 (증분 갱신)
+
+    청산 건수(total_trades)가 늘었을 때만 마지막 id 이후 행을 받아 이어붙임.
+    이어붙인 행 수가 청산 건수와 다르면 (낮은 id 포지션이 나중에 청산되었거나 DB 정리로 삭제됨)
+    이후 누적값이 모두 바뀌므로 전체를 다시 조회
+    """
+    df = st.session_state.get("perf_series")
+
+    if df is not None and len(df) == total_trades:
+        return df
+
+    if df is not None and 0 < len(df) < total_trades:
+        delta = load_performance_series(int(df['id'].iloc[-1]))
+        df = pd.concat([df, delta], ignore_index=True)
+
+    if df is None or len(df) != total_trades:
+        df = load_performance_series()
+
+    st.session_state["perf_series"] = df
+    return df
+
+
+RECENT_TRADES_PER_TICKER = 20  # 티커별 최근 청산 매매 보관 수 (차트 마커 20개)
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def load_recent_closed_trades(total_trades: int) -> pd.DataFrame:
+    """
+    티커별 최근 20개 종료 매매 (캔들 차트 마커 + 매매 내역 테이블 공용)
+
+    티커마다 쿼리를 반복하지 않고 한 번에 조회 → 차트는 티커별로, 매매 내역은 전체 최신순으로 잘라 사용
+    (전체 최근 N건(N ≤ 20)은 각 티커의 최근 20건 안에 항상 포함됨)
+    """
+    return read_sql("""
+        SELECT ticker, timestamp, entry_price, exit_price, profit_rate, model_confidence, is_profitable
+        FROM (
+            SELECT
+                ticker, timestamp, entry_price, exit_price, profit_rate, model_confidence, is_profitable,
+                ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY timestamp DESC) AS rn
+            FROM trades
+            WHERE status = 'closed'
+        )
+        WHERE rn <= ?
+        ORDER BY ticker, timestamp DESC
+    """, (RECENT_TRADES_PER_TICKER,))
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def load_current_prices(tickers: tuple, exchange_name: str) -> dict:
+    """여러 티커 현재가 (REST 1회 일괄 조회, 5초 동안 재실행 간 공유)"""
+    return bot.exchange.get_current_prices(list(tickers))
+
+
+CHART_MAX_CANDLES = 200  # 캔들 차트에 표시할 최대 일봉 수
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_ohlcv_batch(tickers: tuple, exchange_name: str) -> dict:
+    """
+    감시 티커들의 일봉 OHLCV 일괄 조회 (거래소 변경 시 캐시 키가 바뀜)
+
+    캐시 미스 시 티커별 REST 호출을 스레드로 병렬 실행 (N개 티커 ≈ 1개 지연)
+    """
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(tickers), 8)) as executor:
+        results = executor.map(bot.exchange.get_ohlcv, tickers)
+        return dict(zip(tickers, results))
+
 def render_header():
     """헤더 렌더링"""
     col1, col2 = st.columns([3, 1])
@@ -132,6 +268,25 @@ def render_header():
         # 실시간 시간
         st.metric("🕐 현재 시각", datetime.now().strftime("%H:%M:%S"))
 
+# 퍼센트 단위로 입력받는 봇 설정 필드 (위젯 키: input_<field>)
+CONFIG_PERCENT_FIELDS = ("target_profit", "stop_loss", "rebuy_threshold")
+
+def _on_trade_amount_change():
+    """매수 금액 위젯 변경 콜백"""
+    bot.trade_amount = st.session_state["input_trade_amount"]
+    st.toast(f"✅ 매수 금액 업데이트: {bot.trade_amount:,.0f} KRW")
+
+def _on_percent_change(field: str):
+    """퍼센트 설정 위젯 변경 콜백 (% → 비율)"""
+    setattr(bot, field, st.session_state[f"input_{field}"] / 100)
+
+def _apply_preset(target_profit: float, stop_loss: float):
+    """매매 전략 프리셋 콜백 (위젯 렌더링 전에 실행되므로 입력값도 함께 갱신)"""
+    bot.target_profit = target_profit
+    bot.stop_loss = stop_loss
+    st.session_state["input_target_profit"] = target_profit * 100
+    st.session_state["input_stop_loss"] = stop_loss * 100
+
 def render_control_panel():
     """제어 패널"""
     st.sidebar.header("⚙️ Control Center")
@@ -153,69 +308,11 @@ def render_control_panel():
         st.cache_resource.clear()
         st.rerun()
     
-    status = bot.get_status()
-    
-    # 봇 상태 표시
-    if status['is_running']:
-        st.sidebar.markdown('<p class="status-running">● RUNNING</p>', unsafe_allow_html=True)
-    else:
-        st.sidebar.markdown('<p class="status-stopped">● STOPPED</p>', unsafe_allow_html=True)
-    
-    st.sidebar.divider()
-    
-    # 시작/중지 버튼
-    col1, col2 = st.sidebar.columns(2)
-    
-    with col1:
-        if st.button("▶️ START", use_container_width=True, disabled=status['is_running']):
-            bot.start()
-            st.rerun()
-    
-    with col2:
-        if st.button("⏸️ STOP", use_container_width=True, disabled=not status['is_running']):
-            bot.stop()
-            st.rerun()
-    
-    st.sidebar.divider()
-    
-    # 강제 재학습 버튼
-    if st.sidebar.button("🎓 지금 모델 재학습", use_container_width=True):
-        with st.spinner("모델 재학습 중..."):
-            bot.force_retrain()
-            st.success("✅ 재학습 완료!")
-            time.sleep(1)
-            st.rerun()
-    
-    st.sidebar.divider()
-    
-    # 🔥 AI 코인 추천 업데이트 (Async)
-    if status.get('is_updating_recommendations', False):
-        st.sidebar.info("🔄 AI가 시장 분석 중... (백그라운드)")
-    else:
-        if st.sidebar.button("🔄 코인 추천 업데이트", use_container_width=True):
-            bot.update_recommendations_async()
-            st.rerun()
-    
-    st.sidebar.divider()
-    
-    
-    # 💰 계좌 정보
-    st.sidebar.subheader("💰 계좌 정보")
-    
-    balance_info = bot.get_account_balance()
-    
-    if balance_info['api_ok']:
-        st.sidebar.metric("주문 가능 금액", f"{balance_info['krw_balance']:,.0f} KRW")
-        st.sidebar.metric("총 평가액", f"{balance_info['total_value']:,.0f} KRW")
-        
-        if balance_info['holdings']:
-            st.sidebar.caption("📦 보유 코인")
-            for holding in balance_info['holdings']:
-                st.sidebar.text(f"{holding['ticker']}: {holding['amount']:.4f}")
-                st.sidebar.caption(f"  {holding['value']:,.0f} KRW")
-    else:
-        st.sidebar.warning("⚠️ API 키가 유효하지 않습니다")
-        st.sidebar.caption("빗썸에서 API 키를 재발급 받으세요")
+    # 봇 상태 / 계좌 정보는 실행 중에 바뀌므로 fragment로 주기 갱신
+    # (사이드바 fragment는 with st.sidebar 안에서 호출해야 함)
+    with st.sidebar:
+        render_bot_controls()
+        render_account_info()
     
     # 설정 정보 (실시간 조정 가능)
     st.sidebar.subheader("📊 Configuration")
@@ -225,80 +322,152 @@ def render_control_panel():
     # if use_ai != bot.use_ai_selection:
     #     bot.use_ai_selection = use_ai
     
+    # 위젯 값은 session_state에 두고 변경 시에만 콜백으로 봇에 반영
+    # (봇 인스턴스가 바뀌면(거래소 전환 등) 봇의 현재 설정으로 다시 초기화)
+    if st.session_state.get("config_bot_id") != id(bot):
+        st.session_state["config_bot_id"] = id(bot)
+        st.session_state["input_trade_amount"] = int(bot.trade_amount)
+        for field in CONFIG_PERCENT_FIELDS:
+            st.session_state[f"input_{field}"] = float(getattr(bot, field) * 100)
+    
     # 2. Trade Amount (KRW)
-    new_amount = st.sidebar.number_input(
+    st.sidebar.number_input(
         "Trade Amount (KRW)",
         min_value=1000,
         max_value=1000000,
-        value=int(bot.trade_amount),
         step=1000,
         help="주문당 매수 금액 (업비트 최소 5,000원 권장)",
-        key="input_trade_amount"
+        key="input_trade_amount",
+        on_change=_on_trade_amount_change
     )
-    if new_amount != bot.trade_amount:
-        bot.trade_amount = new_amount
-        st.toast(f"✅ 매수 금액 업데이트: {new_amount:,.0f} KRW")
 
     # 3. Target & Stop Loss (With Presets)
     st.sidebar.caption("🎯 매매 전략 (빠른 설정)")
     col1, col2, col3 = st.sidebar.columns(3)
     
-    if col1.button("⚡ 초단타", help="익절 0.8% / 손절 1.5%", use_container_width=True, key="btn_preset_scalp"):
-        bot.target_profit = 0.008
-        bot.stop_loss = 0.015
-        st.rerun()
-        
-    if col2.button("🛡️ 스윙", help="익절 3.0% / 손절 5.0%", use_container_width=True, key="btn_preset_swing"):
-        bot.target_profit = 0.03
-        bot.stop_loss = 0.05
-        st.rerun()
-        
-    if col3.button("🚀 불장", help="익절 10% / 손절 10%", use_container_width=True, key="btn_preset_bull"):
-        bot.target_profit = 0.1
-        bot.stop_loss = 0.1
-        st.rerun()
+    col1.button("⚡ 초단타", help="익절 0.8% / 손절 1.5%", use_container_width=True, key="btn_preset_scalp",
+                on_click=_apply_preset, args=(0.008, 0.015))
+    col2.button("🛡️ 스윙", help="익절 3.0% / 손절 5.0%", use_container_width=True, key="btn_preset_swing",
+                on_click=_apply_preset, args=(0.03, 0.05))
+    col3.button("🚀 불장", help="익절 10% / 손절 10%", use_container_width=True, key="btn_preset_bull",
+                on_click=_apply_preset, args=(0.1, 0.1))
 
     # Manual Fine-tuning
-    new_target = st.sidebar.number_input(
+    st.sidebar.number_input(
         "목표 수익률 (Target %)",
         min_value=0.5,
         max_value=100.0,
-        value=float(bot.target_profit * 100),
         step=0.1,
         format="%.1f",
-        key="input_target_profit"
+        key="input_target_profit",
+        on_change=_on_percent_change,
+        args=("target_profit",)
     )
-    if abs((new_target/100) - bot.target_profit) > 0.0001:
-        bot.target_profit = new_target / 100
     
-    new_stop = st.sidebar.number_input(
+    st.sidebar.number_input(
         "손절 제한 (Stop Loss %)",
         min_value=0.3,  # 🔧 0.5 → 0.3 (더 타이트한 손절 허용)
         max_value=50.0,
-        value=float(bot.stop_loss * 100),
         step=0.1,
         format="%.1f",
-        key="input_stop_loss"
+        key="input_stop_loss",
+        on_change=_on_percent_change,
+        args=("stop_loss",)
     )
-    if abs((new_stop/100) - bot.stop_loss) > 0.0001:
-        bot.stop_loss = new_stop / 100
     
-    new_rebuy = st.sidebar.number_input(
+    st.sidebar.number_input(
         "재매수 하락폭 (Rebuy Threshold %)",
         min_value=0.0,
         max_value=10.0,
-        value=float(bot.rebuy_threshold * 100),
         step=0.1,
         format="%.1f",
         help="익절 후 가격이 이만큼 하락해야 재매수 허용 (1.5% 권장)",
-        key="input_rebuy_threshold"
+        key="input_rebuy_threshold",
+        on_change=_on_percent_change,
+        args=("rebuy_threshold",)
     )
-    if abs((new_rebuy/100) - bot.rebuy_threshold) > 0.0001:
-        bot.rebuy_threshold = new_rebuy / 100
         
     st.sidebar.divider()
-    st.sidebar.text(f"Active Tickers: {', '.join(status['tickers'])}")
+    with st.sidebar:
+        render_active_tickers()
+
+
+@st.fragment(run_every="10s")
+def render_bot_controls():
+    """봇 상태 + 시작/중지/재학습/추천 업데이트 버튼 (사이드바, 10초 자동 갱신)"""
+    status = bot.get_status()
+    
+    # 봇 상태 표시
+    if status['is_running']:
+        st.markdown('<p class="status-running">● RUNNING</p>', unsafe_allow_html=True)
+    else:
+        st.markdown('<p class="status-stopped">● STOPPED</p>', unsafe_allow_html=True)
+    
+    st.divider()
+    
+    # 시작/중지 버튼
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("▶️ START", use_container_width=True, disabled=status['is_running']):
+            bot.start()
+            st.rerun()
+    
+    with col2:
+        if st.button("⏸️ STOP", use_container_width=True, disabled=not status['is_running']):
+            bot.stop()
+            st.rerun()
+    
+    st.divider()
+    
+    # 강제 재학습 버튼
+    if st.button("🎓 지금 모델 재학습", use_container_width=True):
+        with st.spinner("모델 재학습 중..."):
+            bot.force_retrain()
+            st.success("✅ 재학습 완료!")
+            time.sleep(1)
+            st.rerun()
+    
+    st.divider()
+    
+    # 🔥 AI 코인 추천 업데이트 (Async)
+    if status.get('is_updating_recommendations', False):
+        st.info("🔄 AI가 시장 분석 중... (백그라운드)")
+    else:
+        if st.button("🔄 코인 추천 업데이트", use_container_width=True):
+            bot.update_recommendations_async()
+            st.rerun()
+    
+    st.divider()
+
+
+@st.fragment(run_every="10s")
+def render_account_info():
+    """💰 계좌 정보 (사이드바, 10초 자동 갱신)"""
+    st.subheader("💰 계좌 정보")
+    
+    balance_info = bot.get_account_balance()
+    
+    if balance_info['api_ok']:
+        st.metric("주문 가능 금액", f"{balance_info['krw_balance']:,.0f} KRW")
+        st.metric("총 평가액", f"{balance_info['total_value']:,.0f} KRW")
+        
+        if balance_info['holdings']:
+            st.caption("📦 보유 코인")
+            for holding in balance_info['holdings']:
+                st.text(f"{holding['ticker']}: {holding['amount']:.4f}")
+                st.caption(f"  {holding['value']:,.0f} KRW")
+    else:
+        st.warning("⚠️ API 키가 유효하지 않습니다")
+        st.caption("빗썸에서 API 키를 재발급 받으세요")
+
+
+@st.fragment(run_every="10s")
+def render_active_tickers():
+    """감시 중인 티커 (사이드바, 봇이 동적으로 추가/제거하므로 10초 자동 갱신)"""
+    st.text(f"Active Tickers: {', '.join(bot.tickers)}")
 
+@st.fragment(run_every="120s")
 def render_ai_metrics():
     """AI 학습 메트릭"""
     st.header("🧠 AI 학습 지표")
@@ -342,36 +511,21 @@ def render_ai_metrics():
         else:
             st.metric(label="🕐 마지막 학습", value="없음")
 
+@st.fragment(run_every="120s")
 def render_performance_chart():
     """성능 이중 축 차트"""
     st.header("📈 수익률 & 학습 진행도")
     
-    # 매매 기록 조회
-    import sqlite3
-    conn = sqlite3.connect(memory.db_path)
-    df_trades = pd.read_sql_query("""
-        SELECT 
-            id,
-            timestamp,
-            profit_rate,
-            is_profitable,
-            model_confidence
-        FROM trades
-        WHERE status = 'closed'
-        ORDER BY timestamp
-        """, conn)
-    conn.close()
+    # 누적 수익률 / 승률 이동평균 (SQL에서 계산, 신규 청산분만 증분 조회)
+    df_trades = get_performance_series(bot.get_status()['total_trades'])
     
     if len(df_trades) == 0:
         st.info("📊 매매 데이터가 아직 없습니다. 봇을 시작하면 데이터가 누적됩니다.")
         return
     
-    # 누적 수익률 계산
-    df_trades['cumulative_return'] = (1 + df_trades['profit_rate']).cumprod() - 1
-    
-    # 승률 계산 (이동 평균)
-    df_trades['win_rate_ma'] = df_trades['is_profitable'].rolling(window=10, min_periods=1).mean() * 100
-    
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
     # Plotly 이중 축 차트
     fig = make_subplots(
         rows=1, cols=1,
@@ -382,7 +536,7 @@ def render_performance_chart():
     fig.add_trace(
         go.Scatter(
             x=df_trades['id'],
-            y=df_trades['cumulative_return'] * 100,
+            y=df_trades['cumulative_return_pct'],
             name="Cumulative Return (%)",
             line=dict(color='#00d4ff', width=3),
             fill='tozeroy',
@@ -423,6 +577,94 @@ def render_performance_chart():
     
     st.plotly_chart(fig, use_container_width=True)
 
+def ohlcv_content_key(df: Optional[pd.DataFrame]) -> Optional[tuple]:
+    """OHLCV 내용 키 (마지막 봉 시각/종가/거래량 + 봉 수) - 데이터가 그대로면 같은 키"""
+    if df is None or len(df) == 0:
+        return None
+    last = df.iloc[-1]
+    return (len(df), df.index[-1].value, float(last['close']), float(last['volume']))
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def build_candlestick_figure(ticker: str, tickers: tuple, exchange_name: str, total_trades: int,
+                             data_key: tuple) -> "go.Figure":
+    """
+    티커 캔들스틱 + 매매 시그널 Figure 생성 (캐시)
+
+    OHLCV 내용 키(data_key)와 청산 건수가 바뀔 때만 다시 만들고, 그 외 재실행은 같은 Figure를 재사용합니다.
+    표시 캔들은 최근 CHART_MAX_CANDLES개로 제한 (빗썸 일봉은 전체 기간을 반환하므로 전송량이 큼)
+    """
+    df = load_ohlcv_batch(tickers, exchange_name)[ticker].tail(CHART_MAX_CANDLES)
+
+    import plotly.graph_objects as go
+    
+    # 캔들스틱 차트
+    fig = go.Figure()
+    
+    fig.add_trace(go.Candlestick(
+        x=df.index,
+        open=df['open'],
+        high=df['high'],
+        low=df['low'],
+        close=df['close'],
+        name=ticker,
+        increasing_line_color='#00ff88',
+        decreasing_line_color='#ff4444'
+    ))
+    
+    # 매수/매도 시그널 마커 추가 (해당 티커만, 캐시)
+    signals = load_recent_closed_trades(total_trades)
+    signals = signals[signals['ticker'] == ticker].copy()
+    
+    if len(signals) > 0:
+        signals['timestamp'] = pd.to_datetime(signals['timestamp'])
+        
+        # 매수 마커
+        fig.add_trace(go.Scatter(
+            x=signals['timestamp'],
+            y=signals['entry_price'],
+            mode='markers',
+            marker=dict(
+                symbol='triangle-up',
+                size=15,
+                color='#00d4ff',
+                line=dict(color='white', width=2)
+            ),
+            name='Buy Signal',
+            text=signals['model_confidence'].map("Confidence: {:.1%}".format).to_numpy(),
+            hovertemplate='<b>BUY</b><br>Price: %{y:,.0f}<br>%{text}<extra></extra>'
+        ))
+        
+        # 매도 마커
+        colors = np.where(signals['is_profitable'], '#00ff88', '#ff4444')
+        fig.add_trace(go.Scatter(
+            x=signals['timestamp'],
+            y=signals['exit_price'],
+            mode='markers',
+            marker=dict(
+                symbol='triangle-down',
+                size=15,
+                color=colors,
+                line=dict(color='white', width=2)
+            ),
+            name='Sell Signal',
+            hovertemplate='<b>SELL</b><br>Price: %{y:,.0f}<extra></extra>'
+        ))
+    
+    # 레이아웃
+    fig.update_layout(
+        title=f"{ticker}/KRW - 일봉 차트",
+        xaxis_title="시간",
+        yaxis_title="가격 (KRW)",
+        template="plotly_dark",
+        height=500,
+        xaxis_rangeslider_visible=False
+    )
+    
+    return fig
+
+
+@st.fragment(run_every="60s")
 def render_candlestick_chart():
     """캔들스틱 차트 with 매매 시그널"""
     st.header("📊 실시간 시세 & 매매 신호")
@@ -432,123 +674,51 @@ def render_candlestick_chart():
     if not tickers:
         st.info("선택된 코인이 없습니다.")
         return
+    
+    total_trades = bot.get_status()['total_trades']
+    tickers = tuple(tickers)
+    ohlcv = load_ohlcv_batch(tickers, bot.exchange_name)
         
     for ticker in tickers:
         with st.container():
             st.subheader(f"📈 {ticker} Chart")
             
-            # 최근 데이터 (일봉)
-            df = bot.exchange.get_ohlcv(ticker)
-        
-            if df is None or len(df) == 0:
+            data_key = ohlcv_content_key(ohlcv.get(ticker))
+            if data_key is None:
                 st.error(f"❌ {ticker}: 시장 데이터를 불러올 수 없습니다")
                 st.divider()
                 continue
             
-            # 캔들스틱 차트
-            fig = go.Figure()
-            
-            fig.add_trace(go.Candlestick(
-                x=df.index,
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name=ticker,
-                increasing_line_color='#00ff88',
-                decreasing_line_color='#ff4444'
-            ))
-            
-            # 매수/매도 시그널 마커 추가 (해당 티커만)
-            import sqlite3
-            conn = sqlite3.connect(memory.db_path)
-            signals = pd.read_sql_query(f"""
-                SELECT timestamp, entry_price, exit_price, model_confidence, is_profitable
-                FROM trades
-                WHERE status = 'closed' AND ticker = '{ticker}'
-                ORDER BY timestamp DESC
-                LIMIT 20
-            """, conn)
-            conn.close()
-            
-            if len(signals) > 0:
-                signals['timestamp'] = pd.to_datetime(signals['timestamp'])
-                
-                # 매수 마커
-                fig.add_trace(go.Scatter(
-                    x=signals['timestamp'],
-                    y=signals['entry_price'],
-                    mode='markers',
-                    marker=dict(
-                        symbol='triangle-up',
-                        size=15,
-                        color='#00d4ff',
-                        line=dict(color='white', width=2)
-                    ),
-                    name='Buy Signal',
-                    text=[f"Confidence: {c:.1%}" for c in signals['model_confidence']],
-                    hovertemplate='<b>BUY</b><br>Price: %{y:,.0f}<br>%{text}<extra></extra>'
-                ))
-                
-                # 매도 마커
-                colors = ['#00ff88' if p else '#ff4444' for p in signals['is_profitable']]
-                fig.add_trace(go.Scatter(
-                    x=signals['timestamp'],
-                    y=signals['exit_price'],
-                    mode='markers',
-                    marker=dict(
-                        symbol='triangle-down',
-                        size=15,
-                        color=colors,
-                        line=dict(color='white', width=2)
-                    ),
-                    name='Sell Signal',
-                    hovertemplate='<b>SELL</b><br>Price: %{y:,.0f}<extra></extra>'
-                ))
-            
-            # 레이아웃
-            fig.update_layout(
-                title=f"{ticker}/KRW - 일봉 차트",
-                xaxis_title="시간",
-                yaxis_title="가격 (KRW)",
-                template="plotly_dark",
-                height=500,
-                xaxis_rangeslider_visible=False
-            )
-            
+            # 일봉 캔들 + 시그널 Figure (데이터가 바뀌지 않았으면 캐시된 Figure 재사용)
+            fig = build_candlestick_figure(ticker, tickers, bot.exchange_name, total_trades, data_key)
             st.plotly_chart(fig, use_container_width=True)
             st.divider()
 
+@st.fragment(run_every="10s")
 def render_recent_trades():
     """최근 매매 내역"""
     st.header("📜 최근 매매 내역")
     
-    import sqlite3
-    conn = sqlite3.connect(memory.db_path)
-    df = pd.read_sql_query("""
-        SELECT 
-            timestamp,
-            entry_price,
-            exit_price,
-            profit_rate,
-            is_profitable,
-            model_confidence
-        FROM trades
-        WHERE status = 'closed'
-        ORDER BY timestamp DESC
-        LIMIT 10
-    """, conn)
-    conn.close()
+    df = (
+        load_recent_closed_trades(bot.get_status()['total_trades'])
+        .sort_values('timestamp', ascending=False)
+        .head(10)
+        .reset_index(drop=True)
+    )
     
     if len(df) == 0:
         st.info("아직 완료된 매매가 없습니다.")
         return
     
-    # 데이터 포맷팅
-    df['timestamp'] = pd.to_datetime(df['timestamp']).dt.strftime("%m-%d %H:%M")
-    df['profit_rate'] = df['profit_rate'].apply(lambda x: f"{x*100:+.2f}%")
-    df['model_confidence'] = df['model_confidence'].apply(lambda x: f"{x:.1%}")
-    df['result'] = df['is_profitable'].apply(lambda x: "✅ Profit" if x else "❌ Loss")
+    # 데이터 포맷팅 (숫자는 숫자로 두고 표시 형식은 column_config로 프론트엔드에 위임)
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    df['profit_rate'] = df['profit_rate'] * 100
+    df['model_confidence'] = df['model_confidence'] * 100
+    # 반복되는 문자열은 범주형으로 (Arrow 직렬화 시 코드 + 작은 사전만 전송)
+    df['result'] = pd.Categorical(
+        np.where(df['is_profitable'], "✅ Profit", "❌ Loss"),
+        categories=["✅ Profit", "❌ Loss"]
+    )
     
     # 컬럼 이름 변경
     df = df.rename(columns={
@@ -564,9 +734,31 @@ def render_recent_trades():
     st.dataframe(
         df[['Time', 'Entry', 'Exit', 'P/L', 'Confidence', 'Result']],
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        column_config={
+            "Time": st.column_config.DatetimeColumn("Time", format="MM-DD HH:mm"),
+            "P/L": st.column_config.NumberColumn("P/L", format="%+.2f%%"),
+            "Confidence": st.column_config.NumberColumn("Confidence", format="%.1f%%"),
+        }
     )
 
+@st.fragment(run_every="10s")
+def render_price_ticker():
+    """감시 코인 현재가 (10초마다 이 영역만 갱신)"""
+    tickers = bot.tickers
+    
+    if not tickers:
+        return
+    
+    prices = load_current_prices(tuple(sorted(tickers)), bot.exchange_name)
+    
+    cols = st.columns(min(len(tickers), 5))
+    for i, ticker in enumerate(tickers):
+        with cols[i % len(cols)]:
+            price = prices.get(ticker)
+            st.metric(f"💱 {ticker}", f"{price:,.0f} KRW" if price else "N/A")
+
+@st.fragment(run_every="10s")
 def render_current_position():
     """현재 포지션 정보"""
     status = bot.get_status()
@@ -577,6 +769,9 @@ def render_current_position():
     if ifPositions:
         st.info(f"🔵 **현재 {len(positions)}개 포지션 보유 중**")
         
+        # 보유 코인 현재가 일괄 조회 (포지션마다 REST 호출하지 않음)
+        prices = load_current_prices(tuple(sorted(positions)), bot.exchange_name)
+        
         for ticker, position in list(positions.items()):
             with st.container():
                 st.markdown(f"#### 🏷️ {ticker}")
@@ -586,7 +781,7 @@ def render_current_position():
                     st.metric("진입 가격", f"{position['entry_price']:,.0f} KRW")
                 
                 with col2:
-                    current_price = bot.exchange.get_current_price(ticker)
+                    current_price = prices.get(ticker)
                     if current_price and current_price > 0:
                         profit = (current_price - position['entry_price']) / position['entry_price']
                         st.metric(
@@ -610,6 +805,7 @@ def render_current_position():
     else:
         st.success("✅ 보유 포지션 없음")
 
+@st.fragment(run_every="10s")
 def render_coin_recommendations():
     """🔥 AI 추천 코인 패널"""
     st.header("🎯 AI 추천 코인 (상위 5개)")
@@ -626,25 +822,24 @@ def render_coin_recommendations():
         st.info("📊 사이드바의 '🔄 코인 추천 업데이트' 버튼을 눌러 코인을 분석하세요.")
         return
     
-    # 추천 코인 테이블 생성
-    recommendations_data = []
-    
-    for i, rec in enumerate(recommended_coins, 1):
-        # 추천 상태 이모지
-        recommend_emoji = "✅" if rec['recommendation'] else "⚠️"
-        
-        recommendations_data.append({
-            "순위": f"#{i}",
-            "코인": rec['ticker'],
-            "점수": f"{rec['score']:.1f}/100",
-            "AI 확신도": f"{rec['confidence']:.1%}",
-            "RSI": f"{rec['features']['rsi']:.1f}",
-            "BB 위치": f"{rec['features']['bb_position']:.2f}",
-            "현재가": f"{rec['current_price']:,.0f} KRW" if rec['current_price'] else "N/A",
-            "상태": recommend_emoji
-        })
-    
-    df_recommendations = pd.DataFrame(recommendations_data)
+    # 추천 코인 테이블 생성 (봇이 추천 갱신 시 만들어 둔 DataFrame 사용)
+    df_rec = bot.recommendations_df.reset_index(drop=True)
+    current_price = pd.to_numeric(df_rec['current_price'], errors='coerce')
+    
+    df_recommendations = pd.DataFrame({
+        "순위": "#" + (df_rec.index + 1).astype(str),
+        "코인": df_rec['ticker'],
+        "점수": df_rec['score'],
+        "AI 확신도": df_rec['confidence'] * 100,
+        "RSI": df_rec['rsi'],
+        "BB 위치": df_rec['bb_position'],
+        # 천 단위 구분자는 printf 형식으로 표현할 수 없어 문자열 유지
+        "현재가": current_price.map("{:,.0f} KRW".format).where(current_price > 0, "N/A"),
+        "상태": pd.Categorical(
+            np.where(df_rec['recommendation'].astype(bool), "✅", "⚠️"),
+            categories=["✅", "⚠️"]
+        )
+    })
     
     # 스타일링된 테이블
     st.dataframe(
@@ -655,10 +850,13 @@ def render_coin_recommendations():
             "점수": st.column_config.ProgressColumn(
                 "점수",
                 help="AI 종합 점수 (100점 만점)",
-                format="%s",
+                format="%.1f/100",
                 min_value=0,
                 max_value=100,
             ),
+            "AI 확신도": st.column_config.NumberColumn("AI 확신도", format="%.1f%%"),
+            "RSI": st.column_config.NumberColumn("RSI", format="%.1f"),
+            "BB 위치": st.column_config.NumberColumn("BB 위치", format="%.2f"),
         }
     )
     
@@ -666,15 +864,15 @@ def render_coin_recommendations():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        strong_buy_count = sum(1 for r in recommended_coins if r['score'] >= 80)
+        strong_buy_count = int((df_rec['score'] >= 80).sum())
         st.metric("🔥 강력 매수", f"{strong_buy_count}")
     
     with col2:
-        avg_confidence = sum(r['confidence'] for r in recommended_coins) / len(recommended_coins)
+        avg_confidence = df_rec['confidence'].mean()
         st.metric("📈 평균 확신도", f"{avg_confidence:.1%}")
     
     with col3:
-        recommend_count = sum(1 for r in recommended_coins if r['recommendation'])
+        recommend_count = int(df_rec['recommendation'].astype(bool).sum())
         st.metric("✅ 추천", f"{recommend_count}/5")
     
     st.divider()
@@ -722,6 +920,9 @@ def main():
         # 헤더
         render_header()
         
+        # 현재가 (10초 자동 갱신)
+        render_price_ticker()
+        
         # 제어 패널 (사이드바)
         render_control_panel()
         
@@ -753,10 +954,9 @@ def main():
         # 최근 매매
         render_recent_trades()
         
-        # 자동 새로고침 (10초마다)
-        if bot.get_status()['is_running']:
-            time.sleep(10)
-            st.rerun()
+        # 자동 새로고침은 섹션별 fragment(run_every)가 담당
+        # (현재가/포지션/사이드바 상태·잔고/추천/최근 매매 10초, 캔들 60초, AI 지표/성과 120초
+        #  - 전체 페이지 재실행 없음)
             
     except Exception as e:
         st.error(f"❌ An error occurred: {e}")
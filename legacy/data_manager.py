@@ -98,6 +98,12 @@ class TradeMemory:
                     status TEXT DEFAULT 'closed'  -- open, closed
                 )
             """)
+
+            # 대시보드 성과 차트용 커버링 인덱스 (종료 매매만, 테이블 조회 없이 id순 스캔)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trades_closed
+                ON trades(id, profit_rate, is_profitable) WHERE status = 'closed'
+            """)
             
             # 모델 성능 추적 테이블
             conn.execute("""
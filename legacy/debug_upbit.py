@@ -16,22 +16,20 @@ try:
     upbit = pyupbit.Upbit(access_key, secret_key)
     print("Upbit client created.")
     
-    print("Getting balance for KRW...")
+    print("Getting balances (KRW, BTC) via /v1/accounts...")
     try:
-        krw = upbit.get_balance("KRW")
+        # get_balance()를 통화마다 부르면 JWT 서명 + HTTP 요청이 통화 수만큼 발생
+        # → get_balances()로 /v1/accounts 1회 조회 후 currency로 인덱싱
+        accounts = upbit.get_balances()
+        print(f"Accounts Response Type: {type(accounts)}")
+        balances = {a['currency']: float(a['balance']) for a in accounts} if isinstance(accounts, list) else {}
+        krw = balances.get("KRW", 0.0)
+        btc = balances.get("BTC", 0.0)
         print(f"KRW Balance: {krw} (Type: {type(krw)})")
-    except Exception as e:
-        print(f"get_balance(KRW) failed: {e}")
-        # Print stack trace
-        import traceback
-        traceback.print_exc()
-
-    print("Getting balance for KRW-BTC...")
-    try:
-        btc = upbit.get_balance("KRW-BTC")
         print(f"BTC Balance: {btc} (Type: {type(btc)})")
     except Exception as e:
-        print(f"get_balance(KRW-BTC) failed: {e}")
+        print(f"get_balances() failed: {e}")
+        # Print stack trace
         import traceback
         traceback.print_exc()
 
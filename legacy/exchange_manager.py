@@ -2,7 +2,7 @@
 import pybithumb
 import pyupbit
 import logging
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +97,64 @@ class ExchangeManager:
             logger.debug(f"⚠️ Price Error ({self.exchange_name}): {e}")
             return None
     
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        여러 티커의 현재 가격 일괄 조회 (캐시에 없는 티커만 REST 1회 호출)
+
+        Returns:
+            {ticker: price} - 조회 실패한 티커는 포함되지 않음
+        """
+        import time
+
+        if not hasattr(self, '_price_cache'):
+            self._price_cache = {}
+
+        prices: Dict[str, float] = {}
+        missing = []
+        now = time.time()
+
+        for ticker in tickers:
+            cached = self._price_cache.get(ticker)
+            if cached is not None and now - cached[1] < 5:
+                prices[ticker] = cached[0]
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return prices
+
+        try:
+            if self.exchange_name == 'upbit':
+                # GET /v1/ticker?markets=KRW-A,KRW-B,... 한 번으로 조회
+                result = pyupbit.get_current_price([f"KRW-{t}" for t in missing])
+                if not isinstance(result, dict):
+                    # 티커 1개면 float 반환
+                    result = {f"KRW-{missing[0]}": result}
+                fetched = {market.replace("KRW-", ""): price for market, price in result.items() if price}
+            elif self.exchange_name == 'bithumb':
+                if len(missing) == 1:
+                    price = pybithumb.get_current_price(missing[0])
+                    fetched = {missing[0]: price} if price else {}
+                else:
+                    # 전체 시세 한 번으로 조회 ({ticker: {'closing_price': '...'}})
+                    result = pybithumb.get_current_price("ALL") or {}
+                    fetched = {
+                        t: float(result[t]['closing_price'])
+                        for t in missing
+                        if isinstance(result.get(t), dict) and result[t].get('closing_price')
+                    }
+            else:
+                return prices
+
+            for ticker, price in fetched.items():
+                self._price_cache[ticker] = (price, now)
+            prices.update(fetched)
+
+        except Exception as e:
+            logger.debug(f"⚠️ Prices Error ({self.exchange_name}): {e}")
+
+        return prices
+
     def get_orderbook_bid_price(self, ticker: str) -> Optional[float]:
         """
         매수 1호가 조회 (시장가 매도 시 실제 체결 가격)
@@ -18,12 +18,16 @@ else:
         upbit = pyupbit.Upbit(access_key, secret_key)
         print("Upbit client created.")
         
-        print("Attempting to get KRW balance...")
-        krw_balance = upbit.get_balance("KRW")
+        print("Attempting to get balances (/v1/accounts, 1 request)...")
+        accounts = upbit.get_balances()
+        balances = {a['currency']: float(a['balance']) for a in accounts} if isinstance(accounts, list) else {}
+        if not balances:
+            print(f"Unexpected response: {accounts}")
+        
+        krw_balance = balances.get("KRW", 0.0)
         print(f"KRW Balance: {krw_balance}, Type: {type(krw_balance)}")
         
-        print("Attempting to get BTC balance...")
-        btc_balance = upbit.get_balance("KRW-BTC")
+        btc_balance = balances.get("BTC", 0.0)
         print(f"BTC Balance: {btc_balance}, Type: {type(btc_balance)}")
         
     except Exception as e:
@@ -14,6 +14,11 @@ secret_key = os.getenv("UPBIT_SECRET_KEY")
 
 server_url = 'https://api.upbit.com'
 
+# 서명기/HTTP 세션은 모듈 단위로 한 번만 생성해 재사용 (호출마다 TLS 핸드셰이크 반복 방지)
+_jwt = jwt.PyJWT()
+session = requests.Session()
+session.headers.update({"Accept": "application/json"})
+
 def get_balance_raw():
     payload = {
         'access_key': access_key,
@@ -21,7 +26,7 @@ def get_balance_raw():
     }
 
     try:
-        jwt_token = jwt.encode(payload, secret_key, algorithm='HS256')
+        jwt_token = _jwt.encode(payload, secret_key, algorithm='HS256')
         # PyJWT 2.0+ returns str. If < 2.0 returns bytes.
         if isinstance(jwt_token, bytes):
              jwt_token = jwt_token.decode('utf-8')
@@ -29,7 +34,7 @@ def get_balance_raw():
         authorize_token = 'Bearer {}'.format(jwt_token)
         headers = {"Authorization": authorize_token}
 
-        res = requests.get(server_url + "/v1/accounts", headers=headers)
+        res = session.get(server_url + "/v1/accounts", headers=headers)
         
         print(f"Status Code: {res.status_code}")
         print(f"Response: {res.text}")
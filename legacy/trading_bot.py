@@ -90,7 +90,7 @@ class TradingBot:
         
         # 🔥 AI Coin Selector
         self.coin_selector = CoinSelector(self.learner, self.memory, self.exchange)
-        self.recommended_coins = []  # 추천 코인 리스트 캐시
+        self.recommended_coins = []  # 추천 코인 리스트 캐시 (표시용 DataFrame도 함께 갱신)
         
         # Trading State
         self.is_running = False
@@ -757,22 +757,19 @@ class TradingBot:
             
             # 🆕 조건 2.5: Trailing Stop Loss
             elif self.trailing_stop_enabled and profit_rate >= self.trailing_activation:
-                # Peak 가격 추적
-                if 'peak_price' not in position:
-                    position['peak_price'] = entry_price
-                
-                if current_price > position['peak_price']:
-                    position['peak_price'] = current_price
-                    logger.debug(f"🔼 [{ticker}] New Peak: {current_price:,.0f} (+{profit_rate*100:.2f}%)")
+                # Peak 가격 추적 (dict는 1회 읽고 갱신 시에만 1회 쓰기, 최댓값은 max로 분기 없이 계산)
+                prev_peak = position.get('peak_price', entry_price)
+                peak_price = max(prev_peak, current_price)
+                if peak_price != prev_peak:  # 활성화 시점엔 수익 중이므로 첫 peak도 여기서 기록됨
+                    position['peak_price'] = peak_price
+                    logger.debug(f"🔼 [{ticker}] New Peak: {peak_price:,.0f} (+{profit_rate*100:.2f}%)")
                 
                 # Peak 대비 하락률 체크
-                trailing_stop_price = position['peak_price'] * (1 - self.trailing_distance)
-                
-                if current_price < trailing_stop_price:
-                    peak_profit = (position['peak_price'] - entry_price) / entry_price
+                if current_price < peak_price * (1 - self.trailing_distance):
+                    peak_profit = (peak_price - entry_price) / entry_price
                     should_exit = True
-                    exit_reason = f"Trailing Stop (Peak={position['peak_price']:,.0f}, +{peak_profit*100:.1f}%)"
-                    logger.info(f"🔔 [{ticker}] Trailing Stop Triggered! Peak={position['peak_price']:,.0f}, Current={current_price:,.0f}")
+                    exit_reason = f"Trailing Stop (Peak={peak_price:,.0f}, +{peak_profit*100:.1f}%)"
+                    logger.info(f"🔔 [{ticker}] Trailing Stop Triggered! Peak={peak_price:,.0f}, Current={current_price:,.0f}")
             
             # 조건 3: 볼린저 밴드 상단 (타이밍 매도)
             elif df is not None and len(df) >= 20:
@@ -959,6 +956,28 @@ class TradingBot:
         logger.info("🔄 Manual Retraining Triggered")
         self._retrain_model()
     
+    # 대시보드 표시용 추천 DataFrame 컬럼 (features 중첩 dict는 rsi/bb_position으로 펼침)
+    RECOMMENDATION_COLUMNS = ["ticker", "score", "confidence", "rsi", "bb_position", "current_price", "recommendation"]
+
+    @property
+    def recommended_coins(self) -> list:
+        """추천 코인 리스트 (갱신 시 리스트를 통째로 교체)"""
+        return self._recommended_coins
+
+    @recommended_coins.setter
+    def recommended_coins(self, value: list):
+        # 추천 갱신 시점(백그라운드 스레드)에 한 번만 DataFrame으로 변환 → UI 재실행마다 변환하지 않음
+        if value:
+            df = pd.DataFrame(value)
+            features = pd.DataFrame(list(df["features"]), index=df.index)
+            df["rsi"] = features.get("rsi")
+            df["bb_position"] = features.get("bb_position")
+            frame = df.reindex(columns=self.RECOMMENDATION_COLUMNS)
+        else:
+            frame = pd.DataFrame(columns=self.RECOMMENDATION_COLUMNS)
+        self._recommended_coins = value
+        self.recommendations_df = frame
+
     def update_coin_recommendations(self):
         """코인 추천 리스트 업데이트 (Sync - Legacy or Direct Call)"""
         self.recommended_coins = self.coin_selector.get_top_recommendations(top_n=5)
@@ -4,14 +4,36 @@
 서버 없이 독립적으로 백테스팅을 실행합니다.
 """
 
+import logging
 import sys
 import os
+import time
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
 from core.trading_bot import TradingBot
 
+PROGRESS_POLL_INTERVAL = 1.0  # 진행 상황 갱신 주기 (초)
+
+
+def wait_for_backtest(bot: TradingBot) -> dict:
+    """백그라운드 백테스팅이 끝날 때까지 진행 상황을 한 줄로 갱신 출력"""
+    while True:
+        status = bot.get_backtest_status()
+        print(
+            f"\r   ⏳ {status.get('progress', 0):3d}% | "
+            f"{status.get('current_ticker') or '-':>6} | "
+            f"거래 {status.get('trades_done', 0)}건 | "
+            f"수익률 {status.get('current_return', 0)*100:+.2f}%",
+            end="", flush=True
+        )
+        if not status.get('is_running'):
+            print()
+            return status
+        time.sleep(PROGRESS_POLL_INTERVAL)
+
+
 def main():
     print("=" * 60)
     print("🚀 백테스팅 시작")
@@ -21,15 +43,20 @@ def main():
     print("\n📊 TradingBot 초기화 중...")
     bot = TradingBot()
 
-    # 백테스팅 실행 (동기 모드)
+    # 백테스팅 실행 (백그라운드 + 진행 상황 폴링)
     print("\n🎮 백테스팅 실행 중... (멀티 코인, 200일)")
     print("⏳ 예상 소요 시간: 1-3분\n")
 
-    result = bot.run_backtest(
+    started = bot.run_backtest(
         tickers=None,      # 자동으로 거래 내역에서 선택
         days=200,          # 200일 백테스팅
-        async_mode=False   # 동기 모드 (결과 대기)
+        async_mode=True    # 백그라운드 실행 (진행 상황 표시)
     )
+    if started['status'] != 'started':
+        print(f"\n❌ {started.get('message', '백테스팅 시작 실패')}")
+        return
+
+    result = wait_for_backtest(bot)
 
     # 결과 출력
     if result['status'] == 'completed' and result.get('results'):
@@ -64,4 +91,8 @@ def main():
     print("\n" + "=" * 60)
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     main()
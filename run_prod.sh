@@ -0,0 +1,22 @@
+#!/bin/bash
+
+# Production Startup Script
+# gunicorn + UvicornWorker로 Backend를 실행합니다 (자동 재시작/그레이스풀 리로드).
+#
+# ⚠️ TradingBot은 프로세스 내부 싱글톤(app.state.trading_bot)입니다.
+#    워커를 여러 개 띄우면 워커마다 봇이 생성되어 주문이 중복되므로
+#    봇 상태를 별도 프로세스로 분리하기 전까지 WEB_WORKERS는 1로 유지하세요.
+
+WEB_WORKERS=${WEB_WORKERS:-1}
+
+echo "🚀 Starting Trading Bot Backend (gunicorn, workers=${WEB_WORKERS})..."
+
+cd backend
+exec gunicorn main:app \
+    -k uvicorn.workers.UvicornWorker \
+    -w "${WEB_WORKERS}" \
+    --worker-connections 2000 \
+    --backlog 4096 \
+    --keep-alive 5 \
+    --graceful-timeout 30 \
+    --bind 0.0.0.0:8000
@@ -0,0 +1,58 @@
+#!/bin/bash
+
+# Root Test Scripts Runner
+# 서로 독립적인 루트 테스트 스크립트들을 별도 프로세스로 동시에 실행합니다.
+# (API 호출 / TradingBot 인스턴스 / 모델 학습이 각자 다른 코어에서 진행)
+
+cd "$(dirname "$0")"
+
+PYTHON=${PYTHON:-python3}
+TESTS=(
+    test_advanced_settings.py
+    test_dynamic_ticker.py
+    test_pandas_warning_fix.py
+)
+
+# 색상 정의
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'
+
+LOG_DIR=$(mktemp -d)
+trap 'rm -rf "$LOG_DIR"' EXIT
+
+echo "🧪 Running ${#TESTS[@]} test scripts in parallel..."
+
+PIDS=()
+for test in "${TESTS[@]}"; do
+    $PYTHON "$test" > "$LOG_DIR/$test.log" 2>&1 &
+    PIDS+=($!)
+done
+
+# 완료 순서와 무관하게 스크립트 순서대로 결과 출력
+FAILED=0
+for i in "${!TESTS[@]}"; do
+    test=${TESTS[$i]}
+    wait "${PIDS[$i]}"
+    STATUS=$?
+
+    echo ""
+    echo "==================== $test ===================="
+    cat "$LOG_DIR/$test.log"
+
+    if [ $STATUS -eq 0 ]; then
+        echo -e "${GREEN}✅ PASS${NC} $test"
+    else
+        echo -e "${RED}❌ FAIL${NC} $test (exit $STATUS)"
+        FAILED=$((FAILED + 1))
+    fi
+done
+
+echo ""
+if [ $FAILED -eq 0 ]; then
+    echo -e "${GREEN}✅ All ${#TESTS[@]} test scripts passed${NC}"
+else
+    echo -e "${RED}❌ $FAILED of ${#TESTS[@]} test scripts failed${NC}"
+fi
+
+exit $FAILED
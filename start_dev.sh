@@ -13,7 +13,7 @@ NC='\033[0m' # No Color
 # Backend 시작
 echo -e "${BLUE}[1/2]${NC} Starting Backend (FastAPI + Uvicorn)..."
 cd backend
-uvicorn main:app --reload --host 0.0.0.0 --port 8000 &
+uvicorn main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --no-access-log &
 BACKEND_PID=$!
 
 # 백엔드가 시작될 때까지 대기
@@ -6,11 +6,35 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import mmap
+import os
+import re
 import sys
 import time
+from pathlib import Path
+
+try:
+    from orjson import loads as json_loads  # 백엔드 의존성 (C 파서)
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    json_loads = json.loads
 
 API_BASE = "http://localhost:8000"
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# (연결, 응답) 타임아웃 - 서버가 떠 있지 않으면 연결 단계에서 빠르게 실패
+REQUEST_TIMEOUT = (0.5, 5)
+
+# 모든 API 호출이 keep-alive 연결 하나를 재사용하도록 세션 공유 (요청마다 TCP 연결 생성 방지)
+# 연결 실패만 1회 즉시 재시도, 응답/상태 코드 재시도 없음
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(connect=1, read=0, backoff_factor=0, status_forcelist=[])
+))
 
 def print_section(title):
     """섹션 헤더 출력"""
@@ -23,10 +47,10 @@ def test_get_status():
     print_section("1️⃣ 현재 봇 상태 조회")
 
     try:
-        response = requests.get(f"{API_BASE}/api/bot/status", timeout=5)
+        response = SESSION.get(f"{API_BASE}/api/bot/status", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
-        status = response.json()
+        status = json_loads(response.content)
 
         print(f"✅ API 연결 성공")
         print(f"\n📊 현재 설정:")
@@ -37,7 +61,7 @@ def test_get_status():
         print(f"   - 목표 수익률: {status.get('target_profit', 'N/A') * 100:.1f}%")
 
         return status
-    except requests.exceptions.ConnectionError:
+    except (requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout):
         print("❌ 백엔드 서버가 실행 중이지 않습니다.")
         print("💡 해결 방법: cd backend && python main.py")
         sys.exit(1)
@@ -45,6 +69,24 @@ def test_get_status():
         print(f"❌ 상태 조회 실패: {e}")
         sys.exit(1)
 
+def wait_for_config(expected, timeout=0.5, step=0.02):
+    """
+    /api/bot/status에 기대 설정이 반영될 때까지 짧게 폴링
+
+    /config는 응답 전에 봇 설정을 교체하지만, /status는 브로드캐스터가 주기적으로(0.2초)
+    갱신하는 스냅샷을 반환하므로 잠깐 이전 값이 보일 수 있음
+    → 즉시 조회 후 반영 전이면 20/40/80ms... (최대 200ms) 간격으로 재조회, timeout 후 마지막 상태 반환
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        status = json_loads(SESSION.get(f"{API_BASE}/api/bot/status", timeout=REQUEST_TIMEOUT).content)
+        if all(status.get(key) == value for key, value in expected.items()):
+            return status
+        if time.monotonic() >= deadline:
+            return status
+        time.sleep(step)
+        step = min(step * 2, 0.2)
+
 def test_update_config():
     """설정 업데이트 테스트"""
     print_section("2️⃣ 설정 업데이트 테스트")
@@ -81,35 +123,34 @@ def test_update_config():
 
         try:
             # 설정 변경
-            response = requests.post(
+            response = SESSION.post(
                 f"{API_BASE}/api/bot/config",
                 json=test['config'],
-                timeout=5
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = json_loads(response.content)
 
             if result.get('success'):
                 print(f"   ✅ 설정 변경 성공")
-                print(f"   📝 업데이트된 항목: {list(result.get('data', {}).get('updated', {}).keys())}")
+                print(f"   📝 업데이트된 항목: {result.get('data', {}).get('updated', {})}")
             else:
                 print(f"   ❌ 설정 변경 실패: {result.get('error', 'Unknown error')}")
 
-            # 변경 후 상태 확인
-            time.sleep(0.5)
-            status_response = requests.get(f"{API_BASE}/api/bot/status", timeout=5)
-            status = status_response.json()
+            # 변경 후 상태 확인 (반영되는 즉시 반환, 고정 대기 없음)
+            status = wait_for_config(test['config'])
 
-            # 검증
-            is_valid = True
-            for key, expected_value in test['config'].items():
-                actual_value = status.get(key)
-                if actual_value != expected_value:
-                    print(f"   ⚠️ 불일치: {key} (기대={expected_value}, 실제={actual_value})")
-                    is_valid = False
+            # 검증 (불일치 항목만 모음: {key: (기대값, 실제값)})
+            mismatches = {
+                key: (expected_value, status.get(key))
+                for key, expected_value in test['config'].items()
+                if status.get(key) != expected_value
+            }
+            for key, (expected_value, actual_value) in mismatches.items():
+                print(f"   ⚠️ 불일치: {key} (기대={expected_value}, 실제={actual_value})")
 
-            if is_valid:
+            if not mismatches:
                 print(f"   ✅ 설정 검증 완료")
             else:
                 print(f"   ❌ 설정 검증 실패")
@@ -117,6 +158,23 @@ def test_update_config():
         except Exception as e:
             print(f"   ❌ 테스트 실패: {e}")
 
+def find_markers(file_path, markers):
+    """
+    파일에서 발견된 마커 집합 반환
+
+    마커마다 `in` 검사로 전체 문자열을 다시 훑지 않고,
+    컴파일된 정규식 하나로 mmap된 파일을 한 번만 스캔
+    """
+    # 긴 마커를 먼저 두어 접두사가 겹치는 마커끼리 짧은 쪽이 먼저 매칭되지 않도록 함
+    ordered = sorted(set(markers), key=len, reverse=True)
+    pattern = re.compile(b"|".join(re.escape(m.encode("utf-8")) for m in ordered))
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {m.decode("utf-8") for m in pattern.findall(mm)}
+
 def test_feature_integration():
     """기능 통합 테스트 (코드 레벨)"""
     print_section("3️⃣ 기능 통합 확인 (코드 검증)")
@@ -142,57 +200,61 @@ def test_feature_integration():
         }
     ]
 
-    import os
+    # 같은 파일을 검사마다 다시 읽지 않도록 파일별 마커를 모아 한 번에 스캔
+    markers_by_file = {}
+    for check in checks:
+        markers_by_file.setdefault(check['file'], []).extend([check['check'], check['usage']])
+
+    # 파일별 스캔 결과 캐시 (경로당 한 번만 읽음)
+    found_by_file = {}
+    for rel_path, markers in markers_by_file.items():
+        file_path = PROJECT_ROOT / rel_path
+        if file_path.is_file():
+            found_by_file[rel_path] = find_markers(file_path, markers)
 
     for check in checks:
         print(f"\n🔍 {check['feature']}")
 
-        file_path = os.path.join("/Users/cov4/bitThumb_std", check['file'])
+        found = found_by_file.get(check['file'])
 
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-                # 함수 존재 확인
-                if check['check'] in content:
-                    print(f"   ✅ 함수 존재: {check['check']}")
-                else:
-                    print(f"   ❌ 함수 없음: {check['check']}")
+        if found is not None:
+            # 함수 존재 확인
+            if check['check'] in found:
+                print(f"   ✅ 함수 존재: {check['check']}")
+            else:
+                print(f"   ❌ 함수 없음: {check['check']}")
 
-                # 사용 확인
-                if check['usage'] in content:
-                    print(f"   ✅ 설정 사용 확인: {check['usage']}")
-                else:
-                    print(f"   ⚠️ 설정 미사용")
+            # 사용 확인
+            if check['usage'] in found:
+                print(f"   ✅ 설정 사용 확인: {check['usage']}")
+            else:
+                print(f"   ⚠️ 설정 미사용")
         else:
-            print(f"   ❌ 파일 없음: {file_path}")
+            print(f"   ❌ 파일 없음: {PROJECT_ROOT / check['file']}")
 
 def test_ui_integration():
     """UI 통합 확인"""
     print_section("4️⃣ UI 통합 확인")
 
-    import os
-
-    frontend_file = "/Users/cov4/bitThumb_std/frontend/src/components/TradingSettings.tsx"
+    frontend_file = PROJECT_ROOT / "frontend/src/components/TradingSettings.tsx"
 
-    if os.path.exists(frontend_file):
-        with open(frontend_file, 'r') as f:
-            content = f.read()
+    if frontend_file.is_file():
+        checks = [
+            ("순수익 상태", "useNetProfit"),
+            ("동적목표 상태", "useDynamicTarget"),
+            ("동적사이징 상태", "useDynamicSizing"),
+            ("순수익 토글", "Use Net Profit Calculation"),
+            ("동적목표 토글", "Use Dynamic Target"),
+            ("동적사이징 토글", "Use Dynamic Sizing"),
+        ]
 
-            checks = [
-                ("순수익 상태", "useNetProfit"),
-                ("동적목표 상태", "useDynamicTarget"),
-                ("동적사이징 상태", "useDynamicSizing"),
-                ("순수익 토글", "Use Net Profit Calculation"),
-                ("동적목표 토글", "Use Dynamic Target"),
-                ("동적사이징 토글", "Use Dynamic Sizing"),
-            ]
+        found = find_markers(frontend_file, [keyword for _, keyword in checks])
 
-            for name, keyword in checks:
-                if keyword in content:
-                    print(f"   ✅ {name}: {keyword}")
-                else:
-                    print(f"   ❌ {name} 누락")
+        for name, keyword in checks:
+            if keyword in found:
+                print(f"   ✅ {name}: {keyword}")
+            else:
+                print(f"   ❌ {name} 누락")
     else:
         print(f"   ❌ UI 파일 없음")
 
@@ -3,160 +3,153 @@
 동적 티커 관리 테스트 (누적 + 즉시 제거)
 """
 
+import logging
 import sys
 import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
-from core.trading_bot import TradingBot
+# TradingBot(pandas/sklearn/거래소 클라이언트 포함)은 봇을 실제로 만들 때만 import
+# → 모듈 로드/테스트 수집만 할 때는 무거운 의존성 import 비용 없음
+if TYPE_CHECKING:
+    from core.trading_bot import TradingBot
+
+# 시나리오는 누적 상태를 이어받으므로 순서대로 같은 봇에 적용
+# (제목, scan_index, 추천 Top 5 [(ticker, score, confidence, rsi)], 추가 설명, 적용 전 보유 포지션,
+#  기대 결과 {'present': 감시 목록에 있어야 할 티커, 'removed': 자동 제거 시 빠져야 할 티커})
+SCENARIOS = [
+    (
+        "시나리오 1: 범위 0-50 스캔 - Top 5 추가",
+        50,
+        [('BTC', 95.0, 0.85, 65.0), ('ETH', 90.0, 0.80, 60.0), ('XRP', 85.0, 0.75, 55.0),
+         ('ADA', 80.0, 0.70, 50.0), ('SOL', 75.0, 0.65, 45.0)],
+        None,
+        None,
+        {'present': ('BTC', 'ETH', 'XRP', 'ADA', 'SOL'), 'removed': ()},
+    ),
+    (
+        "시나리오 2: 범위 50-100 스캔 - Top 5 추가 (누적됨)",
+        100,
+        [('CTC', 92.0, 0.82, 62.0), ('MATIC', 88.0, 0.78, 58.0), ('AVAX', 83.0, 0.73, 53.0),
+         ('DOT', 78.0, 0.68, 48.0), ('LINK', 74.0, 0.64, 44.0)],
+        "이전 범위(0-50) 코인들도 유지됨",
+        None,
+        {'present': ('BTC', 'XRP', 'CTC', 'MATIC', 'AVAX', 'DOT', 'LINK'), 'removed': ()},
+    ),
+    (
+        "시나리오 3: 범위 100-150 스캔 - Top 5 추가 (계속 누적)",
+        150,
+        [('UNI', 90.0, 0.80, 60.0), ('ATOM', 85.0, 0.75, 55.0), ('SAND', 80.0, 0.70, 50.0),
+         ('MANA', 75.0, 0.65, 45.0), ('AXS', 70.0, 0.60, 40.0)],
+        "모든 범위의 Top 5가 누적됨",
+        None,
+        {'present': ('BTC', 'CTC', 'UNI', 'ATOM', 'SAND', 'MANA', 'AXS'), 'removed': ()},
+    ),
+    (
+        "시나리오 4: 범위 0-50 재스캔 - XRP 이탈 → 즉시 제거",
+        50,
+        [('BTC', 95.0, 0.85, 65.0), ('ETH', 90.0, 0.80, 60.0), ('ADA', 85.0, 0.75, 55.0),
+         ('SOL', 80.0, 0.70, 50.0), ('DOGE', 75.0, 0.65, 45.0)],  # DOGE 신규
+        "XRP 제거됨, DOGE 추가됨",
+        None,
+        {'present': ('DOGE', 'CTC'), 'removed': ('XRP',)},
+    ),
+    (
+        "시나리오 5: 범위 50-100 재스캔 - CTC, MATIC 이탈 → 즉시 제거",
+        100,
+        [('AVAX', 90.0, 0.80, 60.0), ('DOT', 85.0, 0.75, 55.0), ('LINK', 80.0, 0.70, 50.0),
+         ('ALGO', 75.0, 0.65, 45.0), ('XTZ', 70.0, 0.60, 40.0)],  # ALGO, XTZ 신규
+        "CTC, MATIC 제거됨, ALGO, XTZ 추가됨",
+        None,
+        {'present': ('ALGO', 'XTZ', 'UNI'), 'removed': ('CTC', 'MATIC')},
+    ),
+    (
+        "시나리오 6: ETH에 포지션 추가 후 이탈 → 제거 방지",
+        50,
+        [('BTC', 95.0, 0.85, 65.0), ('ADA', 90.0, 0.80, 60.0), ('SOL', 85.0, 0.75, 55.0),
+         ('DOGE', 80.0, 0.70, 50.0), ('SHIB', 75.0, 0.65, 45.0)],  # SHIB 신규
+        "ETH는 포지션이 있어서 제거되지 않음",
+        ('ETH', {'entry_price': 3000, 'amount': 0.1, 'entry_time': '2026-02-04 10:00:00'}),
+        {'present': ('ETH', 'SHIB'), 'removed': ()},
+    ),
+]
+
+
+@lru_cache(maxsize=None)
+def get_test_bot() -> "TradingBot":
+    """
+    테스트용 TradingBot (프로세스당 1회 생성)
+
+    생성 시 거래소 클라이언트/모델/DB를 초기화하므로 비용이 큼 → 같은 프로세스에서 재사용
+    """
+    from core.trading_bot import TradingBot
 
-def test_dynamic_ticker_management():
-    """동적 티커 관리 로직 테스트 (누적 방식)"""
-    print("=" * 80)
-    print("🧪 Dynamic Ticker Management Test (Cumulative + Immediate Removal)")
-    print("=" * 80)
-
-    # TradingBot 인스턴스 생성
     bot = TradingBot()
-
-    # 초기 상태
-    print(f"\n📊 Initial State:")
-    print(f"   Tickers: {bot.tickers}")
-    print(f"   Origin Ranges: {bot.ticker_origin_range}")
-
-    # 시나리오 1: 범위 0-50 스캔 - BTC, ETH, XRP, ADA, SOL 추가
-    print("\n" + "=" * 80)
-    print("시나리오 1: 범위 0-50 스캔 - Top 5 추가")
-    print("=" * 80)
-
-    bot.coin_selector.scan_index = 50
     bot.coin_selector.batch_size = 50
+    return bot
 
-    mock_recs_1 = [
-        {'ticker': 'BTC', 'score': 95.0, 'confidence': 0.85, 'features': {'rsi': 65.0}},
-        {'ticker': 'ETH', 'score': 90.0, 'confidence': 0.80, 'features': {'rsi': 60.0}},
-        {'ticker': 'XRP', 'score': 85.0, 'confidence': 0.75, 'features': {'rsi': 55.0}},
-        {'ticker': 'ADA', 'score': 80.0, 'confidence': 0.70, 'features': {'rsi': 50.0}},
-        {'ticker': 'SOL', 'score': 75.0, 'confidence': 0.65, 'features': {'rsi': 45.0}},
-    ]
-
-    bot._manage_tickers_dynamically(mock_recs_1)
-    print(f"\n📊 After Update:")
-    print(f"   Tickers: {bot.tickers}")
-    print(f"   Total Watch List: {len(bot.tickers)} coins")
-
-    # 시나리오 2: 범위 50-100 스캔 - CTC, MATIC, AVAX, DOT, LINK 추가 (누적)
-    print("\n" + "=" * 80)
-    print("시나리오 2: 범위 50-100 스캔 - Top 5 추가 (누적됨)")
-    print("=" * 80)
-
-    bot.coin_selector.scan_index = 100
 
-    mock_recs_2 = [
-        {'ticker': 'CTC', 'score': 92.0, 'confidence': 0.82, 'features': {'rsi': 62.0}},
-        {'ticker': 'MATIC', 'score': 88.0, 'confidence': 0.78, 'features': {'rsi': 58.0}},
-        {'ticker': 'AVAX', 'score': 83.0, 'confidence': 0.73, 'features': {'rsi': 53.0}},
-        {'ticker': 'DOT', 'score': 78.0, 'confidence': 0.68, 'features': {'rsi': 48.0}},
-        {'ticker': 'LINK', 'score': 74.0, 'confidence': 0.64, 'features': {'rsi': 44.0}},
-    ]
+def run_scenario(bot: "TradingBot", title, scan_index, recs, note=None, position=None, expect=None):
+    """
+    시나리오 1개 적용 후 기대 결과 검증
 
-    bot._manage_tickers_dynamically(mock_recs_2)
-    print(f"\n📊 After Update:")
-    print(f"   Tickers: {bot.tickers}")
-    print(f"   Total Watch List: {len(bot.tickers)} coins")
-    print(f"   ℹ️ 이전 범위(0-50) 코인들도 유지됨")
+    출력은 줄 단위로 모아 시나리오당 한 번만 기록 (pytest 실행 중에는 출력 생략, assert로만 검증)
+    """
+    lines = ["", "=" * 80, title, "=" * 80]
 
-    # 시나리오 3: 범위 100-150 스캔 - 또 다른 5개 추가 (계속 누적)
-    print("\n" + "=" * 80)
-    print("시나리오 3: 범위 100-150 스캔 - Top 5 추가 (계속 누적)")
-    print("=" * 80)
+    if position:
+        ticker, info = position
+        bot._set_position(ticker, info)  # 포지션은 Copy-on-Write 경로로만 변경
+        lines.append(f"   ✅ Added {ticker} position: {bot.positions[ticker]}")
 
-    bot.coin_selector.scan_index = 150
+    bot.coin_selector.scan_index = scan_index
 
-    mock_recs_3 = [
-        {'ticker': 'UNI', 'score': 90.0, 'confidence': 0.80, 'features': {'rsi': 60.0}},
-        {'ticker': 'ATOM', 'score': 85.0, 'confidence': 0.75, 'features': {'rsi': 55.0}},
-        {'ticker': 'SAND', 'score': 80.0, 'confidence': 0.70, 'features': {'rsi': 50.0}},
-        {'ticker': 'MANA', 'score': 75.0, 'confidence': 0.65, 'features': {'rsi': 45.0}},
-        {'ticker': 'AXS', 'score': 70.0, 'confidence': 0.60, 'features': {'rsi': 40.0}},
+    mock_recs = [
+        {'ticker': ticker, 'score': score, 'confidence': confidence, 'features': {'rsi': rsi}}
+        for ticker, score, confidence, rsi in recs
     ]
 
-    bot._manage_tickers_dynamically(mock_recs_3)
-    print(f"\n📊 After Update:")
-    print(f"   Tickers: {bot.tickers}")
-    print(f"   Total Watch List: {len(bot.tickers)} coins")
-    print(f"   ℹ️ 모든 범위의 Top 5가 누적됨")
-
-    # 시나리오 4: 범위 0-50 재스캔 - XRP 이탈 (즉시 제거)
-    print("\n" + "=" * 80)
-    print("시나리오 4: 범위 0-50 재스캔 - XRP 이탈 → 즉시 제거")
-    print("=" * 80)
-
-    bot.coin_selector.scan_index = 50
+    bot._manage_tickers_dynamically(mock_recs)
+    tickers = bot.tickers
 
-    mock_recs_4 = [
-        {'ticker': 'BTC', 'score': 95.0, 'confidence': 0.85, 'features': {'rsi': 65.0}},
-        {'ticker': 'ETH', 'score': 90.0, 'confidence': 0.80, 'features': {'rsi': 60.0}},
-        {'ticker': 'ADA', 'score': 85.0, 'confidence': 0.75, 'features': {'rsi': 55.0}},
-        {'ticker': 'SOL', 'score': 80.0, 'confidence': 0.70, 'features': {'rsi': 50.0}},
-        {'ticker': 'DOGE', 'score': 75.0, 'confidence': 0.65, 'features': {'rsi': 45.0}},  # 신규
+    lines += [
+        "",
+        "📊 After Update:",
+        f"   Tickers: {tickers}",
+        f"   Total Watch List: {len(tickers)} coins",
     ]
+    if note:
+        lines.append(f"   ℹ️ {note}")
 
-    bot._manage_tickers_dynamically(mock_recs_4)
-    print(f"\n📊 After Update:")
-    print(f"   Tickers: {bot.tickers}")
-    print(f"   Total Watch List: {len(bot.tickers)} coins")
-    print(f"   ℹ️ XRP 제거됨, DOGE 추가됨")
-
-    # 시나리오 5: 범위 50-100 재스캔 - CTC, MATIC 이탈 (즉시 제거)
-    print("\n" + "=" * 80)
-    print("시나리오 5: 범위 50-100 재스캔 - CTC, MATIC 이탈 → 즉시 제거")
-    print("=" * 80)
-
-    bot.coin_selector.scan_index = 100
+    if not os.environ.get("PYTEST_CURRENT_TEST"):
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    mock_recs_5 = [
-        {'ticker': 'AVAX', 'score': 90.0, 'confidence': 0.80, 'features': {'rsi': 60.0}},
-        {'ticker': 'DOT', 'score': 85.0, 'confidence': 0.75, 'features': {'rsi': 55.0}},
-        {'ticker': 'LINK', 'score': 80.0, 'confidence': 0.70, 'features': {'rsi': 50.0}},
-        {'ticker': 'ALGO', 'score': 75.0, 'confidence': 0.65, 'features': {'rsi': 45.0}},  # 신규
-        {'ticker': 'XTZ', 'score': 70.0, 'confidence': 0.60, 'features': {'rsi': 40.0}},  # 신규
-    ]
+    if expect:
+        missing = set(expect['present']) - set(tickers)
+        assert not missing, f"{title}: 감시 목록에 없음 {sorted(missing)}"
+        if bot.auto_remove_from_watchlist:
+            leftover = set(expect['removed']) & set(tickers)
+            assert not leftover, f"{title}: 제거되지 않음 {sorted(leftover)}"
 
-    bot._manage_tickers_dynamically(mock_recs_5)
-    print(f"\n📊 After Update:")
-    print(f"   Tickers: {bot.tickers}")
-    print(f"   Total Watch List: {len(bot.tickers)} coins")
-    print(f"   ℹ️ CTC, MATIC 제거됨, ALGO, XTZ 추가됨")
 
-    # 시나리오 6: ETH에 포지션 추가 후 이탈 (제거 방지)
-    print("\n" + "=" * 80)
-    print("시나리오 6: ETH에 포지션 추가 후 이탈 → 제거 방지")
+def test_dynamic_ticker_management():
+    """동적 티커 관리 로직 테스트 (누적 방식)"""
+    print("=" * 80)
+    print("🧪 Dynamic Ticker Management Test (Cumulative + Immediate Removal)")
     print("=" * 80)
 
-    bot.positions['ETH'] = {
-        'entry_price': 3000,
-        'amount': 0.1,
-        'entry_time': '2026-02-04 10:00:00'
-    }
-    print(f"   ✅ Added ETH position: {bot.positions['ETH']}")
-
-    bot.coin_selector.scan_index = 50
-
-    mock_recs_6 = [
-        {'ticker': 'BTC', 'score': 95.0, 'confidence': 0.85, 'features': {'rsi': 65.0}},
-        {'ticker': 'ADA', 'score': 90.0, 'confidence': 0.80, 'features': {'rsi': 60.0}},
-        {'ticker': 'SOL', 'score': 85.0, 'confidence': 0.75, 'features': {'rsi': 55.0}},
-        {'ticker': 'DOGE', 'score': 80.0, 'confidence': 0.70, 'features': {'rsi': 50.0}},
-        {'ticker': 'SHIB', 'score': 75.0, 'confidence': 0.65, 'features': {'rsi': 45.0}},  # 신규
-    ]
+    bot = get_test_bot()
 
-    bot._manage_tickers_dynamically(mock_recs_6)
-    print(f"\n📊 After Update:")
+    # 초기 상태
+    print(f"\n📊 Initial State:")
     print(f"   Tickers: {bot.tickers}")
-    print(f"   Total Watch List: {len(bot.tickers)} coins")
-    print(f"   ℹ️ ETH는 포지션이 있어서 제거되지 않음")
+    print(f"   Origin Ranges: {bot.ticker_origin_range}")
+
+    for scenario in SCENARIOS:
+        run_scenario(bot, *scenario)
 
     # 최종 결과
     print("\n" + "=" * 80)
@@ -169,4 +162,8 @@ def test_dynamic_ticker_management():
     print("\n💡 감시 대상은 계속 누적되며, 모든 코인을 실시간으로 분석합니다!")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     test_dynamic_ticker_management()
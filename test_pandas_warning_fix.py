@@ -5,8 +5,10 @@ Pandas SettingWithCopyWarning 수정 검증
 fillna() 경고가 수정되었는지 확인합니다.
 """
 
+import logging
 import warnings
 import sys
+from contextlib import contextmanager
 import os
 import pandas as pd
 import numpy as np
@@ -14,15 +16,53 @@ import numpy as np
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, '/Users/cov4/bitThumb_std/backend')
 
+# 테스트 특징 (이름, 최솟값, 최댓값, 정수 여부) - 정수 특징은 [최솟값, 최댓값) 범위
+FEATURE_SPECS = (
+    ('rsi', 30, 70, False),
+    ('macd', -1, 1, False),
+    ('macd_signal', -1, 1, False),
+    ('bb_position', 0, 1, False),
+    ('volume_ratio', 0.5, 2, False),
+    ('price_change_5m', -0.02, 0.02, False),
+    ('price_change_15m', -0.05, 0.05, False),
+    ('ema_9', 10000, 50000, False),
+    ('ema_21', 10000, 50000, False),
+    ('atr', 100, 1000, False),
+    ('hour_of_day', 0, 24, True),
+    ('day_of_week', 0, 7, True),
+    ('rsi_change', -5, 5, False),
+    ('volume_trend', -0.3, 0.3, False),
+    ('rsi_prev_5m', 30, 70, False),
+    ('bb_position_prev_5m', 0, 1, False),
+)
+FEATURE_COLUMNS = tuple(name for name, _, _, _ in FEATURE_SPECS)
+FEATURE_LOW = np.array([low for _, low, _, _ in FEATURE_SPECS], dtype=np.float64)
+FEATURE_HIGH = np.array([high for _, _, high, _ in FEATURE_SPECS], dtype=np.float64)
+FEATURE_INT_MASK = np.array([is_int for _, _, _, is_int in FEATURE_SPECS])
+# 경고(fillna) 검증만이 목적이므로 최소 크기로 학습:
+# 30개 미만이면 IsolationForest를 건너뛰고, 클래스당 4개면 stratify 분할(테스트 3개)이 가능
+# (NaN 주입 행 0/5/10을 포함해야 하므로 11 이상 유지)
+N_SAMPLES = 12
+
+# 예측 테스트 입력 (FEATURE_COLUMNS 순서)
+PREDICT_SAMPLE = np.array([[
+    35.0, 0.5, 0.3, 0.2, 1.2, 0.01, 0.02, 25000, 24500, 500,
+    14, 2, 2.5, 0.1, 32.5, 0.25,
+]], dtype=np.float64)
+
+@contextmanager
+def setting_with_copy_as_error():
+    """블록 안에서만 SettingWithCopyWarning을 에러로 변환 (블록을 벗어나면 필터 원복)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', pd.errors.SettingWithCopyWarning)
+        yield
+
 def test_model_learning():
     """모델 학습 시 경고 확인"""
     print("=" * 60)
     print("  📊 모델 학습 테스트 (Pandas 경고 확인)")
     print("=" * 60)
 
-    # Pandas 경고를 에러로 변환 (경고 발생 시 즉시 중단)
-    warnings.filterwarnings('error', category=pd.errors.SettingWithCopyWarning)
-
     try:
         from core.data_manager import TradeMemory, ModelLearner
 
@@ -36,63 +76,36 @@ def test_model_learning():
 
         print("\n3️⃣ 학습 데이터 생성 (테스트용)...")
         # 테스트 데이터 생성
-        X = pd.DataFrame({
-            'rsi': np.random.uniform(30, 70, 50),
-            'macd': np.random.uniform(-1, 1, 50),
-            'macd_signal': np.random.uniform(-1, 1, 50),
-            'bb_position': np.random.uniform(0, 1, 50),
-            'volume_ratio': np.random.uniform(0.5, 2, 50),
-            'price_change_5m': np.random.uniform(-0.02, 0.02, 50),
-            'price_change_15m': np.random.uniform(-0.05, 0.05, 50),
-            'ema_9': np.random.uniform(10000, 50000, 50),
-            'ema_21': np.random.uniform(10000, 50000, 50),
-            'atr': np.random.uniform(100, 1000, 50),
-            'hour_of_day': np.random.randint(0, 24, 50),
-            'day_of_week': np.random.randint(0, 7, 50),
-            'rsi_change': np.random.uniform(-5, 5, 50),
-            'volume_trend': np.random.uniform(-0.3, 0.3, 50),
-            'rsi_prev_5m': np.random.uniform(30, 70, 50),
-            'bb_position_prev_5m': np.random.uniform(0, 1, 50),
-        })
+        # 한 번의 (샘플 × 특징) 난수 배열을 열별 범위로 스케일링 (열마다 따로 생성/삽입하지 않음)
+        rng = np.random.default_rng(0)
+        data = FEATURE_LOW + rng.random((N_SAMPLES, len(FEATURE_COLUMNS))) * (FEATURE_HIGH - FEATURE_LOW)
+        data[:, FEATURE_INT_MASK] = np.floor(data[:, FEATURE_INT_MASK])  # hour_of_day, day_of_week
+        X = pd.DataFrame(data, columns=FEATURE_COLUMNS, copy=False)
 
         # 일부 NaN 값 추가 (fillna 테스트용)
         X.iloc[0, 0] = np.nan
         X.iloc[5, 3] = np.nan
         X.iloc[10, 7] = np.nan
 
-        y = pd.Series(np.random.choice([0, 1, 2], 50))
+        y = pd.Series(np.arange(N_SAMPLES) % 3)  # 0, 1, 2 반복 (클래스별 동일 개수)
 
         print(f"   ✅ 데이터 생성: {len(X)}개 샘플, {len(X.columns)}개 특징")
         print(f"   ℹ️  NaN 개수: {X.isna().sum().sum()}개")
 
         print("\n4️⃣ 모델 학습 실행 (경고 감지 중)...")
-        learner.train_initial_model(X, y)
+        with setting_with_copy_as_error():
+            learner.train_initial_model(X, y)
         print("   ✅ 학습 완료 - 경고 없음!")
 
         print("\n5️⃣ 예측 테스트 (경고 감지 중)...")
-        test_features = pd.DataFrame([{
-            'rsi': 35.0,
-            'macd': 0.5,
-            'macd_signal': 0.3,
-            'bb_position': 0.2,
-            'volume_ratio': 1.2,
-            'price_change_5m': 0.01,
-            'price_change_15m': 0.02,
-            'ema_9': 25000,
-            'ema_21': 24500,
-            'atr': 500,
-            'hour_of_day': 14,
-            'day_of_week': 2,
-            'rsi_change': 2.5,
-            'volume_trend': 0.1,
-            'rsi_prev_5m': 32.5,
-            'bb_position_prev_5m': 0.25,
-        }])
+        # 학습 데이터와 같은 열 순서/dtype의 1행 배열 (dict 해싱/dtype 추론 없음)
+        test_features = pd.DataFrame(PREDICT_SAMPLE.copy(), columns=X.columns, copy=False)
 
         # 일부 NaN 추가 (fillna 테스트)
         test_features.iloc[0, 1] = np.nan
 
-        prediction, confidence = learner.predict(test_features)
+        with setting_with_copy_as_error():
+            prediction, confidence = learner.predict(test_features)
         print(f"   ✅ 예측 완료 - 경고 없음!")
         print(f"   📊 결과: Class {prediction}, 확신도 {confidence:.2%}")
 
@@ -115,6 +128,11 @@ def test_model_learning():
         return False
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     print("""
 ╔══════════════════════════════════════════════════════════╗
 ║                                                          ║